@@ -0,0 +1,55 @@
+"""add_pagination_indexes
+
+Revision ID: 3f1c2a7d9e4b
+Revises: acbb809ca800
+Create Date: 2026-10-16 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a7d9e4b"
+down_revision: Union[str, None] = "acbb809ca800"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP AT TIME ZONE 'UTC')"),
+            nullable=False,
+            comment="Дата создания транзакции.",
+        ),
+    )
+    op.create_index(
+        "transactions_user_id_created_at_id_idx",
+        "transactions",
+        ["user_id", "created_at", "id"],
+    )
+    op.create_index(
+        "transactions_account_id_created_at_id_idx",
+        "transactions",
+        ["account_id", "created_at", "id"],
+    )
+    op.create_index("accounts_user_id_id_idx", "accounts", ["user_id", "id"])
+    op.create_index("users_created_at_id_idx", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("users_created_at_id_idx", table_name="users")
+    op.drop_index("accounts_user_id_id_idx", table_name="accounts")
+    op.drop_index(
+        "transactions_account_id_created_at_id_idx",
+        table_name="transactions",
+    )
+    op.drop_index("transactions_user_id_created_at_id_idx", table_name="transactions")
+    op.drop_column("transactions", "created_at")
@@ -0,0 +1,38 @@
+"""add_users_token_version
+
+Revision ID: 7b2e9c4a1d05
+Revises: 3f1c2a7d9e4b
+Create Date: 2026-10-16 10:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e9c4a1d05"
+down_revision: Union[str, None] = "3f1c2a7d9e4b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "token_version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment=(
+                "Версия токенов пользователя. Токены с другой версией недействительны."
+            ),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "token_version")
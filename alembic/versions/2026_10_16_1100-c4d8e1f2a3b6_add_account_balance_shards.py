@@ -0,0 +1,72 @@
+"""add_account_balance_shards
+
+Revision ID: c4d8e1f2a3b6
+Revises: 7b2e9c4a1d05
+Create Date: 2026-10-16 11:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8e1f2a3b6"
+down_revision: Union[str, None] = "7b2e9c4a1d05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "accounts",
+        sa.Column(
+            "is_hot",
+            sa.Boolean(),
+            server_default="false",
+            nullable=False,
+            comment=(
+                "Распределяются ли изменения баланса аккаунта "
+                "между частями `account_balance_shards`."
+            ),
+        ),
+    )
+    op.create_table(
+        "account_balance_shards",
+        sa.Column(
+            "account_id",
+            sa.UUID(),
+            nullable=False,
+            comment="Идентификатор аккаунта.",
+        ),
+        sa.Column(
+            "shard",
+            sa.Integer(),
+            nullable=False,
+            comment="Номер части баланса.",
+        ),
+        sa.Column(
+            "balance",
+            sa.Integer(),
+            nullable=False,
+            comment="Часть баланса аккаунта, еще не перенесенная в аккаунт.",
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+            name=op.f("account_balance_shards_account_id_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "account_id",
+            "shard",
+            name=op.f("account_balance_shards_pkey"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_balance_shards")
+    op.drop_column("accounts", "is_hot")
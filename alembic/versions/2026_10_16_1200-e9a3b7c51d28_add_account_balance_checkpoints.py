@@ -0,0 +1,105 @@
+"""add_account_balance_checkpoints
+
+Revision ID: e9a3b7c51d28
+Revises: c4d8e1f2a3b6
+Create Date: 2026-10-16 12:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e9a3b7c51d28"
+down_revision: Union[str, None] = "c4d8e1f2a3b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "seq",
+            sa.BigInteger(),
+            sa.Identity(always=False),
+            nullable=False,
+            comment="Монотонно возрастающий номер транзакции.",
+        ),
+    )
+    op.create_unique_constraint(
+        op.f("transactions_seq_key"),
+        "transactions",
+        ["seq"],
+    )
+    op.create_table(
+        "account_balance_checkpoints",
+        sa.Column(
+            "account_id",
+            sa.UUID(),
+            nullable=False,
+            comment="Идентификатор аккаунта.",
+        ),
+        sa.Column(
+            "seq",
+            sa.BigInteger(),
+            nullable=False,
+            comment="Последний номер транзакции, учтенный в точке.",
+        ),
+        sa.Column(
+            "balance",
+            sa.Integer(),
+            nullable=False,
+            comment="Сумма транзакций аккаунта с номером не больше `seq`.",
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="Наибольшая дата создания транзакции, учтенной в точке.",
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+            name=op.f("account_balance_checkpoints_account_id_fkey"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "account_id",
+            "seq",
+            name=op.f("account_balance_checkpoints_pkey"),
+        ),
+    )
+    op.create_index(
+        "account_balance_checkpoints_account_id_created_at_idx",
+        "account_balance_checkpoints",
+        ["account_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "account_balance_checkpoints_seq_idx",
+        "account_balance_checkpoints",
+        ["seq"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "account_balance_checkpoints_seq_idx",
+        table_name="account_balance_checkpoints",
+    )
+    op.drop_index(
+        "account_balance_checkpoints_account_id_created_at_idx",
+        table_name="account_balance_checkpoints",
+    )
+    op.drop_table("account_balance_checkpoints")
+    op.drop_constraint(
+        op.f("transactions_seq_key"),
+        "transactions",
+        type_="unique",
+    )
+    op.drop_column("transactions", "seq")
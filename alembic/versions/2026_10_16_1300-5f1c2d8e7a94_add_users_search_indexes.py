@@ -0,0 +1,56 @@
+"""add_users_search_indexes
+
+Revision ID: 5f1c2d8e7a94
+Revises: e9a3b7c51d28
+Create Date: 2026-10-16 13:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f1c2d8e7a94"
+down_revision: Union[str, None] = "e9a3b7c51d28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "users_email_trgm_idx",
+        "users",
+        [sa.text("lower(email) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "users_full_name_trgm_idx",
+        "users",
+        [sa.text("lower(full_name) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "users_email_lower_idx",
+        "users",
+        [sa.text("lower(email) text_pattern_ops")],
+        unique=False,
+    )
+    op.create_index(
+        "users_full_name_lower_idx",
+        "users",
+        [sa.text("lower(full_name) text_pattern_ops")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("users_full_name_lower_idx", table_name="users")
+    op.drop_index("users_email_lower_idx", table_name="users")
+    op.drop_index("users_full_name_trgm_idx", table_name="users")
+    op.drop_index("users_email_trgm_idx", table_name="users")
@@ -1,3 +1,11 @@
+from src.accounts.models.account_balance_checkpoint_model import (
+    AccountBalanceCheckpointModel,
+)
+from src.accounts.models.account_balance_shard_model import AccountBalanceShardModel
 from src.accounts.models.account_model import AccountModel
 
-__all__ = ("AccountModel",)
+__all__ = (
+    "AccountBalanceCheckpointModel",
+    "AccountBalanceShardModel",
+    "AccountModel",
+)
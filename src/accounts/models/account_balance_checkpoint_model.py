@@ -0,0 +1,48 @@
+"""Модуль для SQLAlchemy моделей контрольных точек баланса аккаунтов."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, UUID, BigInteger, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+
+class AccountBalanceCheckpointModel(Base):
+    """
+    Модель контрольной точки баланса аккаунта.
+
+    Хранит сумму транзакций аккаунта с `seq` не больше `seq` точки,
+    поэтому баланс на момент времени вычисляется от ближайшей
+    точки, а не по всей истории транзакций.
+    """
+
+    __tablename__ = "account_balance_checkpoints"
+    __table_args__ = (
+        Index(
+            "account_balance_checkpoints_account_id_created_at_idx",
+            "account_id",
+            "created_at",
+        ),
+        Index("account_balance_checkpoints_seq_idx", "seq"),
+    )
+
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Идентификатор аккаунта.",
+    )
+    seq: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        comment="Последний номер транзакции, учтенный в точке.",
+    )
+    balance: Mapped[int] = mapped_column(
+        comment="Сумма транзакций аккаунта с номером не больше `seq`.",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        comment="Наибольшая дата создания транзакции, учтенной в точке.",
+    )
@@ -0,0 +1,36 @@
+"""Модуль для SQLAlchemy моделей частей баланса аккаунтов."""
+
+import uuid
+
+from sqlalchemy import UUID, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+
+class AccountBalanceShardModel(Base):
+    """
+    Модель части баланса аккаунта.
+
+    Изменения баланса часто изменяемого аккаунта распределяются
+    между несколькими частями, чтобы параллельные транзакции
+    не ожидали блокировку одной строки аккаунта. Баланс аккаунта
+    равен сумме `accounts.balance` и его частей.
+    """
+
+    __tablename__ = "account_balance_shards"
+
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Идентификатор аккаунта.",
+    )
+    shard: Mapped[int] = mapped_column(
+        primary_key=True,
+        comment="Номер части баланса.",
+    )
+    balance: Mapped[int] = mapped_column(
+        default=0,
+        comment="Часть баланса аккаунта, еще не перенесенная в аккаунт.",
+    )
@@ -2,9 +2,10 @@
 
 import uuid
 
-from sqlalchemy import UUID, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import UUID, ForeignKey, Index, func, select
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
+from src.accounts.models.account_balance_shard_model import AccountBalanceShardModel
 from src.database import Base
 from src.transactions.models import TransactionModel
 
@@ -13,6 +14,7 @@ class AccountModel(Base):
     """Модель аккаунта."""
 
     __tablename__ = "accounts"
+    __table_args__ = (Index("accounts_user_id_id_idx", "user_id", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -29,6 +31,23 @@ class AccountModel(Base):
         ForeignKey("users.id"),
         comment="Идентификатор пользователя.",
     )
+    is_hot: Mapped[bool] = mapped_column(
+        default=False,
+        server_default="false",
+        comment=(
+            "Распределяются ли изменения баланса аккаунта "
+            "между частями `account_balance_shards`."
+        ),
+    )
+
+    # Баланс аккаунта с учетом еще не перенесенных частей
+    total_balance: Mapped[int] = column_property(
+        balance
+        + select(func.coalesce(func.sum(AccountBalanceShardModel.balance), 0))
+        .where(AccountBalanceShardModel.account_id == id)
+        .correlate_except(AccountBalanceShardModel)
+        .scalar_subquery()
+    )
 
     user: Mapped["UserModel"] = relationship(
         back_populates="accounts",
@@ -36,5 +55,5 @@ class AccountModel(Base):
     )
     transactions: Mapped[list[TransactionModel]] = relationship(
         back_populates="account",
-        lazy="joined",
+        lazy="raise",
     )
@@ -1,8 +1,31 @@
 """Модуль для репозиториев аккаунтов."""
 
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    bindparam,
+    delete,
+    func,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
 import src.accounts.schemas as account_schemas
-from src.accounts.models import AccountModel
+from src import constants
+from src.accounts.models import (
+    AccountBalanceCheckpointModel,
+    AccountBalanceShardModel,
+    AccountModel,
+)
 from src.base_repository import BaseRepository
+from src.transactions.models import TransactionModel
 
 
 class AccountRepository(
@@ -18,3 +41,387 @@ class AccountRepository(
     """
 
     model = AccountModel
+
+    @classmethod
+    def get_upsert_balance_stmt(
+        cls,
+        id: uuid.UUID,
+        user_id: uuid.UUID,
+        amount: int,
+    ) -> Insert:
+        """
+        Создать выражение, которое создает аккаунт с балансом `amount`
+        или атомарно увеличивает баланс существующего аккаунта на `amount`.
+
+        Строка аккаунта блокируется до конца транзакции, поэтому
+        параллельные изменения баланса одного аккаунта не теряются.
+
+        Returns:
+            stmt: Выражение, возвращающее `id` и новый `balance` аккаунта.
+        """
+
+        stmt = insert(AccountModel).values(id=id, user_id=user_id, balance=amount)
+
+        return stmt.on_conflict_do_update(
+            index_elements=[AccountModel.id],
+            set_={"balance": AccountModel.balance + stmt.excluded.balance},
+        ).returning(AccountModel.id, AccountModel.balance)
+
+    @classmethod
+    async def increment_balance(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+        amount: int,
+    ) -> int | None:
+        """
+        Атомарно изменить баланс аккаунта на `amount`.
+
+        Returns:
+            balance: Новый баланс аккаунта или `None`, если аккаунт не найден.
+        """
+
+        stmt = (
+            update(AccountModel)
+            .where(AccountModel.id == id)
+            .values(balance=AccountModel.balance + amount)
+            .returning(AccountModel.balance)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def add_missing_bulk(
+        cls,
+        session: AsyncSession,
+        data: list[dict[str, Any]],
+    ) -> None:
+        """
+        Добавить в текущую сессию аккаунты, которых еще нет в БД.
+        Существующие аккаунты не изменяются.
+        """
+
+        await cls.add_bulk(session, data, on_conflict="nothing", returning=None)
+
+    @classmethod
+    async def increment_balances(
+        cls,
+        session: AsyncSession,
+        amounts: dict[uuid.UUID, int],
+    ) -> None:
+        """
+        Атомарно изменить балансы нескольких аккаунтов одним пакетом.
+
+        Аккаунты обновляются в порядке возрастания `id`, поэтому параллельные
+        пакеты блокируют строки в одном порядке и не приводят к взаимоблокировкам.
+        """
+
+        if not amounts:
+            return
+
+        table = AccountModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("account_id"))
+            .values(balance=table.c.balance + bindparam("amount"))
+        )
+        await session.execute(
+            stmt,
+            [
+                {"account_id": account_id, "amount": amount}
+                for account_id, amount in sorted(amounts.items())
+            ],
+        )
+
+    # MARK: Shards
+    @classmethod
+    def get_upsert_shard_balance_stmt(
+        cls,
+        id: uuid.UUID,
+        shard: int,
+        amount: int,
+    ) -> Insert:
+        """
+        Создать выражение, которое атомарно увеличивает часть `shard`
+        баланса аккаунта на `amount`, создавая ее при отсутствии.
+
+        Блокируется только строка части баланса, а не строка аккаунта.
+
+        Returns:
+            stmt: Выражение, возвращающее `id` аккаунта и новый баланс части.
+        """
+
+        table = AccountBalanceShardModel.__table__
+        stmt = insert(table).values(account_id=id, shard=shard, balance=amount)
+
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.account_id, table.c.shard],
+            set_={"balance": table.c.balance + stmt.excluded.balance},
+        ).returning(table.c.account_id.label("id"), table.c.balance)
+
+    @classmethod
+    async def increment_shard_balances(
+        cls,
+        session: AsyncSession,
+        amounts: dict[tuple[uuid.UUID, int], int],
+    ) -> None:
+        """
+        Атомарно изменить части балансов аккаунтов одним пакетом.
+
+        Части обновляются в порядке возрастания `(account_id, shard)`,
+        поэтому параллельные пакеты не приводят к взаимоблокировкам.
+        """
+
+        if not amounts:
+            return
+
+        table = AccountBalanceShardModel.__table__
+        stmt = insert(table).values(
+            account_id=bindparam("account_id"),
+            shard=bindparam("shard"),
+            balance=bindparam("amount"),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.account_id, table.c.shard],
+            set_={"balance": table.c.balance + stmt.excluded.balance},
+        )
+        await session.execute(
+            stmt,
+            [
+                {"account_id": account_id, "shard": shard, "amount": amount}
+                for (account_id, shard), amount in sorted(amounts.items())
+            ],
+        )
+
+    @classmethod
+    async def get_total_balance(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+    ) -> int | None:
+        """
+        Получить баланс аккаунта вместе с частями баланса.
+
+        Returns:
+            int | None: Баланс аккаунта или None, если аккаунт не найден.
+        """
+
+        return await session.scalar(
+            select(AccountModel.total_balance).where(AccountModel.id == id)
+        )
+
+    @classmethod
+    async def find_hot_ids(cls, session: AsyncSession) -> set[uuid.UUID]:
+        """
+        Получить `id` аккаунтов, баланс которых распределяется между частями.
+
+        Returns:
+            set[uuid.UUID]: `id` аккаунтов с `is_hot`.
+        """
+
+        result = await session.execute(
+            select(AccountModel.id).where(AccountModel.is_hot.is_(True))
+        )
+        return set(result.scalars().all())
+
+    @classmethod
+    async def set_hot(
+        cls,
+        session: AsyncSession,
+        ids: list[uuid.UUID],
+        is_hot: bool,
+    ) -> None:
+        """Изменить признак `is_hot` аккаунтов в текущей сессии."""
+
+        if not ids:
+            return
+
+        await session.execute(
+            update(AccountModel)
+            .where(AccountModel.id.in_(ids), AccountModel.is_hot.is_not(is_hot))
+            .values(is_hot=is_hot)
+        )
+
+    @classmethod
+    async def compact_balance_shards(cls, session: AsyncSession) -> set[uuid.UUID]:
+        """
+        Перенести части балансов в балансы аккаунтов в текущей сессии.
+
+        Сначала в порядке возрастания `id` блокируются строки аккаунтов,
+        у которых есть части, затем части удаляются, а их суммы
+        прибавляются к балансам аккаунтов. Блокировка `FOR NO KEY UPDATE`
+        не конфликтует с проверкой внешних ключей при вставке транзакций.
+
+        Returns:
+            set[uuid.UUID]: `id` аккаунтов, части балансов которых перенесены.
+        """
+
+        shards = AccountBalanceShardModel.__table__
+
+        await session.execute(
+            select(AccountModel.id)
+            .where(AccountModel.id.in_(select(shards.c.account_id).distinct()))
+            .order_by(AccountModel.id)
+            .with_for_update(key_share=True)
+        )
+
+        moved = delete(shards).returning(shards.c.account_id, shards.c.balance)
+        moved = moved.cte("moved_shards")
+        totals = (
+            select(moved.c.account_id, func.sum(moved.c.balance).label("amount"))
+            .group_by(moved.c.account_id)
+            .subquery("shard_totals")
+        )
+        table = AccountModel.__table__
+        result = await session.execute(
+            update(table)
+            .where(table.c.id == totals.c.account_id)
+            .values(balance=table.c.balance + totals.c.amount)
+            .returning(table.c.id)
+        )
+        return set(result.scalars().all())
+
+    # MARK: Checkpoints
+    @classmethod
+    async def add_balance_checkpoints(
+        cls,
+        session: AsyncSession,
+        lag_seconds: float,
+    ) -> int:
+        """
+        Создать контрольные точки балансов аккаунтов с новыми транзакциями
+        в текущей сессии.
+
+        Точки создаются для транзакций, добавленных после последней точки,
+        до номера последней транзакции, созданной раньше `2 * lag_seconds`
+        назад. Если транзакции выполняются не дольше `lag_seconds`, все
+        транзакции с меньшими номерами к этому моменту зафиксированы
+        и не будут пропущены. Точки создает только один процесс
+        одновременно.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            lag_seconds (float): Наибольшая длительность транзакции записи.
+
+        Returns:
+            int: Количество созданных точек.
+        """
+
+        checkpoints = AccountBalanceCheckpointModel.__table__
+        transactions = TransactionModel.__table__
+
+        is_locked = await session.scalar(
+            select(
+                func.pg_try_advisory_xact_lock(
+                    constants.ACCOUNT_BALANCE_CHECKPOINT_LOCK_ID
+                )
+            )
+        )
+        if not is_locked:
+            return 0
+
+        last_seq = await session.scalar(
+            select(func.coalesce(func.max(checkpoints.c.seq), 0))
+        )
+        seq = await session.scalar(
+            select(func.max(transactions.c.seq)).where(
+                transactions.c.seq > last_seq,
+                transactions.c.created_at
+                < func.now() - timedelta(seconds=2 * lag_seconds),
+            )
+        )
+        if seq is None:
+            return 0
+
+        delta = (
+            select(
+                transactions.c.account_id,
+                func.sum(transactions.c.amount).label("amount"),
+                func.max(transactions.c.created_at).label("created_at"),
+            )
+            .where(transactions.c.seq > last_seq, transactions.c.seq <= seq)
+            .group_by(transactions.c.account_id)
+            .subquery("delta")
+        )
+        previous = (
+            select(checkpoints.c.balance, checkpoints.c.created_at)
+            .where(checkpoints.c.account_id == delta.c.account_id)
+            .order_by(checkpoints.c.seq.desc())
+            .limit(1)
+            .lateral("previous")
+        )
+        stmt = (
+            insert(checkpoints)
+            .from_select(
+                ["account_id", "seq", "balance", "created_at"],
+                select(
+                    delta.c.account_id,
+                    literal(seq, BigInteger),
+                    func.coalesce(previous.c.balance, 0) + delta.c.amount,
+                    # greatest пропускает NULL, если предыдущей точки нет
+                    func.greatest(previous.c.created_at, delta.c.created_at),
+                ).select_from(delta.outerjoin(previous, true())),
+            )
+            .on_conflict_do_nothing()
+            .returning(checkpoints.c.account_id)
+        )
+        result = await session.execute(stmt)
+        return len(result.all())
+
+    @classmethod
+    async def get_balance_as_of(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+        as_of: datetime,
+        lag_seconds: float,
+    ) -> tuple[int, int | None]:
+        """
+        Получить сумму транзакций аккаунта, созданных не позже `as_of`.
+
+        Берется последняя точка, все транзакции которой созданы не позже
+        `as_of`, и к ее балансу прибавляются транзакции с большими номерами.
+        Транзакция с большим номером создана не раньше, чем за
+        `lag_seconds` до последней транзакции точки, поэтому просматриваются
+        только транзакции, созданные после этого момента.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (uuid.UUID): ID аккаунта.
+            as_of (datetime): Момент времени.
+            lag_seconds (float): Наибольшая длительность транзакции записи.
+
+        Returns:
+            (balance, checkpoint_seq): баланс и номер точки,
+                от которой он вычислен, или None, если точки нет.
+        """
+
+        checkpoints = AccountBalanceCheckpointModel.__table__
+        transactions = TransactionModel.__table__
+
+        result = await session.execute(
+            select(checkpoints.c.seq, checkpoints.c.balance, checkpoints.c.created_at)
+            .where(checkpoints.c.account_id == id, checkpoints.c.created_at <= as_of)
+            .order_by(checkpoints.c.created_at.desc(), checkpoints.c.seq.desc())
+            .limit(1)
+        )
+        checkpoint = result.one_or_none()
+
+        filters = [
+            transactions.c.account_id == id,
+            transactions.c.created_at <= as_of,
+        ]
+        if checkpoint is not None:
+            filters += [
+                transactions.c.seq > checkpoint.seq,
+                transactions.c.created_at
+                > checkpoint.created_at - timedelta(seconds=lag_seconds),
+            ]
+
+        delta = await session.scalar(
+            select(func.coalesce(func.sum(transactions.c.amount), 0)).where(*filters)
+        )
+
+        if checkpoint is None:
+            return delta, None
+        return checkpoint.balance + delta, checkpoint.seq
@@ -2,29 +2,100 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.accounts.schemas as account_schemas
-from src import dependencies
-from src.accounts.services import AccountService
-from src.users.models import UserModel
+import src.transactions.schemas as transaction_schemas
+import src.users.schemas as user_schemas
+from src import dependencies, utils
+from src.accounts.services import (
+    AccountService,
+    account_balance_checkpointer,
+    account_balance_sharding,
+)
+from src.schemas import ExportQuerySchema
+from src.transactions.services import TransactionService
 
 account_router = APIRouter(prefix="/accounts", tags=["accounts"])
 
 
 @account_router.get(path="")
 async def get_all_accounts_route(
-    session: AsyncSession = Depends(dependencies.get_session),
-    user: UserModel = Depends(dependencies.get_current_user),
-) -> list[account_schemas.AccountGetSchema]:
+    query_params: account_schemas.AccountsQuerySchema = Query(),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> account_schemas.AccountListReadSchema:
     """
-    Получить все аккаунты пользователя.
+    Получить аккаунты пользователя постранично.
 
     Доступно только авторизованному пользвоателю.
     """
 
-    return await AccountService.get_all_by_user_id(session, user_id=user.id)
+    return await AccountService.get_all_by_user_id(
+        session,
+        user_id=user.id,
+        query_params=query_params,
+    )
+
+
+@account_router.get(path="/export", response_class=StreamingResponse)
+async def export_accounts_route(
+    query_params: ExportQuerySchema = Query(),
+    session_factory: dependencies.SessionFactory = Depends(
+        dependencies.get_read_session_factory
+    ),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> StreamingResponse:
+    """
+    Выгрузить все аккаунты пользователя в формате NDJSON или CSV.
+
+    Доступно только авторизованному пользователю.
+    """
+
+    return utils.export_response(
+        AccountService.export_by_user_id(session_factory, user_id=user.id),
+        schema=account_schemas.AccountGetSchema,
+        format=query_params.format,
+        filename="accounts",
+    )
+
+
+@account_router.get(
+    path="/balance_shards/stats",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def get_account_balance_sharding_stats_route() -> (
+    account_schemas.AccountBalanceShardingStatsSchema
+):
+    """
+    Получить метрики распределения балансов аккаунтов между частями.
+
+    Доступно только администратору.
+    """
+
+    return account_schemas.AccountBalanceShardingStatsSchema(
+        **account_balance_sharding.get_stats()
+    )
+
+
+@account_router.get(
+    path="/balance_checkpoints/stats",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def get_account_balance_checkpoint_stats_route() -> (
+    account_schemas.AccountBalanceCheckpointStatsSchema
+):
+    """
+    Получить метрики создания контрольных точек балансов аккаунтов.
+
+    Доступно только администратору.
+    """
+
+    return account_schemas.AccountBalanceCheckpointStatsSchema(
+        **account_balance_checkpointer.get_stats()
+    )
 
 
 @account_router.get(
@@ -35,12 +106,139 @@ async def get_all_accounts_route(
 )
 async def get_all_accounts_by_user_id_route(
     user_id: uuid.UUID,
-    session: AsyncSession = Depends(dependencies.get_session),
-) -> list[account_schemas.AccountGetSchema]:
+    query_params: account_schemas.AccountsQuerySchema = Query(),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+) -> account_schemas.AccountListReadSchema:
+    """
+    Получить аккаунты пользователя постранично.
+
+    Доступно только администратору.
+    """
+
+    return await AccountService.get_all_by_user_id(
+        session,
+        user_id=user_id,
+        query_params=query_params,
+    )
+
+
+@account_router.get(
+    path="/{user_id}/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def export_accounts_by_user_id_route(
+    user_id: uuid.UUID,
+    query_params: ExportQuerySchema = Query(),
+    session_factory: dependencies.SessionFactory = Depends(
+        dependencies.get_read_session_factory
+    ),
+) -> StreamingResponse:
     """
-    Получить все аккаунты пользователя.
+    Выгрузить все аккаунты пользователя в формате NDJSON или CSV.
 
     Доступно только администратору.
     """
 
-    return await AccountService.get_all_by_user_id(session, user_id=user_id)
+    return utils.export_response(
+        AccountService.export_by_user_id(session_factory, user_id=user_id),
+        schema=account_schemas.AccountGetSchema,
+        format=query_params.format,
+        filename=f"accounts_{user_id}",
+    )
+
+
+@account_router.get(path="/{account_id}/transactions")
+async def get_account_transactions_route(
+    account_id: uuid.UUID,
+    query_params: transaction_schemas.TransactionsQuerySchema = Query(),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> transaction_schemas.TransactionListReadSchema:
+    """
+    Получить транзакции аккаунта постранично, от новых к старым.
+
+    Доступно владельцу аккаунта и администратору.
+    """
+
+    return await TransactionService.get_all_by_account_id(
+        session,
+        account_id=account_id,
+        query_params=query_params,
+        user_id=None if user.is_admin else user.id,
+    )
+
+
+@account_router.get(
+    path="/{account_id}/transactions/export",
+    response_class=StreamingResponse,
+)
+async def export_account_transactions_route(
+    account_id: uuid.UUID,
+    query_params: ExportQuerySchema = Query(),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+    session_factory: dependencies.SessionFactory = Depends(
+        dependencies.get_read_session_factory
+    ),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> StreamingResponse:
+    """
+    Выгрузить все транзакции аккаунта в формате NDJSON или CSV,
+    от старых к новым.
+
+    Доступно владельцу аккаунта и администратору.
+    """
+
+    transactions = await TransactionService.export_by_account_id(
+        session,
+        session_factory,
+        account_id=account_id,
+        user_id=None if user.is_admin else user.id,
+    )
+
+    return utils.export_response(
+        transactions,
+        schema=transaction_schemas.TransactionSchema,
+        format=query_params.format,
+        filename=f"transactions_{account_id}",
+    )
+
+
+@account_router.get(path="/{account_id}/summary")
+async def get_account_transactions_summary_route(
+    account_id: uuid.UUID,
+    session: AsyncSession = Depends(dependencies.get_read_session),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> account_schemas.AccountTransactionsSummarySchema:
+    """
+    Получить количество транзакций аккаунта и его последнюю транзакцию.
+
+    Доступно владельцу аккаунта и администратору.
+    """
+
+    return await AccountService.get_transactions_summary(
+        session,
+        id=account_id,
+        user_id=None if user.is_admin else user.id,
+    )
+
+
+@account_router.get(path="/{account_id}/balance")
+async def get_account_balance_as_of_route(
+    account_id: uuid.UUID,
+    query_params: account_schemas.AccountBalanceQuerySchema = Query(),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> account_schemas.AccountBalanceAsOfSchema:
+    """
+    Получить баланс аккаунта на момент времени `as_of`.
+
+    Доступно владельцу аккаунта и администратору.
+    """
+
+    return await AccountService.get_balance_as_of(
+        session,
+        id=account_id,
+        as_of=query_params.as_of,
+        user_id=None if user.is_admin else user.id,
+    )
@@ -1,6 +1,23 @@
 from src.accounts.schemas.account_schema import (
+    AccountBalanceAsOfSchema,
+    AccountBalanceCheckpointStatsSchema,
+    AccountBalanceQuerySchema,
+    AccountBalanceShardingStatsSchema,
     AccountCreateSchema,
     AccountGetSchema,
+    AccountListReadSchema,
+    AccountsQuerySchema,
+    AccountTransactionsSummarySchema,
 )
 
-__all__ = ("AccountCreateSchema", "AccountGetSchema")
+__all__ = (
+    "AccountBalanceAsOfSchema",
+    "AccountBalanceCheckpointStatsSchema",
+    "AccountBalanceQuerySchema",
+    "AccountBalanceShardingStatsSchema",
+    "AccountCreateSchema",
+    "AccountGetSchema",
+    "AccountListReadSchema",
+    "AccountsQuerySchema",
+    "AccountTransactionsSummarySchema",
+)
@@ -1,10 +1,12 @@
 """Модуль для Pydantic схем аккаунтов"""
 
 import uuid
+from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 
 import src.transactions.schemas as transaction_schemas
+from src.schemas import CursorListReadBaseSchema, CursorPaginationBaseSchema
 
 
 # MARK: Account
@@ -23,8 +25,102 @@ class AccountCreateSchema(BaseModel):
 
 
 class AccountGetSchema(AccountCreateSchema):
-    """Pydantic схема для получения аккаунта."""
+    """Pydantic схема для получения аккаунта без его транзакций."""
 
-    transactions: list[transaction_schemas.TransactionSchema] = Field(
-        description="Транзакции аккаунта.",
+    id: uuid.UUID = Field(description="Идентификатор аккаунта.")
+    balance: int = Field(
+        # Баланс модели учитывает еще не перенесенные части баланса
+        validation_alias=AliasChoices("total_balance", "balance"),
+        description="Баланс аккаунта.",
     )
+
+    class Config:
+        from_attributes = True
+        json_encoders = {uuid.UUID: str}
+
+
+class AccountTransactionsSummarySchema(BaseModel):
+    """Pydantic схема сводки по транзакциям аккаунта."""
+
+    account_id: uuid.UUID = Field(description="Идентификатор аккаунта.")
+    transactions_count: int = Field(description="Количество транзакций аккаунта.")
+    last_transaction: transaction_schemas.TransactionSchema | None = Field(
+        default=None,
+        description="Последняя транзакция аккаунта.",
+    )
+
+    class Config:
+        json_encoders = {uuid.UUID: str}
+
+
+class AccountListReadSchema(CursorListReadBaseSchema):
+    """Pydantic схема для получения страницы аккаунтов."""
+
+    accounts: list[AccountGetSchema] = Field(description="Аккаунты пользователя.")
+
+
+class AccountBalanceAsOfSchema(BaseModel):
+    """Pydantic схема баланса аккаунта на момент времени."""
+
+    account_id: uuid.UUID = Field(description="Идентификатор аккаунта.")
+    as_of: datetime = Field(description="Момент времени.")
+    balance: int = Field(
+        description="Сумма транзакций аккаунта, созданных не позже `as_of`.",
+    )
+    checkpoint_seq: int | None = Field(
+        default=None,
+        description=(
+            "Номер контрольной точки, от которой вычислен баланс, "
+            "или null, если баланс вычислен по всей истории."
+        ),
+    )
+
+    class Config:
+        json_encoders = {uuid.UUID: str}
+
+
+# MARK: Query
+class AccountsQuerySchema(CursorPaginationBaseSchema):
+    """Pydantic схема query параметров для запроса списка аккаунтов."""
+
+    class Config:
+        extra = "forbid"
+
+
+class AccountBalanceQuerySchema(BaseModel):
+    """Pydantic схема query параметров для запроса баланса на момент времени."""
+
+    as_of: datetime | None = Field(
+        default=None,
+        description="Момент времени, по умолчанию - текущий.",
+    )
+
+    class Config:
+        extra = "forbid"
+
+
+# MARK: Shards
+class AccountBalanceShardingStatsSchema(BaseModel):
+    """Pydantic схема метрик распределения балансов аккаунтов между частями."""
+
+    hot_accounts: int = Field(
+        description="Количество аккаунтов, баланс которых распределяется.",
+    )
+    shards: int = Field(description="Количество частей баланса аккаунта.")
+    promotions_total: int = Field(
+        description="Количество аккаунтов, переведенных в распределенный режим.",
+    )
+    demotions_total: int = Field(
+        description="Количество аккаунтов, возвращенных в обычный режим.",
+    )
+    compactions_total: int = Field(description="Количество переносов частей.")
+    compacted_accounts_total: int = Field(
+        description="Количество аккаунтов, части балансов которых перенесены.",
+    )
+
+
+class AccountBalanceCheckpointStatsSchema(BaseModel):
+    """Pydantic схема метрик создания контрольных точек балансов."""
+
+    runs_total: int = Field(description="Количество запусков создания точек.")
+    checkpoints_total: int = Field(description="Количество созданных точек.")
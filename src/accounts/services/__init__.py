@@ -1,3 +1,17 @@
-from src.accounts.services.acount_service import AccountService
+from src.accounts.services.account_balance_checkpointer import (
+    AccountBalanceCheckpointer,
+)
+from src.accounts.services.account_balance_sharding import AccountBalanceSharding
+from src.accounts.services.acount_service import (
+    AccountService,
+    account_balance_checkpointer,
+    account_balance_sharding,
+)
 
-__all__ = ("AccountService",)
+__all__ = (
+    "AccountBalanceCheckpointer",
+    "AccountBalanceSharding",
+    "AccountService",
+    "account_balance_checkpointer",
+    "account_balance_sharding",
+)
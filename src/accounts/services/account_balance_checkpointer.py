@@ -0,0 +1,104 @@
+"""Модуль для периодического создания контрольных точек балансов аккаунтов."""
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.accounts.repositories import AccountRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AccountBalanceCheckpointer:
+    """
+    Периодическое создание контрольных точек балансов аккаунтов.
+
+    Каждые `interval_seconds` для аккаунтов с новыми транзакциями
+    сохраняется сумма их транзакций до текущего номера `seq`, поэтому
+    баланс на момент времени вычисляется по транзакциям одного интервала,
+    а не по всей истории аккаунта.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_seconds: float,
+        lag_seconds: float,
+    ):
+        """
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий.
+            interval_seconds (float): Период создания точек.
+            lag_seconds (float): Наибольшая длительность транзакции записи.
+        """
+
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.lag_seconds = lag_seconds
+
+        self.runs_total = 0
+        self.checkpoints_total = 0
+
+        self._task: asyncio.Task | None = None
+
+    # MARK: Lifecycle
+    def start(self) -> None:
+        """Запустить периодическое создание точек."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить периодическое создание точек."""
+
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        """Периодически создавать точки."""
+
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+
+            try:
+                await self.checkpoint()
+            except Exception:
+                logger.exception("Failed to add account balance checkpoints")
+
+    # MARK: Checkpoint
+    async def checkpoint(self) -> int:
+        """
+        Создать контрольные точки балансов аккаунтов с новыми транзакциями.
+
+        Returns:
+            int: Количество созданных точек.
+        """
+
+        async with self.session_factory() as session:
+            created = await AccountRepository.add_balance_checkpoints(
+                session,
+                lag_seconds=self.lag_seconds,
+            )
+            await session.commit()
+
+        self.runs_total += 1
+        self.checkpoints_total += created
+
+        return created
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики создания точек.
+
+        Returns:
+            dict[str, Any]: Метрики создания точек.
+        """
+
+        return {
+            "runs_total": self.runs_total,
+            "checkpoints_total": self.checkpoints_total,
+        }
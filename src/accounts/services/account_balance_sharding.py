@@ -0,0 +1,190 @@
+"""Модуль для распределения балансов часто изменяемых аккаунтов между частями."""
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from collections import Counter
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.accounts.repositories import AccountRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AccountBalanceSharding:
+    """
+    Распределение изменений баланса часто изменяемых аккаунтов
+    между `shards` частями `account_balance_shards`.
+
+    Процесс считает изменения баланса каждого аккаунта. Аккаунты,
+    которые в этом процессе изменяются чаще `promote_rate` раз в секунду,
+    помечаются `is_hot`. Изменения баланса аккаунтов с `is_hot`
+    записываются в случайную часть, поэтому параллельные транзакции
+    не ожидают блокировку строки аккаунта.
+
+    Каждые `compact_interval_seconds` части балансов переносятся
+    в балансы аккаунтов, а список аккаунтов с `is_hot` обновляется из БД.
+    Баланс аккаунта всегда равен сумме `accounts.balance` и его частей,
+    поэтому процесс с устаревшим списком аккаунтов не нарушает баланс.
+
+    Частота изменений в одном процессе не говорит о нагрузке на аккаунт
+    в остальных процессах, поэтому процесс возвращает в обычный режим
+    только аккаунты, которые сам пометил `is_hot`, если они изменяются
+    в нем реже `demote_rate` раз в секунду и при переносе не нашлось
+    их частей, записанных любым процессом. Аккаунты, помеченные
+    остановленным процессом, остаются с `is_hot`.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        shards: int,
+        promote_rate: float,
+        demote_rate: float,
+        compact_interval_seconds: float,
+        is_enabled: bool,
+    ):
+        """
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий.
+            shards (int): Количество частей баланса аккаунта.
+            promote_rate (float): Частота изменений баланса в секунду,
+                начиная с которой баланс аккаунта распределяется.
+            demote_rate (float): Частота изменений баланса в секунду,
+                ниже которой аккаунт возвращается в обычный режим.
+            compact_interval_seconds (float): Период переноса частей балансов.
+            is_enabled (bool): Распределять ли балансы.
+        """
+
+        self.session_factory = session_factory
+        self.shards = shards
+        self.promote_rate = promote_rate
+        self.demote_rate = demote_rate
+        self.compact_interval_seconds = compact_interval_seconds
+        self.is_enabled = is_enabled
+
+        self.hot_ids: set[uuid.UUID] = set()
+        self.promoted_ids: set[uuid.UUID] = set()
+
+        self.promotions_total = 0
+        self.demotions_total = 0
+        self.compactions_total = 0
+        self.compacted_accounts_total = 0
+
+        self._writes: Counter[uuid.UUID] = Counter()
+        self._window_started_at = time.monotonic()
+        self._task: asyncio.Task | None = None
+
+    # MARK: Route
+    def route(self, account_id: uuid.UUID, writes: int = 1) -> int | None:
+        """
+        Учесть изменения баланса аккаунта и выбрать часть баланса.
+
+        Args:
+            account_id (uuid.UUID): ID аккаунта.
+            writes (int): Количество изменений баланса.
+
+        Returns:
+            int | None: Номер части баланса или None,
+                если изменяется баланс самого аккаунта.
+        """
+
+        if not self.is_enabled:
+            return None
+
+        self._writes[account_id] += writes
+
+        if account_id not in self.hot_ids:
+            return None
+
+        return random.randrange(self.shards)
+
+    # MARK: Lifecycle
+    def start(self) -> None:
+        """Запустить периодический перенос частей балансов."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить периодический перенос частей балансов."""
+
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        """Периодически переносить части балансов."""
+
+        while True:
+            await asyncio.sleep(self.compact_interval_seconds)
+
+            try:
+                await self.compact()
+            except Exception:
+                logger.exception("Failed to compact account balance shards")
+
+    # MARK: Compact
+    async def compact(self) -> None:
+        """
+        Перенести части балансов в балансы аккаунтов, изменить режим
+        аккаунтов по частоте изменений их балансов и обновить список
+        аккаунтов с `is_hot`.
+        """
+
+        now = time.monotonic()
+        elapsed = max(now - self._window_started_at, 1e-9)
+        writes, self._writes = self._writes, Counter()
+        self._window_started_at = now
+
+        promoted = [
+            account_id
+            for account_id, count in writes.items()
+            if account_id not in self.hot_ids and count / elapsed >= self.promote_rate
+        ]
+
+        async with self.session_factory() as session:
+            compacted = await AccountRepository.compact_balance_shards(session)
+            await session.commit()
+
+            demoted = [
+                account_id
+                for account_id in self.promoted_ids & self.hot_ids
+                if account_id not in compacted
+                and writes.get(account_id, 0) / elapsed < self.demote_rate
+            ]
+
+            await AccountRepository.set_hot(session, sorted(promoted), is_hot=True)
+            await AccountRepository.set_hot(session, sorted(demoted), is_hot=False)
+            await session.commit()
+
+            self.hot_ids = await AccountRepository.find_hot_ids(session)
+
+        self.promoted_ids = (self.promoted_ids | set(promoted)) & self.hot_ids
+
+        self.promotions_total += len(promoted)
+        self.demotions_total += len(demoted)
+        self.compactions_total += 1
+        self.compacted_accounts_total += len(compacted)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики распределения балансов.
+
+        Returns:
+            dict[str, Any]: Метрики распределения балансов.
+        """
+
+        return {
+            "hot_accounts": len(self.hot_ids),
+            "shards": self.shards,
+            "promotions_total": self.promotions_total,
+            "demotions_total": self.demotions_total,
+            "compactions_total": self.compactions_total,
+            "compacted_accounts_total": self.compacted_accounts_total,
+        }
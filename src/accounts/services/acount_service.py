@@ -1,6 +1,8 @@
 """Модуль для сервиса аккаунтов."""
 
 import uuid
+from datetime import UTC, datetime
+from typing import AsyncIterator
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +10,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import src.accounts.schemas as account_schemas
 import src.transactions.schemas as transaction_schemas
 from src import exceptions
+from src.accounts.models import AccountModel
 from src.accounts.repositories import AccountRepository
+from src.accounts.services.account_balance_checkpointer import (
+    AccountBalanceCheckpointer,
+)
+from src.accounts.services.account_balance_sharding import AccountBalanceSharding
+from src.database import SessionFactory, SessionLocal
+from src.settings import settings
+from src.transactions.models import TransactionModel
+from src.transactions.repositories import TransactionRepository
 
 
 class AccountService:
@@ -54,13 +65,17 @@ class AccountService:
         cls,
         session: AsyncSession,
         id: uuid.UUID,
+        user_id: uuid.UUID | None = None,
     ) -> account_schemas.AccountGetSchema:
         """
-        Поиск аккаунта по ID.
+        Поиск аккаунта по ID без загрузки его транзакций.
 
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             id (uuid.UUID): ID аккаунта.
+            user_id (uuid.UUID | None):
+                ID пользователя-владельца. Если передан, аккаунты
+                других пользователей считаются не найденными.
 
         Returns:
             AccountGetSchema: Найденный аккаунт.
@@ -69,90 +84,249 @@ class AccountService:
             AccountNotFoundException: Аккаунт не найден.
         """
 
+        filter_by = {"id": id}
+        if user_id is not None:
+            filter_by["user_id"] = user_id
+
         # Поиск аккаунта в БД
         account_db = await AccountRepository.find_one_or_none(
             session=session,
-            id=id,
+            **filter_by,
         )
 
         if account_db is None:
             raise exceptions.AccountNotFoundException()
 
-        transactions = [
-            transaction_schemas.TransactionSchema.model_validate(transaction)
-            for transaction in account_db.__dict__.pop("transactions")
-        ]
-
-        return account_schemas.AccountGetSchema(
-            **account_db.__dict__,
-            transactions=transactions,
-        )
+        return account_schemas.AccountGetSchema.model_validate(account_db)
 
     @classmethod
     async def get_all_by_user_id(
         cls,
         session: AsyncSession,
         user_id: uuid.UUID,
-    ) -> list[account_schemas.AccountGetSchema]:
+        query_params: account_schemas.AccountsQuerySchema,
+    ) -> account_schemas.AccountListReadSchema:
         """
-        Поиск аккаунта по ID пользователя.
+        Поиск аккаунтов по ID пользователя.
 
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             user_id (uuid.UUID): ID пользователя.
+            query_params (AccountsQuerySchema): Query параметры пагинации.
 
         Returns:
-            list[AccountGetSchema]: Найденные аккаунты.
+            AccountListReadSchema: Страница найденных аккаунтов.
 
         Raises:
-            AccountNotFoundException: Аккаунт не найден.
+            InvalidCursorException: Некорректный курсор пагинации.
         """
 
-        # Поиск аккаунта в БД
-        account_db = await AccountRepository.find_all(
+        # Поиск аккаунтов в БД
+        accounts_db, next_cursor = await AccountRepository.find_all_by_cursor(
             session=session,
+            sort_fields=[AccountModel.id],
+            cursor=query_params.cursor,
+            limit=query_params.limit,
             user_id=user_id,
         )
 
-        if account_db is None:
-            raise exceptions.AccountNotFoundException()
+        return account_schemas.AccountListReadSchema(
+            accounts=[
+                account_schemas.AccountGetSchema.model_validate(account)
+                for account in accounts_db
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @classmethod
+    async def export_by_user_id(
+        cls,
+        session_factory: SessionFactory,
+        user_id: uuid.UUID,
+    ) -> AsyncIterator[account_schemas.AccountGetSchema]:
+        """
+        Выгрузить все аккаунты пользователя.
+
+        Аккаунты читаются из серверного курсора по мере отправки,
+        в сессии `session_factory`, которая открывается при начале
+        выгрузки и закрывается после нее.
+
+        Args:
+            session_factory (SessionFactory):
+                Фабрика сессий только для чтения.
+            user_id (uuid.UUID): ID пользователя.
+
+        Returns:
+            AsyncIterator[AccountGetSchema]: Аккаунты пользователя.
+        """
+
+        async with session_factory() as session:
+            async for account in AccountRepository.stream(
+                session,
+                order_by=[AccountModel.id],
+                user_id=user_id,
+            ):
+                yield account_schemas.AccountGetSchema.model_validate(account)
+
+    @classmethod
+    async def get_transactions_summary(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+        user_id: uuid.UUID | None = None,
+    ) -> account_schemas.AccountTransactionsSummarySchema:
+        """
+        Получить сводку по транзакциям аккаунта: их количество
+        и последнюю транзакцию. Транзакции в память не загружаются.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (uuid.UUID): ID аккаунта.
+            user_id (uuid.UUID | None): ID пользователя-владельца.
+
+        Returns:
+            AccountTransactionsSummarySchema: Сводка по транзакциям аккаунта.
+
+        Raises:
+            AccountNotFoundException: Аккаунт не найден.
+        """
+
+        account = await cls.get(session=session, id=id, user_id=user_id)
+
+        transactions_count = await TransactionRepository.count(
+            session=session,
+            account_id=account.id,
+        )
+        last_transactions, _ = await TransactionRepository.find_all_by_cursor(
+            session=session,
+            sort_fields=[TransactionModel.created_at, TransactionModel.id],
+            limit=1,
+            ascending=False,
+            account_id=account.id,
+        )
 
-        result = []
-        for account in account_db:
-            transactions = [
-                transaction_schemas.TransactionSchema.model_validate(transaction)
-                for transaction in account.__dict__.pop("transactions")
-            ]
-            result.append(
-                account_schemas.AccountGetSchema(
-                    **account.__dict__,
-                    transactions=transactions,
+        return account_schemas.AccountTransactionsSummarySchema(
+            account_id=account.id,
+            transactions_count=transactions_count,
+            last_transaction=(
+                transaction_schemas.TransactionSchema.model_validate(
+                    last_transactions[0]
                 )
-            )
+                if last_transactions
+                else None
+            ),
+        )
+
+    @classmethod
+    async def get_balance_as_of(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+        as_of: datetime | None = None,
+        user_id: uuid.UUID | None = None,
+    ) -> account_schemas.AccountBalanceAsOfSchema:
+        """
+        Получить баланс аккаунта на момент времени как сумму его транзакций,
+        созданных не позже `as_of`.
+
+        Баланс вычисляется от ближайшей контрольной точки
+        `account_balance_checkpointer`, поэтому просматриваются только
+        транзакции после нее.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (uuid.UUID): ID аккаунта.
+            as_of (datetime | None): Момент времени, по умолчанию - текущий.
+                Время без часового пояса считается временем UTC.
+            user_id (uuid.UUID | None): ID пользователя-владельца.
 
-        return result
+        Returns:
+            AccountBalanceAsOfSchema: Баланс аккаунта на момент времени.
+
+        Raises:
+            AccountNotFoundException: Аккаунт не найден.
+        """
+
+        account = await cls.get(session=session, id=id, user_id=user_id)
+
+        if as_of is None:
+            as_of = datetime.now(UTC)
+        elif as_of.tzinfo is None:
+            as_of = as_of.replace(tzinfo=UTC)
+
+        balance, checkpoint_seq = await AccountRepository.get_balance_as_of(
+            session=session,
+            id=account.id,
+            as_of=as_of,
+            lag_seconds=settings.ACCOUNT_BALANCE_CHECKPOINT_LAG_SECONDS,
+        )
+
+        return account_schemas.AccountBalanceAsOfSchema(
+            account_id=account.id,
+            as_of=as_of,
+            balance=balance,
+            checkpoint_seq=checkpoint_seq,
+        )
 
     # MARK: Update
     @classmethod
-    async def update_balance(
+    async def increment_balance(
         cls,
         session: AsyncSession,
         id: uuid.UUID,
-        new_balance: int,
-    ) -> None:
+        amount: int,
+    ) -> int:
         """
-        Обновление баланса аккаунта.
+        Атомарно изменить баланс аккаунта на `amount`.
+
+        Для аккаунтов с `is_hot` изменяется одна из частей баланса
+        `account_balance_sharding`.
 
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             id (uuid.UUID): ID аккаунта.
-            new_balance (int): Новый баланс аккаунта.
+            amount (int): Сумма изменения баланса.
+
+        Returns:
+            int: Новый баланс аккаунта.
 
         Raises:
             AccountNotFoundException: Аккаунт не найден.
         """
 
-        account = await cls.get(session=session, id=id)
+        shard = account_balance_sharding.route(id)
+
+        if shard is None:
+            balance = await AccountRepository.increment_balance(
+                session=session,
+                id=id,
+                amount=amount,
+            )
+        else:
+            # Изменяется часть баланса, а баланс аккаунта равен сумме частей
+            await AccountRepository.increment_shard_balances(
+                session=session,
+                amounts={(id, shard): amount},
+            )
+            balance = await AccountRepository.get_total_balance(session, id=id)
+
+        if balance is None:
+            raise exceptions.AccountNotFoundException()
 
-        account.balance = new_balance
         await session.commit()
+        return balance
+
+
+account_balance_sharding = AccountBalanceSharding(
+    session_factory=SessionLocal,
+    shards=settings.ACCOUNT_BALANCE_SHARDS,
+    promote_rate=settings.ACCOUNT_BALANCE_HOT_PROMOTE_RATE,
+    demote_rate=settings.ACCOUNT_BALANCE_HOT_DEMOTE_RATE,
+    compact_interval_seconds=settings.ACCOUNT_BALANCE_COMPACT_INTERVAL_SECONDS,
+    is_enabled=settings.ACCOUNT_BALANCE_SHARDING_ENABLED,
+)
+account_balance_checkpointer = AccountBalanceCheckpointer(
+    session_factory=SessionLocal,
+    interval_seconds=settings.ACCOUNT_BALANCE_CHECKPOINT_INTERVAL_SECONDS,
+    lag_seconds=settings.ACCOUNT_BALANCE_CHECKPOINT_LAG_SECONDS,
+)
@@ -4,10 +4,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.auth.schemas as auth_schemas
 import src.users.schemas as user_schemas
-from src import exceptions, utils
+from src import exceptions
 from src.auth.services.jwt_service import JWTService
+from src.users.models import UserModel
 from src.users.repositories import UserRepository
-from src.users.services import UserService
+from src.users.services import PasswordService, UserService
 
 
 class AuthService:
@@ -38,7 +39,10 @@ class AuthService:
         user = await UserService.create(session, schema)
 
         # Создание токенов
-        tokens = await JWTService.create_tokens(user_id=user.id)
+        tokens = await JWTService.create_tokens(
+            user_id=user.id,
+            is_admin=user.is_admin,
+        )
 
         return tokens
 
@@ -52,6 +56,8 @@ class AuthService:
         """
         Авторизовать пользователя.
 
+        Хэш пароля прежнего формата пересчитывается после успешной проверки.
+
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             schema (UserLoginSchema): данные для авторизации пользователя.
@@ -60,23 +66,46 @@ class AuthService:
             JWTGetSchema: access и refresh токены пользователя.
 
         Raises:
-            UserNotFoundException: Пользователь не найден.
+            UserNotFoundException: Пользователь не найден или пароль неверный.
         """
 
-        # Хэширование пароля
-        hashed_password = utils.get_hash(schema.password)
-
         # Поиск пользователя в БД
         user = await UserRepository.find_one_or_none(
             session=session,
             email=schema.email,
-            hashed_password=hashed_password,
         )
 
         if user is None:
+            # Проверка с фиктивным хэшем, чтобы время ответа для
+            # неизвестного email не отличалось от неверного пароля
+            await PasswordService.verify(
+                password=schema.password,
+                hashed_password=await PasswordService.get_dummy_hash(),
+            )
+            raise exceptions.UserNotFoundException
+
+        if not await PasswordService.verify(
+            password=schema.password,
+            hashed_password=user.hashed_password,
+        ):
             raise exceptions.UserNotFoundException
 
         # Создание токенов
-        tokens = await JWTService.create_tokens(user_id=user.id)
+        tokens = await JWTService.create_tokens(
+            user_id=user.id,
+            is_admin=user.is_admin,
+            token_version=user.token_version,
+        )
+
+        # Пересчет хэша прежнего формата или с устаревшими параметрами
+        if PasswordService.needs_rehash(user.hashed_password):
+            await UserRepository.update(
+                UserModel.id == user.id,
+                session=session,
+                obj_in={
+                    "hashed_password": await PasswordService.hash(schema.password),
+                },
+            )
+            await session.commit()
 
         return tokens
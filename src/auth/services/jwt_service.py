@@ -1,31 +1,51 @@
 """Модуль для сервисов JWT."""
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Literal
+from typing import Any, Literal
 
 import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.auth.schemas as jwt_schemas
-from src import constants, exceptions
+from src import constants, exceptions, utils
 from src.settings import settings
 from src.users.repositories import UserRepository
 
 
 class JWTService:
-    """Сервис для работы с JWT."""
+    """
+    Сервис для работы с JWT.
+
+    Результаты декодирования токенов кэшируются в памяти процесса
+    по хэшу токена: утверждения валидного токена хранятся до его истечения,
+    а невалидные токены - `JWT_CACHE_INVALID_TTL_SECONDS`. Поэтому подпись
+    токена, который предъявляется повторно, не проверяется заново.
+    """
+
+    _cache = utils.TTLCache(
+        max_size=settings.JWT_CACHE_MAX_SIZE,
+        ttl_seconds=settings.JWT_CACHE_INVALID_TTL_SECONDS,
+    )
 
     # MARK: Utils
     @classmethod
-    async def _decode_refresh_token(cls, refresh_token: str) -> str:
+    def decode_token(
+        cls,
+        token: str,
+        token_type: Literal["access_token", "refresh_token"],
+    ) -> dict[str, Any]:
         """
-        Декодировать refresh_token.
+        Декодировать токен и проверить его подпись, используя кэш.
 
         Args:
-            refresh_token (str): refresh_token.
+            token (str): токен без префикса `Bearer `.
+            token_type(Literal["access_token", "refresh_token"]):
+                access_token или refresh_token.
 
         Returns:
-            user_id: id пользователя
+            payload: утверждения токена, включая id пользователя.
 
         Raises:
             InvalidTokenException: Невалидный токен `HTTP_401_UNAUTHORIZED`.
@@ -33,23 +53,72 @@ class JWTService:
                 `HTTP_401_UNAUTHORIZED`.
         """
 
+        key = (token_type, hashlib.sha256(token.encode()).digest())
+
+        if settings.JWT_CACHE_ENABLED:
+            cached = cls._cache.get(key)
+            if isinstance(cached, dict):
+                return cached
+            if cached is not utils.MISSING:
+                raise cached
+
         try:
             payload = jwt.decode(
-                jwt=refresh_token,
-                key=settings.JWT_REFRESH_SECRET,
+                jwt=token,
+                key=(
+                    settings.JWT_ACCESS_SECRET
+                    if token_type == "access_token"
+                    else settings.JWT_REFRESH_SECRET
+                ),
                 algorithms=[constants.ALGORITHM],
             )
-            user_id = payload.get("id")
-
-            if not user_id:
+            if not payload.get("id"):
                 raise exceptions.InvalidTokenException
-
-            return user_id
         except Exception as e:
-            if isinstance(e, jwt.ExpiredSignatureError):
-                raise exceptions.TokenExpiredException
-            else:
-                raise exceptions.InvalidTokenException
+            exception = (
+                exceptions.TokenExpiredException
+                if isinstance(e, jwt.ExpiredSignatureError)
+                else exceptions.InvalidTokenException
+            )
+            if settings.JWT_CACHE_ENABLED:
+                cls._cache.set(key, exception)
+            raise exception
+
+        ttl_seconds = payload.get("exp", 0) - time.time()
+        if settings.JWT_CACHE_ENABLED and ttl_seconds > 0:
+            cls._cache.set(key, payload, ttl_seconds=ttl_seconds)
+
+        return payload
+
+    @classmethod
+    def get_stats(cls) -> dict[str, Any]:
+        """
+        Получить метрики кэша декодированных токенов.
+
+        Returns:
+            dict[str, Any]: Размер кэша и количество попаданий и промахов.
+        """
+
+        return cls._cache.get_stats()
+
+    @classmethod
+    async def _decode_refresh_token(cls, refresh_token: str) -> dict[str, Any]:
+        """
+        Декодировать refresh_token.
+
+        Args:
+            refresh_token (str): refresh_token.
+
+        Returns:
+            payload: утверждения токена, включая id пользователя.
+
+        Raises:
+            InvalidTokenException: Невалидный токен `HTTP_401_UNAUTHORIZED`.
+            TokenExpiredException: Время действия токена истекло
+                `HTTP_401_UNAUTHORIZED`.
+        """
+
+        return cls.decode_token(token=refresh_token, token_type="refresh_token")
 
     # MARK: Create
     @classmethod
@@ -57,6 +126,7 @@ class JWTService:
         cls,
         user_id: str,
         token_type: Literal["access_token", "refresh_token"],
+        claims: dict[str, Any] | None = None,
     ) -> tuple[str, datetime]:
         """
         Создать access_token или refresh_token для пользователя.
@@ -65,6 +135,7 @@ class JWTService:
             user_id(str): id пользователя.
             token_type(Literal["access_token", "refresh_token"]):
                 access_token или refresh_token.
+            claims(dict[str, Any] | None): дополнительные утверждения токена.
 
         Returns:
             (token, expires_at): токен в формате `Bearer <token>` и время его истечения.
@@ -81,6 +152,7 @@ class JWTService:
 
         encoded_jwt = jwt.encode(
             payload={
+                **(claims or {}),
                 "id": str(user_id),
                 "exp": expires_at,
             },
@@ -91,12 +163,23 @@ class JWTService:
         return f"Bearer {encoded_jwt}", expires_at
 
     @classmethod
-    async def create_tokens(cls, user_id: str) -> jwt_schemas.JWTGetSchema:
+    async def create_tokens(
+        cls,
+        user_id: str,
+        is_admin: bool = False,
+        token_version: int = 0,
+    ) -> jwt_schemas.JWTGetSchema:
         """
         Метод для создания access и refresh токенов.
 
+        Оба токена содержат версию токенов пользователя, а access_token
+        также содержит роль пользователя, что позволяет авторизовать
+        запросы по утверждениям токена при `JWT_STATELESS_AUTH`.
+
         Args:
             user_id (str): id пользователя.
+            is_admin (bool): является ли пользователь администратором.
+            token_version (int): версия токенов пользователя.
 
         Returns:
             schemas.JWTGetSchema: Схема с access и refresh токенами.
@@ -105,10 +188,15 @@ class JWTService:
         access_token, expires_at = await cls._create_token(
             user_id=user_id,
             token_type="access_token",
+            claims={
+                constants.JWT_IS_ADMIN_CLAIM: is_admin,
+                constants.JWT_TOKEN_VERSION_CLAIM: token_version,
+            },
         )
         refresh_token, _ = await cls._create_token(
             user_id=user_id,
             token_type="refresh_token",
+            claims={constants.JWT_TOKEN_VERSION_CLAIM: token_version},
         )
 
         return jwt_schemas.JWTGetSchema(
@@ -143,7 +231,8 @@ class JWTService:
 
         refresh_token = tokens_data.refresh_token.removeprefix("Bearer ")
 
-        user_id = await cls._decode_refresh_token(refresh_token=refresh_token)
+        payload = await cls._decode_refresh_token(refresh_token=refresh_token)
+        user_id = payload["id"]
 
         user_db = await UserRepository.find_one_or_none(
             session=session,
@@ -153,4 +242,13 @@ class JWTService:
         if user_db is None:
             raise exceptions.UserNotFoundException
 
-        return await cls.create_tokens(user_id=user_id)
+        # Токены, выданные до отзыва, недействительны
+        token_version = payload.get(constants.JWT_TOKEN_VERSION_CLAIM)
+        if token_version is not None and token_version != user_db.token_version:
+            raise exceptions.InvalidTokenException
+
+        return await cls.create_tokens(
+            user_id=user_id,
+            is_admin=user_db.is_admin,
+            token_version=user_db.token_version,
+        )
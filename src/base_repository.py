@@ -1,18 +1,79 @@
 """Модуль интерфейсов для CRUD операций с моделям БД."""
 
-from typing import Any, Generic, Tuple, TypeVar, Union
+import json
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Hashable,
+    Iterator,
+    Literal,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
-from sqlalchemy import Select, asc, delete, desc, insert, or_, select, update
+from sqlalchemy import (
+    Insert,
+    Select,
+    Update,
+    asc,
+    column,
+    delete,
+    desc,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Result, Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import func
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import ClauseElement, Executable, func
+from sqlalchemy.sql.visitors import InternalTraversal
 
-from src import constants
+from src import constants, exceptions, search, utils
 from src.database import Base
+from src.settings import settings
+
+# Объединение одинаковых параллельных запросов на чтение
+read_single_flight = utils.SingleFlight()
+# Пропускная способность массовой записи по таблицам
+bulk_write_stats = utils.ThroughputCounter()
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+# Возвращаемые данные массовой записи: модели, первичные ключи,
+# указанные столбцы или ничего
+BulkReturning = Literal["model", "ids"] | Sequence[InstrumentedAttribute] | None
+
+
+class Explain(Executable, ClauseElement):
+    """Выражение `EXPLAIN (FORMAT JSON)` для запроса с его параметрами."""
+
+    __visit_name__ = "explain"
+    inherit_cache = True
+    _traverse_internals = [("stmt", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, stmt: Select):
+        self.stmt = stmt
+
+
+@compiles(Explain)
+def compile_explain(element: Explain, compiler, **kw) -> str:
+    """Скомпилировать выражение `EXPLAIN (FORMAT JSON)`."""
+
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
 
 
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
@@ -56,19 +117,176 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         cls,
         session: AsyncSession,
         data: list[dict[str, Any]],
-    ) -> list[ModelType]:
+        on_conflict: Literal["error", "nothing", "update"] = "error",
+        conflict_fields: Sequence[str] | None = None,
+        update_fields: Sequence[str] | None = None,
+        returning: BulkReturning = "model",
+        chunk_size: int | None = None,
+    ) -> list[Any] | None:
         """
         Добавить несколько записей в текущую сессию.
 
+        Записи вставляются многострочными `INSERT` частями, размер которых
+        ограничен количеством параметров запроса. Если RETURNING не нужен,
+        конфликты не обрабатываются и записей не меньше
+        `DB_BULK_COPY_THRESHOLD`, записи загружаются через `COPY`.
+
+        Args:
+            session (AsyncSession): Сессия.
+            data (list[dict[str, Any]]): Данные записей.
+            on_conflict (Literal["error", "nothing", "update"]): Обработка
+                конфликта: ошибка, пропуск записи или обновление записи.
+            conflict_fields (Sequence[str] | None): Поля уникального индекса
+                конфликта, по умолчанию - первичный ключ.
+            update_fields (Sequence[str] | None): Поля, обновляемые
+                при конфликте, по умолчанию - все поля записи,
+                кроме полей конфликта.
+            returning (BulkReturning): Возвращаемые данные: модели `model`,
+                первичные ключи `ids`, указанные столбцы или None.
+            chunk_size (int | None): Наибольшее количество записей
+                в одном запросе, по умолчанию - `BULK_INSERT_CHUNK_SIZE`.
+
         Returns:
-            list[ModelType]: список созданных моделей.
+            list[Any] | None: Добавленные или обновленные записи
+                или None, если `returning` равен None.
         """
 
-        stmt = insert(cls.model).returning(cls.model)
-        result = await session.execute(stmt, data)
-        return result.unique().scalars().all()
+        started_at = time.perf_counter()
+
+        if (
+            returning is None
+            and on_conflict == "error"
+            and len(data) >= settings.DB_BULK_COPY_THRESHOLD
+            and await cls._copy_records(session, data)
+        ):
+            bulk_write_stats.record(
+                cls.model.__tablename__,
+                "copy",
+                rows=len(data),
+                chunks=1,
+                seconds=time.perf_counter() - started_at,
+            )
+            return None
+
+        table = cls.model.__table__
+        conflict_fields = conflict_fields or [c.name for c in table.primary_key]
+        size = cls._get_bulk_chunk_size(len(table.columns), chunk_size)
+
+        results = [] if returning is not None else None
+        chunks = 0
+        for start in range(0, len(data), size):
+            stmt = pg_insert(cls.model).values(data[start : start + size])
+
+            fields = [
+                field
+                for field in (update_fields or data[start].keys())
+                if field not in conflict_fields
+            ]
+            if on_conflict == "update" and fields:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=conflict_fields,
+                    set_={field: stmt.excluded[field] for field in fields},
+                )
+            elif on_conflict != "error":
+                stmt = stmt.on_conflict_do_nothing(index_elements=conflict_fields)
+
+            chunks += 1
+            chunk = await cls._execute_bulk(session, stmt, returning)
+            if results is not None:
+                results.extend(chunk)
+
+        bulk_write_stats.record(
+            cls.model.__tablename__,
+            "insert" if on_conflict == "error" else "upsert",
+            rows=len(data),
+            chunks=chunks,
+            seconds=time.perf_counter() - started_at,
+        )
+
+        return results
 
     # MARK: Read
+    @classmethod
+    async def _execute_read(
+        cls,
+        session: AsyncSession,
+        stmt: Executable,
+        fetch: Callable[[Result], Any],
+    ) -> Any:
+        """
+        Выполнить запрос на чтение и получить из него результат `fetch`.
+
+        В сессиях только для чтения одинаковые параллельные запросы
+        выполняются один раз через `read_single_flight` по ключу
+        из `_get_read_key`. Полученные другим запросом модели копируются
+        в текущую сессию без обращения к БД.
+
+        Returns:
+            Any: результат `fetch`.
+        """
+
+        async def execute() -> Any:
+            return fetch(await session.execute(stmt))
+
+        if not (settings.DB_SINGLE_FLIGHT_ENABLED and session.info.get("read_only")):
+            return await execute()
+
+        key = cls._get_read_key(stmt)
+        if key is None:
+            return await execute()
+
+        value, is_shared = await read_single_flight.do(key, execute)
+
+        if not is_shared:
+            return value
+        if isinstance(value, Base):
+            return await session.merge(value, load=False)
+        if isinstance(value, Sequence) and value and isinstance(value[0], Base):
+            return [await session.merge(model, load=False) for model in value]
+        if isinstance(value, Sequence) and value and isinstance(value[0], Row):
+            return [
+                tuple(
+                    await session.merge(item, load=False)
+                    if isinstance(item, Base)
+                    else item
+                    for item in row
+                )
+                for row in value
+            ]
+        return value
+
+    @staticmethod
+    def _get_read_key(stmt: Executable) -> Hashable | None:
+        """
+        Получить ключ запроса на чтение для `read_single_flight`.
+
+        Ключ состоит из ключа кэша SQLAlchemy, описывающего структуру
+        запроса, и значений его параметров, то есть фильтров и пагинации,
+        поэтому запрос не компилируется при каждом чтении.
+
+        Returns:
+            Hashable | None: Ключ запроса или None, если запрос
+                не кэшируется SQLAlchemy или его параметры нехэшируемы.
+        """
+
+        cache_key = stmt._generate_cache_key()
+        if cache_key is None:
+            return None
+
+        key = (
+            cache_key.key,
+            tuple(
+                tuple(value) if isinstance(value, list) else value
+                for value in (bind.effective_value for bind in cache_key.bindparams)
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
     @classmethod
     async def find_one_or_none(
         cls,
@@ -85,8 +303,39 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
-        result = await session.execute(stmt)
-        return result.unique().scalars().one_or_none()
+        return await cls._execute_read(
+            session,
+            stmt,
+            lambda result: result.unique().scalars().one_or_none(),
+        )
+
+    @classmethod
+    async def exists(
+        cls,
+        session: AsyncSession,
+        *filter,
+        **filter_by,
+    ) -> bool:
+        """
+        Проверить наличие хотя бы одной записи, соответствующей критериям,
+        без загрузки самой записи.
+
+        Returns:
+            bool: True, если запись найдена.
+        """
+
+        stmt = select(
+            select(literal(1))
+            .select_from(cls.model)
+            .filter(*filter)
+            .filter_by(**filter_by)
+            .exists()
+        )
+        return await cls._execute_read(
+            session,
+            stmt,
+            lambda result: bool(result.scalar()),
+        )
 
     @classmethod
     async def find_all(
@@ -112,8 +361,42 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .offset(offset)
             .limit(limit)
         )
-        result = await session.execute(stmt)
-        return result.unique().scalars().all()
+        return await cls._execute_read(
+            session,
+            stmt,
+            lambda result: result.unique().scalars().all(),
+        )
+
+    @classmethod
+    async def find_all_by_cursor(
+        cls,
+        session: AsyncSession,
+        sort_fields: Sequence[InstrumentedAttribute],
+        cursor: str | None = None,
+        limit: int | None = constants.DEFAULT_QUERY_LIMIT,
+        ascending: bool = True,
+        *filter,
+        **filter_by,
+    ) -> tuple[list[ModelType], str | None]:
+        """
+        Возвращает страницу моделей, соответствующих параметрам поиска,
+        с использованием keyset пагинации.
+
+        Returns:
+            (models, next_cursor): модели, соответствующие параметрам поиска,
+                и курсор следующей страницы или `None`, если страниц больше нет.
+        """
+
+        stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
+
+        return await cls.get_all_with_cursor_from_stmt(
+            session=session,
+            stmt=stmt,
+            sort_fields=sort_fields,
+            cursor=cursor,
+            limit=limit,
+            ascending=ascending,
+        )
 
     @classmethod
     async def find_all_ilike(
@@ -126,7 +409,11 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         **filter_by,
     ) -> list[ModelType]:
         """
-        Гибкий поиск всех записей с использованием ilike.
+        Гибкий поиск всех записей, значение хотя бы одного поля
+        `search_fields` которых содержит искомое значение без учета регистра.
+
+        Вид поиска выбирается `search.plan_search`, а записи сортируются
+        по убыванию сходства с искомыми значениями.
 
         Returns:
             list[ModelType]: модели, соответствующие параметрам поиска.
@@ -135,15 +422,21 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
 
         if search_fields:
-            search_conditions = []
-            for field, value in search_fields.items():
-                search_conditions.append(getattr(cls.model, field).ilike(f"%{value}%"))
-            if search_conditions:
-                stmt = stmt.filter(or_(*search_conditions))
+            fields = {
+                getattr(cls.model, field): str(value)
+                for field, value in search_fields.items()
+            }
+            stmt = stmt.filter(search.get_search_any_condition(fields)).order_by(
+                search.get_search_rank(fields).desc(),
+                *cls.model.__table__.primary_key,
+            )
 
         stmt = stmt.offset(offset).limit(limit)
-        result = await session.execute(stmt)
-        return result.unique().scalars().all()
+        return await cls._execute_read(
+            session,
+            stmt,
+            lambda result: result.unique().scalars().all(),
+        )
 
     @classmethod
     async def find_all_sorted(
@@ -173,8 +466,69 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .order_by(sort_order)
             .limit(limit)
         )
-        result = await session.execute(stmt)
-        return result.unique().scalars().all()
+        return await cls._execute_read(
+            session,
+            stmt,
+            lambda result: result.unique().scalars().all(),
+        )
+
+    @classmethod
+    async def stream(
+        cls,
+        session: AsyncSession,
+        *filter,
+        order_by: Sequence[InstrumentedAttribute] = (),
+        yield_per: int | None = None,
+        **filter_by,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Получать модели, соответствующие параметрам поиска, по мере чтения
+        из серверного курсора, не загружая их все в память.
+
+        Returns:
+            AsyncIterator[ModelType]: модели в порядке `order_by`.
+        """
+
+        stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
+
+        async for model in cls.stream_from_stmt(
+            session=session,
+            stmt=stmt.order_by(*order_by),
+            yield_per=yield_per,
+        ):
+            yield model
+
+    @classmethod
+    async def stream_from_stmt(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[ModelType]],
+        yield_per: int | None = None,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Получать модели финального выражения по мере чтения
+        из серверного курсора.
+
+        Строки читаются из курсора порциями по `yield_per`,
+        по умолчанию - `DB_STREAM_FETCH_SIZE`, поэтому в памяти находится
+        не больше одной порции. Объединение параллельных запросов
+        `read_single_flight` не применяется.
+
+        Returns:
+            AsyncIterator[ModelType]: модели выражения.
+        """
+
+        stmt = stmt.execution_options(
+            yield_per=yield_per or settings.DB_STREAM_FETCH_SIZE,
+        )
+        result = await session.stream_scalars(stmt)
+
+        try:
+            async for partition in result.partitions():
+                for model in partition:
+                    yield model
+        finally:
+            await result.close()
 
     @classmethod
     async def get_all_with_pagination_from_stmt(
@@ -195,8 +549,198 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         stmt = stmt.limit(limit=limit).offset(offset=offset)
-        result = await session.execute(stmt)
-        return result.unique().scalars().all()
+        return await cls._execute_read(
+            session,
+            stmt,
+            lambda result: result.unique().scalars().all(),
+        )
+
+    @classmethod
+    async def get_all_with_cursor_from_stmt(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[ModelType]],
+        sort_fields: Sequence[InstrumentedAttribute],
+        cursor: str | None = None,
+        limit: int | None = constants.DEFAULT_QUERY_LIMIT,
+        ascending: bool = True,
+        offset: int | None = None,
+    ) -> tuple[list[ModelType], str | None]:
+        """
+        Применить keyset пагинацию к финальному выражению
+        для запроса в БД, предварительно составленному с учетом фильтрации,
+        и вернуть список сущностей и курсор следующей страницы.
+
+        Ключ сортировки `sort_fields` должен быть уникальным, поэтому
+        последним полем в нем указывается первичный ключ.
+        Смещение `offset` применяется только к первой странице без курсора.
+
+        Returns:
+            (models, next_cursor): модели, соответствующие параметрам поиска,
+                и курсор следующей страницы или `None`, если страниц больше нет.
+
+        Raises:
+            InvalidCursorException: Некорректный курсор пагинации.
+        """
+
+        page_stmt = cls._get_cursor_page_stmt(
+            stmt, sort_fields, cursor, limit, ascending, offset
+        )
+        models = list(
+            await cls._execute_read(
+                session,
+                page_stmt,
+                lambda result: result.unique().scalars().all(),
+            )
+        )
+
+        return cls._get_cursor_page(models, sort_fields, limit)
+
+    @classmethod
+    async def get_all_with_cursor_and_count_from_stmt(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[ModelType]],
+        sort_fields: Sequence[InstrumentedAttribute],
+        count_strategy: constants.CountStrategy,
+        cursor: str | None = None,
+        limit: int | None = constants.DEFAULT_QUERY_LIMIT,
+        ascending: bool = True,
+        offset: int | None = None,
+    ) -> tuple[list[ModelType], str | None, int, constants.CountAccuracy]:
+        """
+        Получить страницу сущностей, как `get_all_with_cursor_from_stmt`,
+        и общее количество сущностей по стратегии `count_strategy`.
+
+        Стратегия `window` считает количество тем же запросом, что и страницу,
+        через `count(*) OVER()`. Для страницы с курсором так считаются только
+        сущности, начиная с курсора, поэтому количество является нижней
+        границей. Остальные стратегии выполняются `count_from_stmt`.
+
+        Returns:
+            (models, next_cursor, count, count_accuracy): модели, курсор
+                следующей страницы, количество сущностей и его точность.
+
+        Raises:
+            InvalidCursorException: Некорректный курсор пагинации.
+        """
+
+        if count_strategy != "window":
+            models, next_cursor = await cls.get_all_with_cursor_from_stmt(
+                session=session,
+                stmt=stmt,
+                sort_fields=sort_fields,
+                cursor=cursor,
+                limit=limit,
+                ascending=ascending,
+                offset=offset,
+            )
+            count, count_accuracy = await cls.count_from_stmt(
+                session=session,
+                stmt=stmt,
+                strategy=count_strategy,
+            )
+            return models, next_cursor, count, count_accuracy
+
+        page_stmt = cls._get_cursor_page_stmt(
+            stmt.add_columns(func.count().over()),
+            sort_fields,
+            cursor,
+            limit,
+            ascending,
+            offset,
+        )
+        rows = await cls._execute_read(
+            session,
+            page_stmt,
+            lambda result: result.unique().all(),
+        )
+        models, next_cursor = cls._get_cursor_page(
+            [row[0] for row in rows], sort_fields, limit
+        )
+
+        if rows:
+            count = rows[0][1]
+        elif offset and cursor is None:
+            # Смещение больше количества сущностей - строк для подсчета нет
+            count, _ = await cls.count_from_stmt(session, stmt, strategy="exact")
+        else:
+            count = 0
+
+        return models, next_cursor, count, "exact" if cursor is None else "at_least"
+
+    @classmethod
+    def _get_cursor_page_stmt(
+        cls,
+        stmt: Select,
+        sort_fields: Sequence[InstrumentedAttribute],
+        cursor: str | None,
+        limit: int | None,
+        ascending: bool,
+        offset: int | None,
+    ) -> Select:
+        """
+        Применить keyset пагинацию к выражению для запроса в БД.
+        Запрашивается на одну сущность больше `limit`, чтобы определить,
+        есть ли следующая страница.
+
+        Raises:
+            InvalidCursorException: Некорректный курсор пагинации.
+        """
+
+        if cursor is not None:
+            try:
+                cursor_values = utils.decode_cursor(
+                    cursor,
+                    types=[field.type.python_type for field in sort_fields],
+                )
+            except ValueError:
+                raise exceptions.InvalidCursorException
+
+            sort_key = tuple_(*sort_fields)
+            cursor_key = tuple_(
+                *(
+                    literal(value, type_=field.type)
+                    for field, value in zip(sort_fields, cursor_values)
+                )
+            )
+            stmt = stmt.where(
+                sort_key > cursor_key if ascending else sort_key < cursor_key
+            )
+        elif offset:
+            stmt = stmt.offset(offset)
+
+        stmt = stmt.order_by(None).order_by(
+            *(asc(field) if ascending else desc(field) for field in sort_fields)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+
+        return stmt
+
+    @classmethod
+    def _get_cursor_page(
+        cls,
+        models: list[ModelType],
+        sort_fields: Sequence[InstrumentedAttribute],
+        limit: int | None,
+    ) -> tuple[list[ModelType], str | None]:
+        """
+        Отбросить лишнюю сущность страницы и получить курсор следующей страницы.
+
+        Returns:
+            (models, next_cursor): модели страницы и курсор следующей страницы
+                или `None`, если страниц больше нет.
+        """
+
+        next_cursor = None
+        if limit is not None and len(models) > limit:
+            models = models[:limit]
+            next_cursor = utils.encode_cursor(
+                [getattr(models[-1], field.key) for field in sort_fields]
+            )
+
+        return models, next_cursor
 
     @classmethod
     async def get_all_non_scalars_with_pagination_from_stmt(
@@ -254,18 +798,189 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         cls,
         session: AsyncSession,
         data: list[dict[str, Any]],
-    ) -> list[ModelType]:
+        returning: BulkReturning = "model",
+        key_fields: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> list[Any] | None:
         """
         Обновить несколько записей в текущей сессии.
 
+        Записи обновляются запросами `UPDATE ... FROM (VALUES ...)` частями,
+        размер которых ограничен количеством параметров запроса.
+        Все записи должны содержать одинаковые поля.
+
+        Args:
+            session (AsyncSession): Сессия.
+            data (list[dict[str, Any]]): Поля записей вместе с ключевыми.
+            returning (BulkReturning): Возвращаемые данные: модели `model`,
+                первичные ключи `ids`, указанные столбцы или None.
+            key_fields (Sequence[str] | None): Поля, по которым находятся
+                записи, по умолчанию - первичный ключ.
+            chunk_size (int | None): Наибольшее количество записей
+                в одном запросе, по умолчанию - `BULK_INSERT_CHUNK_SIZE`.
+
         Returns:
-            list[ModelType](list[Base]): список обновленных  моделей.
+            list[Any] | None: Обновленные записи
+                или None, если `returning` равен None.
         """
 
-        stmt = update(cls.model).returning(cls.model)
-        result = await session.execute(stmt, data)
+        if not data:
+            return [] if returning is not None else None
+
+        started_at = time.perf_counter()
+
+        table = cls.model.__table__
+        key_fields = key_fields or [c.name for c in table.primary_key]
+        fields = list(data[0].keys())
+        size = cls._get_bulk_chunk_size(len(fields), chunk_size)
+
+        results = [] if returning is not None else None
+        chunks = 0
+        for start in range(0, len(data), size):
+            bulk_data = values(
+                *[column(field, table.c[field].type) for field in fields],
+                name="bulk_data",
+            ).data(
+                [
+                    tuple(row[field] for field in fields)
+                    for row in data[start : start + size]
+                ]
+            )
+            stmt = (
+                update(cls.model)
+                .where(*[table.c[field] == bulk_data.c[field] for field in key_fields])
+                .values(
+                    {
+                        field: bulk_data.c[field]
+                        for field in fields
+                        if field not in key_fields
+                    }
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+            chunks += 1
+            chunk = await cls._execute_bulk(session, stmt, returning)
+            if results is not None:
+                results.extend(chunk)
+
+        bulk_write_stats.record(
+            cls.model.__tablename__,
+            "update",
+            rows=len(data),
+            chunks=chunks,
+            seconds=time.perf_counter() - started_at,
+        )
+
+        return results
 
-        return result.unique().scalars().all()
+    # MARK: Bulk
+    @classmethod
+    def _get_bulk_chunk_size(cls, columns: int, chunk_size: int | None) -> int:
+        """
+        Получить количество записей в одном запросе так, чтобы количество
+        параметров не превышало `MAX_QUERY_PARAMETERS`.
+
+        Args:
+            columns (int): Количество параметров одной записи.
+            chunk_size (int | None): Желаемое количество записей.
+
+        Returns:
+            int: Количество записей в одном запросе.
+        """
+
+        return max(
+            1,
+            min(
+                chunk_size or constants.BULK_INSERT_CHUNK_SIZE,
+                constants.MAX_QUERY_PARAMETERS // max(columns, 1),
+            ),
+        )
+
+    @classmethod
+    async def _execute_bulk(
+        cls,
+        session: AsyncSession,
+        stmt: Insert | Update,
+        returning: BulkReturning,
+    ) -> list[Any]:
+        """
+        Выполнить запрос массовой записи с RETURNING, заданным `returning`.
+
+        Returns:
+            list[Any]: Модели, первичные ключи или строки
+                в зависимости от `returning`.
+        """
+
+        if returning is None:
+            await session.execute(stmt)
+            return []
+
+        if returning == "model":
+            result = await session.execute(stmt.returning(cls.model))
+            return result.unique().scalars().all()
+
+        if returning == "ids":
+            primary_key = list(cls.model.__table__.primary_key)
+            result = await session.execute(stmt.returning(*primary_key))
+            return result.scalars().all() if len(primary_key) == 1 else result.all()
+
+        result = await session.execute(stmt.returning(*returning))
+        return result.all()
+
+    @classmethod
+    async def _copy_records(
+        cls,
+        session: AsyncSession,
+        data: list[dict[str, Any]],
+    ) -> bool:
+        """
+        Загрузить записи в транзакции сессии через `COPY`.
+
+        `COPY` вычисляет только значения по умолчанию БД, поэтому
+        отсутствующие поля заполняются скалярными и вызываемыми значениями
+        по умолчанию столбцов SQLAlchemy для каждой записи.
+
+        Returns:
+            bool: Загружены ли записи. False, если отсутствующее поле
+                нельзя заполнить, и записи нужно добавить через `INSERT`.
+        """
+
+        table = cls.model.__table__
+        names = list(dict.fromkeys(name for row in data for name in row))
+
+        defaults = {}
+        for table_column in table.columns:
+            default = table_column.default
+            if table_column.name in names or default is None:
+                continue
+            if not (default.is_scalar or default.is_callable):
+                return False
+            defaults[table_column.name] = default
+
+        def get_records() -> Iterator[tuple]:
+            for row in data:
+                yield tuple(row.get(name) for name in names) + tuple(
+                    default.arg if default.is_scalar else default.arg(None)
+                    for default in defaults.values()
+                )
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        # Транзакция сессии начинается при первом запросе
+        if not driver_connection.is_in_transaction():
+            await connection.execute(select(literal(1)))
+
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=get_records(),
+            columns=[*names, *defaults],
+            schema_name=table.schema,
+        )
+
+        return True
 
     # MARK: Delete
     @classmethod
@@ -301,8 +1016,11 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .filter(*filter)
             .filter_by(**filter_by)
         )
-        result = await session.execute(stmt)
-        rows_count = result.scalar()
+        rows_count = await cls._execute_read(
+            session,
+            stmt,
+            lambda result: result.scalar(),
+        )
         if rows_count is None:
             return 0
         return rows_count
@@ -316,23 +1034,37 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         **filter_by,
     ) -> int:
         """
-        Посчитать строки в БД, соответствующий критериям. с использованием ilike.
+        Посчитать строки в БД, найденные `find_all_ilike`.
 
         Returns:
             rows_count: количество найденных строк или 0 если совпадений не найдено.
         """
 
-        stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
+        stmt = (
+            select(func.count())
+            .select_from(cls.model)
+            .filter(*filter)
+            .filter_by(**filter_by)
+        )
 
         if search_fields:
-            search_conditions = []
-            for field, value in search_fields.items():
-                search_conditions.append(getattr(cls.model, field).ilike(f"%{value}%"))
-            if search_conditions:
-                stmt = stmt.filter(or_(*search_conditions))
+            stmt = stmt.filter(
+                search.get_search_any_condition(
+                    {
+                        getattr(cls.model, field): str(value)
+                        for field, value in search_fields.items()
+                    }
+                )
+            )
 
-        result = await session.execute(stmt)
-        return len(result.unique().scalars().all())
+        rows_count = await cls._execute_read(
+            session,
+            stmt,
+            lambda result: result.scalar(),
+        )
+        if rows_count is None:
+            return 0
+        return rows_count
 
     @classmethod
     async def count_subquery(
@@ -349,10 +1081,102 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
 
         count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_count_result = await session.execute(count_stmt)
-        total_count = total_count_result.scalar()
+        total_count = await cls._execute_read(
+            session,
+            count_stmt,
+            lambda result: result.scalar(),
+        )
 
         if total_count is None:
             return 0
 
         return total_count
+
+    @classmethod
+    async def count_from_stmt(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[ModelType]],
+        strategy: constants.CountStrategy = "exact",
+    ) -> tuple[int, constants.CountAccuracy]:
+        """
+        Посчитать сущности финального выражения для запроса в БД
+        по стратегии `strategy`.
+
+        - `exact` и `window`: точное количество через `COUNT(*)`.
+        - `capped`: точное количество, но не больше `DB_COUNT_CAP`.
+            При большем количестве возвращается `DB_COUNT_CAP`
+            как нижняя граница, а подсчет останавливается.
+        - `estimated`: оценка по `pg_class.reltuples` для запроса
+            без фильтрации или по плану запроса `EXPLAIN`.
+            Если оценка меньше `DB_COUNT_ESTIMATE_THRESHOLD`,
+            количество считается точно.
+
+        Returns:
+            (count, count_accuracy): количество сущностей и его точность.
+        """
+
+        stmt = stmt.order_by(None)
+
+        if strategy == "capped":
+            capped_stmt = select(func.count()).select_from(
+                stmt.limit(settings.DB_COUNT_CAP + 1).subquery()
+            )
+            count = await cls._execute_read(
+                session,
+                capped_stmt,
+                lambda result: result.scalar(),
+            )
+            if count > settings.DB_COUNT_CAP:
+                return settings.DB_COUNT_CAP, "at_least"
+            return count, "exact"
+
+        if strategy == "estimated":
+            count = await cls._estimate_count(session, stmt)
+            if count is not None and count >= settings.DB_COUNT_ESTIMATE_THRESHOLD:
+                return count, "estimated"
+
+        return await cls.count_subquery(session, stmt), "exact"
+
+    @classmethod
+    async def _estimate_count(
+        cls,
+        session: AsyncSession,
+        stmt: Select[Tuple[ModelType]],
+    ) -> int | None:
+        """
+        Оценить количество строк запроса без его выполнения.
+
+        Для запроса ко всей таблице используется `pg_class.reltuples`,
+        обновляемое `VACUUM` и `ANALYZE`, для остальных - оценка
+        количества строк из плана запроса.
+
+        Returns:
+            int | None: Оценка количества строк или None,
+                если статистика таблицы еще не собрана.
+        """
+
+        table = cls.model.__table__
+        if stmt.whereclause is None and stmt.get_final_froms() == [table]:
+            reltuples_stmt = text(
+                "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"
+            ).bindparams(name=table.fullname)
+            reltuples = await cls._execute_read(
+                session,
+                reltuples_stmt,
+                lambda result: result.scalar(),
+            )
+            # -1 - таблица еще не анализировалась
+            if reltuples is None or reltuples < 0:
+                return None
+            return int(reltuples)
+
+        plan = await cls._execute_read(
+            session,
+            Explain(stmt),
+            lambda result: result.scalar(),
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
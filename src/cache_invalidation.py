@@ -0,0 +1,197 @@
+"""Модуль для шины сброса кэшей между процессами через Postgres LISTEN/NOTIFY."""
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any, Callable
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import get_asyncpg_dsn
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Обработчик события: ID сущности и ее версия. ID None означает,
+# что события могли быть пропущены и кэш нужно сбросить полностью.
+InvalidationHandler = Callable[[str | None, int | None], None]
+
+NOTIFY_QUERY = text("SELECT pg_notify(:channel, :payload)")
+
+
+class CacheInvalidationBus:
+    """
+    Шина событий изменения данных для сброса кэшей в других процессах.
+
+    События `(сущность, id, версия)` публикуются через `pg_notify`
+    в транзакции, изменяющей данные, поэтому доставляются только после
+    коммита и не доставляются при откате. Каждый процесс держит отдельное
+    соединение с `LISTEN` и передает полученные события обработчикам
+    сущности. События своего процесса пропускаются, так как его кэши
+    сбрасываются сразу при изменении.
+
+    После потери соединения события могли быть пропущены, поэтому при
+    переподключении обработчики получают сброс всего кэша.
+    """
+
+    def __init__(self, channel: str, reconnect_seconds: float):
+        """
+        Args:
+            channel (str): Канал `LISTEN/NOTIFY`.
+            reconnect_seconds (float): Пауза перед переподключением.
+        """
+
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self.origin = uuid.uuid4().hex[:12]
+
+        self.published_total = 0
+        self.received_total = 0
+        self.reconnects_total = 0
+
+        self._handlers: dict[str, list[InvalidationHandler]] = defaultdict(list)
+        self._connection: asyncpg.Connection | None = None
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, entity: str, handler: InvalidationHandler) -> None:
+        """
+        Подписать обработчик на события сущности.
+
+        Args:
+            entity (str): Название сущности, например `user`.
+            handler (InvalidationHandler): Обработчик события.
+        """
+
+        self._handlers[entity].append(handler)
+
+    # MARK: Publish
+    async def publish(
+        self,
+        session: AsyncSession,
+        entity: str,
+        ids: list[Any],
+        version: int | None = None,
+    ) -> None:
+        """
+        Опубликовать изменение сущностей в транзакции сессии.
+
+        События доставляются другим процессам после коммита сессии.
+
+        Args:
+            session (AsyncSession): Сессия, в которой изменены данные.
+            entity (str): Название сущности.
+            ids (list[Any]): ID измененных сущностей.
+            version (int | None): Новая версия сущностей, если известна.
+        """
+
+        if not settings.CACHE_INVALIDATION_ENABLED or not ids:
+            return
+
+        await session.execute(
+            NOTIFY_QUERY,
+            [
+                {
+                    "channel": self.channel,
+                    "payload": "|".join(
+                        (
+                            self.origin,
+                            entity,
+                            "" if version is None else str(version),
+                            str(id),
+                        )
+                    ),
+                }
+                for id in ids
+            ],
+        )
+        self.published_total += len(ids)
+
+    # MARK: Listen
+    def start(self) -> None:
+        """Запустить прослушивание событий."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить прослушивание событий и закрыть соединение."""
+
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        """Держать соединение с `LISTEN`, переподключаясь при ошибках."""
+
+        dsn = get_asyncpg_dsn()
+
+        while True:
+            try:
+                self._connection = await asyncpg.connect(dsn)
+                await self._connection.add_listener(self.channel, self._on_notify)
+
+                # События, опубликованные до подписки, могли быть пропущены
+                self._dispatch_reset()
+
+                # Событие привязывается к соединению: поздний вызов слушателя
+                # прежнего соединения не должен закрыть новое
+                closed = asyncio.Event()
+                self._connection.add_termination_listener(
+                    lambda _, closed=closed: closed.set()
+                )
+                await closed.wait()
+
+            except Exception:
+                logger.exception("Cache invalidation listener failed, reconnecting")
+
+            finally:
+                if self._connection is not None:
+                    self._connection.terminate()
+                self._connection = None
+
+            self.reconnects_total += 1
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        """Передать полученное событие обработчикам сущности."""
+
+        origin, entity, version, id = payload.split("|", 3)
+        if origin == self.origin:
+            return
+
+        self.received_total += 1
+        for handler in self._handlers.get(entity, []):
+            handler(id, int(version) if version else None)
+
+    def _dispatch_reset(self) -> None:
+        """Сбросить кэши всех сущностей полностью."""
+
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler(None, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики шины.
+
+        Returns:
+            dict[str, Any]: Метрики шины.
+        """
+
+        return {
+            "is_connected": self._connection is not None
+            and not self._connection.is_closed(),
+            "published_total": self.published_total,
+            "received_total": self.received_total,
+            "reconnects_total": self.reconnects_total,
+        }
+
+
+cache_invalidation_bus = CacheInvalidationBus(
+    channel=settings.CACHE_INVALIDATION_CHANNEL,
+    reconnect_seconds=settings.CACHE_INVALIDATION_RECONNECT_SECONDS,
+)
@@ -1,10 +1,14 @@
 """Модуль для констант."""
 
+from typing import Literal
+
 from sqlalchemy import TextClause, text
 
 # MARK: Security
 AUTH_HEADER_NAME: str = "X-Authorization"
 ALGORITHM: str = "HS256"
+JWT_IS_ADMIN_CLAIM: str = "is_admin"
+JWT_TOKEN_VERSION_CLAIM: str = "ver"
 
 CORS_HEADERS: list[str] = [
     "Content-Type",
@@ -33,3 +37,20 @@ DB_NAMING_CONVENTION = {
 CURRENT_TIMESTAMP_UTC: TextClause = text("(CURRENT_TIMESTAMP AT TIME ZONE 'UTC')")
 DEFAULT_QUERY_OFFSET: int = 0
 DEFAULT_QUERY_LIMIT: int = 100
+MAX_QUERY_LIMIT: int = 1000
+BULK_INSERT_CHUNK_SIZE: int = 1000
+# Наибольшее количество параметров запроса в протоколе Postgres
+MAX_QUERY_PARAMETERS: int = 32767
+# Стратегии подсчета общего количества строк списка
+CountStrategy = Literal["exact", "window", "estimated", "capped"]
+# Точность количества строк: точное, оценка или нижняя граница
+CountAccuracy = Literal["exact", "estimated", "at_least"]
+# Наименьшая длина подстроки, для поиска которой применим индекс pg_trgm
+SEARCH_TRIGRAM_MIN_LENGTH: int = 3
+
+# MARK: Accounts
+# Ключ advisory-блокировки, под которой создаются контрольные точки балансов
+ACCOUNT_BALANCE_CHECKPOINT_LOCK_ID: int = 5_218_403_917
+
+# MARK: Transactions
+MAX_TRANSACTION_BATCH_SIZE: int = 10000
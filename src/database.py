@@ -1,16 +1,28 @@
 """Модуль конфигурации базы данных."""
 
-from sqlalchemy import MetaData, NullPool
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, AsyncContextManager, Callable
+
+from sqlalchemy import AsyncAdaptedQueuePool, MetaData, NullPool, text
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import PoolProxiedConnection
 
 from src.settings import settings
 
+logger = logging.getLogger(__name__)
+
 DB_NAMING_CONVENTION = {
     "ix": "%(column_0_label)s_idx",
     "uq": "%(table_name)s_%(column_0_name)s_key",
@@ -31,16 +43,325 @@ class Base(AsyncAttrs, DeclarativeBase):
     metadata = MetaData(naming_convention=DB_NAMING_CONVENTION)
 
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    poolclass=NullPool,
-    pool_pre_ping=True,
+# Ошибки, означающие недоступность или перегрузку БД, а не ошибку запроса
+DATABASE_UNAVAILABLE_ERRORS = (
+    OperationalError,
+    InterfaceError,
+    PoolTimeoutError,
+    OSError,
 )
 
-SessionLocal = async_sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-    class_=AsyncSession,
+
+# MARK: Pool
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Асинхронный пул соединений, собирающий статистику
+    ожидания и получения соединений из пула.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.waiting = 0
+        self.acquired_total = 0
+        self.acquire_timeouts_total = 0
+        self.acquire_seconds_total = 0.0
+        self.acquire_seconds_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Получить соединение из пула, учитывая количество ожидающих
+        и время ожидания соединения.
+        """
+
+        self.waiting += 1
+        started_at = time.perf_counter()
+
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.acquire_timeouts_total += 1
+            raise
+        finally:
+            self.waiting -= 1
+
+        elapsed = time.perf_counter() - started_at
+        self.acquired_total += 1
+        self.acquire_seconds_total += elapsed
+        self.acquire_seconds_max = max(self.acquire_seconds_max, elapsed)
+
+        return connection
+
+
+def create_database_engine(url: str) -> AsyncEngine:
+    """
+    Создать `AsyncEngine` с пулом соединений, настроенным через `Settings`.
+
+    При `DB_POOL_MODE=null` используется `NullPool`, что подходит для тестов
+    и работы через внешний пулер соединений (например, PgBouncer).
+
+    Args:
+        url (str): URL-адрес базы данных.
+
+    Returns:
+        AsyncEngine: движок базы данных.
+    """
+
+    if settings.DB_POOL_MODE == "null":
+        return create_async_engine(
+            url,
+            poolclass=NullPool,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    )
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """
+    Получить текущую статистику пула соединений движка.
+
+    Для `NullPool` счетчики пула не ведутся и равны нулю.
+
+    Args:
+        engine (AsyncEngine): движок базы данных.
+
+    Returns:
+        dict[str, Any]: статистика пула соединений.
+    """
+
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        return {"mode": "null"}
+
+    acquire_seconds_avg = (
+        pool.acquire_seconds_total / pool.acquired_total if pool.acquired_total else 0.0
+    )
+
+    return {
+        "mode": "queue",
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "waiting": pool.waiting,
+        "acquired_total": pool.acquired_total,
+        "acquire_timeouts_total": pool.acquire_timeouts_total,
+        "acquire_seconds_avg": acquire_seconds_avg,
+        "acquire_seconds_max": pool.acquire_seconds_max,
+    }
+
+
+def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Создать фабрику сессий для движка базы данных.
+
+    Args:
+        engine (AsyncEngine): движок базы данных.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: фабрика сессий.
+    """
+
+    return async_sessionmaker(
+        bind=engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+
+# MARK: Replicas
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+class Replica:
+    """Реплика БД для чтения и ее последнее известное состояние."""
+
+    def __init__(self, url: str):
+        self.engine = create_database_engine(url)
+        self.session_factory = create_sessionmaker(self.engine)
+        self.host = self.engine.url.host
+        self.is_healthy = True
+        self.lag_seconds = 0.0
+        self.latency_seconds = 0.0
+
+    async def check_health(self) -> None:
+        """
+        Проверить доступность реплики, измерив задержку ответа
+        и отставание репликации.
+
+        Реплика считается недоступной, если не ответила за
+        `DB_REPLICA_HEALTHCHECK_TIMEOUT_SECONDS` или отстает больше,
+        чем на `DB_REPLICA_MAX_LAG_SECONDS`.
+        """
+
+        started_at = time.perf_counter()
+
+        try:
+            async with asyncio.timeout(settings.DB_REPLICA_HEALTHCHECK_TIMEOUT_SECONDS):
+                async with self.engine.connect() as conn:
+                    result = await conn.execute(REPLICA_LAG_QUERY)
+                    self.lag_seconds = float(result.scalar() or 0)
+        except Exception:
+            self.is_healthy = False
+            return
+
+        self.latency_seconds = time.perf_counter() - started_at
+        self.is_healthy = self.lag_seconds <= settings.DB_REPLICA_MAX_LAG_SECONDS
+
+
+class ReplicaRouter:
+    """
+    Маршрутизатор запросов чтения между репликами БД.
+
+    Выбирает реплику по стратегии `DB_REPLICA_SELECTION` среди доступных
+    и возвращает фабрику сессий основной БД, если все реплики
+    недоступны, отстают или не настроены.
+
+    Состояние реплик проверяется фоновой задачей каждые
+    `DB_REPLICA_HEALTHCHECK_INTERVAL_SECONDS`, поэтому проверка
+    не задерживает запросы.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        primary_session_factory: async_sessionmaker[AsyncSession],
+    ):
+        self.replicas = [Replica(url) for url in urls]
+        self.primary_session_factory = primary_session_factory
+        self._round_robin = itertools.count()
+        self._check_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    async def check_health(self) -> None:
+        """Проверить состояние всех реплик."""
+
+        async with self._check_lock:
+            await asyncio.gather(*(replica.check_health() for replica in self.replicas))
+
+    # MARK: Lifecycle
+    def start(self) -> None:
+        """Запустить периодическую проверку состояния реплик."""
+
+        if self.replicas and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить периодическую проверку состояния реплик."""
+
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        """Периодически проверять состояние реплик."""
+
+        while True:
+            try:
+                await self.check_health()
+            except Exception:
+                logger.exception("Failed to check database replicas")
+
+            await asyncio.sleep(settings.DB_REPLICA_HEALTHCHECK_INTERVAL_SECONDS)
+
+    # MARK: Route
+    def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """
+        Получить фабрику сессий для запросов чтения
+        по последнему известному состоянию реплик.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: фабрика сессий реплики или основной БД.
+        """
+
+        if not self.replicas:
+            return self.primary_session_factory
+
+        healthy = [replica for replica in self.replicas if replica.is_healthy]
+        if not healthy:
+            return self.primary_session_factory
+
+        if settings.DB_REPLICA_SELECTION == "least_latency":
+            replica = min(healthy, key=lambda replica: replica.latency_seconds)
+        else:
+            replica = healthy[next(self._round_robin) % len(healthy)]
+
+        return replica.session_factory
+
+    def mark_unhealthy(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Пометить реплику недоступной до следующей проверки состояния.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]):
+                фабрика сессий реплики, при работе с которой возникла ошибка.
+        """
+
+        for replica in self.replicas:
+            if replica.session_factory is session_factory:
+                replica.is_healthy = False
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """
+        Получить последнее известное состояние реплик.
+
+        Returns:
+            list[dict[str, Any]]: состояние каждой реплики.
+        """
+
+        return [
+            {
+                "host": replica.host,
+                "is_healthy": replica.is_healthy,
+                "lag_seconds": replica.lag_seconds,
+                "latency_seconds": replica.latency_seconds,
+            }
+            for replica in self.replicas
+        ]
+
+
+# MARK: Session
+engine = create_database_engine(settings.DATABASE_URL)
+
+SessionLocal = create_sessionmaker(engine)
+
+# Фабрика сессий, открываемых как асинхронный контекстный менеджер
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+replica_router = ReplicaRouter(
+    urls=settings.REPLICA_DATABASE_URLS,
+    primary_session_factory=SessionLocal,
 )
+
+
+def get_asyncpg_dsn() -> str:
+    """
+    Получить DSN основной БД для соединений `asyncpg` без SQLAlchemy,
+    например для `LISTEN` или `COPY`.
+
+    Returns:
+        str: DSN в формате `postgresql://`.
+    """
+
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
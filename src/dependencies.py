@@ -1,19 +1,25 @@
 """Зависимости эндпоинтов API."""
 
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-import jwt
 from fastapi import Depends
 from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.exceptions as exceptions
+import src.users.schemas as user_schemas
 from src import constants
+from src.auth.services import JWTService
 from src.constants import AUTH_HEADER_NAME
-from src.database import SessionLocal
+from src.database import (
+    DATABASE_UNAVAILABLE_ERRORS,
+    SessionFactory,
+    SessionLocal,
+    replica_router,
+)
 from src.settings import settings
-from src.users.models.user_model import UserModel
-from src.users.repositories.user_repository import UserRepository
+from src.users.services import UserCacheService
 
 oauth2_scheme = APIKeyHeader(name=AUTH_HEADER_NAME, auto_error=False)
 
@@ -37,16 +43,78 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise ex
 
 
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    AsyncGenerator экземпляра `AsyncSession` для запросов только на чтение.
+
+    Сессия открывается на одной из доступных реплик БД,
+    а при их отсутствии или недоступности — на основной БД.
+    Реплика, при работе с которой возникла ошибка недоступности БД,
+    исключается из выборки до следующей проверки состояния. Ошибки
+    запроса, например ошибки данных, реплику не исключают.
+    Одинаковые параллельные запросы репозиториев в таких сессиях
+    объединяются в один.
+
+    **Сессия не должна использоваться для изменения данных.**
+    """
+
+    session_factory = replica_router.get_session_factory()
+
+    async with session_factory() as session:
+        session.info["read_only"] = True
+        try:
+            yield session
+        except Exception as ex:
+            if isinstance(ex, DATABASE_UNAVAILABLE_ERRORS):
+                replica_router.mark_unhealthy(session_factory)
+            await session.rollback()
+            raise ex
+
+
+async def get_read_session_factory() -> SessionFactory:
+    """
+    Фабрика сессий только для чтения, как в `get_read_session`.
+
+    Используется, когда сессия нужна после завершения зависимостей,
+    например в генераторе тела `StreamingResponse`: сессия зависимости
+    закрывается до отправки тела ответа.
+    """
+
+    session_factory = replica_router.get_session_factory()
+
+    @asynccontextmanager
+    async def open_session() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            session.info["read_only"] = True
+            try:
+                yield session
+            except Exception as ex:
+                if isinstance(ex, DATABASE_UNAVAILABLE_ERRORS):
+                    replica_router.mark_unhealthy(session_factory)
+                await session.rollback()
+                raise ex
+
+    return open_session
+
+
 # MARK: Auth
 async def get_current_user(
     header_value: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session),
-) -> UserModel:
+) -> user_schemas.UserIdentitySchema:
     """
-    Вернуть текущего пользователя, если передан верный `access_token`.
+    Вернуть данные текущего пользователя, если передан верный `access_token`.
+
+    Данные пользователя берутся из кэша `UserCacheService`,
+    поэтому запрос в БД выполняется только при промахе кэша.
+    Промах читается из основной БД, а не из реплики: данные реплики
+    могут отставать и после сброса кэша попали бы в кэш на время его жизни,
+    отменяя отзыв токенов или изменение роли.
+    При `JWT_STATELESS_AUTH` роль пользователя берется из утверждений
+    токена, а из кэша или БД читается только версия токенов.
 
     Returns:
-        UserModel: модель пользователя.
+        UserIdentitySchema: данные пользователя для авторизации.
 
     Raises:
         InvalidTokenException: Невалидный токен `HTTP_401_UNAUTHORIZED`.
@@ -56,40 +124,44 @@ async def get_current_user(
 
     token = header_value.removeprefix("Bearer ")
 
-    try:
-        payload = jwt.decode(
-            jwt=token,
-            key=settings.JWT_ACCESS_SECRET,
-            algorithms=[constants.ALGORITHM],
-        )
-        user_id = payload.get("id")
-        if not user_id:
-            raise exceptions.InvalidTokenException
-    except Exception as e:
-        if isinstance(e, jwt.ExpiredSignatureError):
-            raise exceptions.TokenExpiredException
-        else:
+    payload = JWTService.decode_token(token=token, token_type="access_token")
+    user_id = payload["id"]
+    token_version = payload.get(constants.JWT_TOKEN_VERSION_CLAIM)
+
+    if settings.JWT_STATELESS_AUTH:
+        # Роль берется из утверждений токена, а для отзыва токенов
+        # проверяется только версия токенов пользователя
+        is_admin = payload.get(constants.JWT_IS_ADMIN_CLAIM)
+        if not isinstance(is_admin, bool) or not isinstance(token_version, int):
             raise exceptions.InvalidTokenException
 
-    user_db = await UserRepository.find_one_or_none(
-        session=session,
-        id=user_id,
-    )
+        current_token_version = await UserCacheService.get_token_version(
+            session=session,
+            user_id=user_id,
+        )
+        user = user_schemas.UserIdentitySchema(
+            id=user_id,
+            is_admin=is_admin,
+            token_version=current_token_version,
+        )
+    else:
+        user = await UserCacheService.get_identity(session=session, user_id=user_id)
 
-    if user_db is None:
-        raise exceptions.UserNotFoundException
+    # Токены, выданные до отзыва, недействительны
+    if token_version is not None and token_version != user.token_version:
+        raise exceptions.InvalidTokenException
 
-    return user_db
+    return user
 
 
 async def get_current_admin(
-    user: UserModel = Depends(get_current_user),
-) -> UserModel:
+    user: user_schemas.UserIdentitySchema = Depends(get_current_user),
+) -> user_schemas.UserIdentitySchema:
     """
     Проверяет, является ли пользователь администратором.
 
     Returns:
-        UserModel: модель пользователя.
+        UserIdentitySchema: данные пользователя для авторизации.
 
     Raises:
         InvalidTokenException: Невалидный токен `HTTP_401_UNAUTHORIZED`.
@@ -106,14 +178,14 @@ async def get_current_admin(
 async def get_current_user_or_none(
     header_value: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session),
-) -> UserModel | None:
+) -> user_schemas.UserIdentitySchema | None:
     """
-    Вернуть текущего пользователя, если передан `access_token`
+    Вернуть данные текущего пользователя, если передан `access_token`
     или None, если `access_token` не был передан в заголовке.
     Используется для опциональной авторизации.
 
     Returns:
-        UserModel|None: модель пользователя или None.
+        UserIdentitySchema|None: данные пользователя для авторизации или None.
 
     Raises:
         InvalidTokenException: Невалидный токен `HTTP_401_UNAUTHORIZED`.
@@ -80,6 +80,32 @@ class BaseForbiddenException(HTTPException):
         )
 
 
+class BaseServiceUnavailableException(HTTPException):
+    """
+    Основной класс исключений при временной недоступности сервиса.
+
+    Код ответа - `HTTP_503_SERVICE_UNAVAILABLE`.
+    """
+
+    default_message = "Сервис временно недоступен."
+    retry_after_seconds = 1
+
+    def __init__(self):
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+        super().__init__(
+            status_code=status_code,
+            detail=self.default_message,
+            headers={"Retry-After": str(self.retry_after_seconds)},
+        )
+
+
+class InvalidCursorException(BaseBadRequestException):
+    """Исключение при некорректном курсоре пагинации."""
+
+    default_message = "Некорректный курсор пагинации."
+
+
 # MARK: Users
 class UserNotFoundException(BaseNotFoundException):
     """Исключение при отсутствии пользователя."""
@@ -146,3 +172,28 @@ class TransactionInvalidSignatureException(BaseBadRequestException):
     """Исключение при некорректной подписи транзакции."""
 
     default_message = "Некорректная подпись транзакции."
+
+
+class TransactionBatchTooLargeException(BaseBadRequestException):
+    """Исключение при превышении размера пакета транзакций."""
+
+    default_message = "Превышен максимальный размер пакета транзакций."
+
+
+class TransactionBatchInvalidPayloadException(BaseBadRequestException):
+    """Исключение при некорректной строке в NDJSON пакете транзакций."""
+
+    default_message = "Некорректная строка в пакете транзакций."
+
+
+class TransactionIngestQueueFullException(BaseServiceUnavailableException):
+    """Исключение при заполненной очереди приема транзакций."""
+
+    default_message = "Очередь приема транзакций заполнена."
+
+
+# MARK: Ledger
+class LedgerDumpNotFoundException(BaseNotFoundException):
+    """Исключение при отсутствии выгрузки реестра."""
+
+    default_message = "Выгрузка реестра не найдена."
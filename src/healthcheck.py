@@ -5,7 +5,12 @@ from typing import Literal
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
 
+from src.auth.services import JWTService
+from src.base_repository import bulk_write_stats, read_single_flight
+from src.cache_invalidation import cache_invalidation_bus
+from src.database import engine, get_pool_stats, replica_router
 from src.settings import settings
+from src.users.services import UserCacheService
 
 
 # MARK: Schema
@@ -26,6 +31,129 @@ class HealthCheckSchema(BaseModel):
     )
 
 
+class ReplicaStatsSchema(BaseModel):
+    """Схема ответа с состоянием реплики БД."""
+
+    host: str | None = Field(description="Хост реплики.")
+    is_healthy: bool = Field(description="Доступна ли реплика для чтения.")
+    lag_seconds: float = Field(description="Отставание репликации в секундах.")
+    latency_seconds: float = Field(
+        description="Время ответа на последнюю проверку состояния в секундах.",
+    )
+
+
+class DatabasePoolStatsSchema(BaseModel):
+    """Схема ответа со статистикой пула соединений с БД."""
+
+    mode: Literal["queue", "null"] = Field(
+        description="Режим пула соединений.",
+    )
+    size: int = Field(default=0, description="Размер пула.")
+    checked_in: int = Field(
+        default=0,
+        description="Количество свободных соединений в пуле.",
+    )
+    checked_out: int = Field(
+        default=0,
+        description="Количество выданных соединений.",
+    )
+    overflow: int = Field(
+        default=0,
+        description="Текущее количество соединений сверх размера пула.",
+    )
+    waiting: int = Field(
+        default=0,
+        description="Количество запросов, ожидающих соединение.",
+    )
+    acquired_total: int = Field(
+        default=0,
+        description="Общее количество выданных соединений.",
+    )
+    acquire_timeouts_total: int = Field(
+        default=0,
+        description="Количество превышений времени ожидания соединения.",
+    )
+    acquire_seconds_avg: float = Field(
+        default=0.0,
+        description="Среднее время получения соединения в секундах.",
+    )
+    acquire_seconds_max: float = Field(
+        default=0.0,
+        description="Максимальное время получения соединения в секундах.",
+    )
+    single_flight_calls_total: int = Field(
+        default=0,
+        description="Количество выполненных запросов на чтение с объединением.",
+    )
+    single_flight_shared_total: int = Field(
+        default=0,
+        description=(
+            "Количество запросов на чтение, получивших результат "
+            "такого же параллельного запроса."
+        ),
+    )
+    replicas: list[ReplicaStatsSchema] = Field(
+        default=[],
+        description="Последнее известное состояние реплик БД для чтения.",
+    )
+
+
+class CacheStatsSchema(BaseModel):
+    """Схема ответа со статистикой кэша в памяти процесса."""
+
+    size: int = Field(description="Количество значений в кэше.")
+    max_size: int = Field(description="Максимальное количество значений в кэше.")
+    hits: int = Field(description="Количество попаданий в кэш.")
+    misses: int = Field(description="Количество промахов кэша.")
+
+
+class CacheInvalidationStatsSchema(BaseModel):
+    """Схема ответа со статистикой шины сброса кэшей."""
+
+    is_connected: bool = Field(
+        description="Установлено ли соединение для получения событий.",
+    )
+    published_total: int = Field(description="Количество опубликованных событий.")
+    received_total: int = Field(
+        description="Количество полученных событий других процессов.",
+    )
+    reconnects_total: int = Field(description="Количество переподключений.")
+
+
+class CachesStatsSchema(BaseModel):
+    """Схема ответа со статистикой кэшей процесса."""
+
+    users: CacheStatsSchema = Field(
+        description="Кэш данных пользователей для авторизации.",
+    )
+    user_token_versions: CacheStatsSchema = Field(
+        description="Кэш версий токенов пользователей.",
+    )
+    jwt: CacheStatsSchema = Field(
+        description="Кэш декодированных JWT.",
+    )
+    invalidation: CacheInvalidationStatsSchema = Field(
+        description="Шина сброса кэшей между процессами.",
+    )
+
+
+class BulkWriteStatsSchema(BaseModel):
+    """Схема ответа со статистикой массовой записи в таблицу."""
+
+    name: str = Field(description="Название таблицы.")
+    operation: Literal["insert", "upsert", "update", "copy"] = Field(
+        description="Операция массовой записи.",
+    )
+    calls_total: int = Field(description="Количество вызовов.")
+    rows_total: int = Field(description="Количество записанных строк.")
+    chunks_total: int = Field(description="Количество выполненных запросов.")
+    seconds_total: float = Field(description="Общее время записи в секундах.")
+    last_rows: int = Field(description="Количество строк последнего вызова.")
+    last_rows_per_second: float = Field(
+        description="Скорость записи последнего вызова в строках в секунду.",
+    )
+
+
 # MARK: Router
 health_check_router = APIRouter(prefix="/health_check", tags=["Health Check"])
 
@@ -39,3 +167,47 @@ async def health_check() -> HealthCheckSchema:
     """Проверить состояние работы API."""
 
     return HealthCheckSchema()
+
+
+@health_check_router.get(
+    path="/database",
+    summary="Получить статистику пула соединений с БД",
+    status_code=status.HTTP_200_OK,
+)
+async def database_pool_stats() -> DatabasePoolStatsSchema:
+    """Получить статистику пула соединений с БД и состояние реплик."""
+
+    single_flight_stats = read_single_flight.get_stats()
+
+    return DatabasePoolStatsSchema(
+        **get_pool_stats(engine),
+        single_flight_calls_total=single_flight_stats["calls_total"],
+        single_flight_shared_total=single_flight_stats["shared_total"],
+        replicas=replica_router.get_stats(),
+    )
+
+
+@health_check_router.get(
+    path="/caches",
+    summary="Получить статистику кэшей процесса",
+    status_code=status.HTTP_200_OK,
+)
+async def caches_stats() -> CachesStatsSchema:
+    """Получить статистику кэшей процесса."""
+
+    return CachesStatsSchema(
+        **UserCacheService.get_stats(),
+        jwt=JWTService.get_stats(),
+        invalidation=cache_invalidation_bus.get_stats(),
+    )
+
+
+@health_check_router.get(
+    path="/bulk_writes",
+    summary="Получить статистику массовой записи процесса",
+    status_code=status.HTTP_200_OK,
+)
+async def bulk_writes_stats() -> list[BulkWriteStatsSchema]:
+    """Получить статистику массовой записи в таблицы БД процесса."""
+
+    return [BulkWriteStatsSchema(**stats) for stats in bulk_write_stats.get_stats()]
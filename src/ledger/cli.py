@@ -0,0 +1,87 @@
+"""
+Консольная утилита для выгрузки и восстановления реестра.
+
+Примеры:
+    python -m src.ledger.cli dump --format csv
+    python -m src.ledger.cli restore ledger/20261016T120000000000Z --truncate
+"""
+
+import argparse
+import asyncio
+import sys
+
+from pydantic import ValidationError
+
+from src.ledger.services import LedgerService
+from src.settings import settings
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Выполнить команду утилиты и вывести манифест выгрузки.
+
+    Returns:
+        int: Код завершения.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Выгрузка и восстановление реестра через COPY.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    dump_parser = commands.add_parser("dump", help="Выгрузить реестр.")
+    dump_parser.add_argument(
+        "--dir",
+        default=settings.LEDGER_DUMP_DIR,
+        help="Директория выгрузок.",
+    )
+    dump_parser.add_argument(
+        "--format",
+        choices=["binary", "csv"],
+        default=settings.LEDGER_DUMP_FORMAT,
+        help="Формат COPY.",
+    )
+
+    restore_parser = commands.add_parser("restore", help="Восстановить реестр.")
+    restore_parser.add_argument("path", help="Директория выгрузки.")
+    restore_parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Очистить таблицы реестра перед восстановлением.",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "dump":
+        service = LedgerService(
+            directory=args.dir,
+            format=args.format,
+            chunk_bytes=settings.LEDGER_DUMP_CHUNK_BYTES,
+            compression_level=settings.LEDGER_DUMP_COMPRESSION_LEVEL,
+        )
+        manifest = asyncio.run(service.dump())
+    else:
+        service = LedgerService(
+            directory=settings.LEDGER_DUMP_DIR,
+            format=settings.LEDGER_DUMP_FORMAT,
+            chunk_bytes=settings.LEDGER_DUMP_CHUNK_BYTES,
+            compression_level=settings.LEDGER_DUMP_COMPRESSION_LEVEL,
+        )
+        try:
+            manifest = asyncio.run(service.restore(args.path, truncate=args.truncate))
+        except FileNotFoundError as ex:
+            print(f"{ex.strerror}: {ex.filename}", file=sys.stderr)
+            return 1
+        except ValidationError as ex:
+            print(f"Некорректный манифест выгрузки: {ex}", file=sys.stderr)
+            return 1
+        except ValueError as ex:
+            print(ex, file=sys.stderr)
+            return 1
+
+    print(manifest.model_dump_json(indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
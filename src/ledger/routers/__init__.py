@@ -0,0 +1,3 @@
+from src.ledger.routers.ledger_router import ledger_router
+
+__all__ = ("ledger_router",)
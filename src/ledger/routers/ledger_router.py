@@ -0,0 +1,39 @@
+"""Модуль для роутера выгрузок реестра."""
+
+from fastapi import APIRouter, Depends, status
+
+import src.ledger.schemas as ledger_schemas
+from src import dependencies
+from src.ledger.services import ledger_service
+
+ledger_router = APIRouter(
+    prefix="/ledger",
+    tags=["ledger"],
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+
+
+@ledger_router.post(path="/dumps", status_code=status.HTTP_202_ACCEPTED)
+async def create_ledger_dump_route() -> ledger_schemas.LedgerDumpStatusSchema:
+    """
+    Запустить выгрузку пользователей, аккаунтов и транзакций
+    через `COPY` в сжатые файлы с манифестом.
+
+    Выгрузка выполняется в фоне, ее состояние возвращается
+    по названию выгрузки.
+
+    Доступно только администратору.
+    """
+
+    return ledger_service.start_dump()
+
+
+@ledger_router.get(path="/dumps/{name}")
+async def get_ledger_dump_route(name: str) -> ledger_schemas.LedgerDumpStatusSchema:
+    """
+    Получить состояние выгрузки реестра и ее манифест.
+
+    Доступно только администратору.
+    """
+
+    return await ledger_service.get_dump(name)
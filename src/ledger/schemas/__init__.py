@@ -0,0 +1,13 @@
+from src.ledger.schemas.ledger_schema import (
+    LedgerChunkSchema,
+    LedgerDumpStatusSchema,
+    LedgerManifestSchema,
+    LedgerTableSchema,
+)
+
+__all__ = (
+    "LedgerChunkSchema",
+    "LedgerDumpStatusSchema",
+    "LedgerManifestSchema",
+    "LedgerTableSchema",
+)
@@ -0,0 +1,58 @@
+"""Модуль для Pydantic схем выгрузки реестра."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+# MARK: Manifest
+class LedgerChunkSchema(BaseModel):
+    """Pydantic схема части выгрузки таблицы."""
+
+    file: str = Field(description="Имя сжатого файла части.")
+    size: int = Field(description="Размер данных части до сжатия в байтах.")
+    compressed_size: int = Field(description="Размер файла части в байтах.")
+    sha256: str = Field(description="SHA-256 файла части.")
+
+
+class LedgerTableSchema(BaseModel):
+    """Pydantic схема выгрузки таблицы."""
+
+    name: str = Field(description="Название таблицы.")
+    columns: list[str] = Field(description="Колонки в порядке выгрузки.")
+    rows: int = Field(description="Количество выгруженных строк.")
+    chunks: list[LedgerChunkSchema] = Field(
+        description="Части выгрузки. Данные таблицы - их последовательное "
+        "объединение после распаковки.",
+    )
+
+
+class LedgerManifestSchema(BaseModel):
+    """Pydantic схема манифеста выгрузки реестра."""
+
+    version: int = Field(description="Версия формата манифеста.")
+    name: str = Field(description="Название выгрузки.")
+    created_at: datetime = Field(description="Дата создания выгрузки.")
+    format: Literal["binary", "csv"] = Field(description="Формат `COPY`.")
+    compression: Literal["gzip"] = Field(description="Сжатие файлов частей.")
+    tables: list[LedgerTableSchema] = Field(
+        description="Таблицы в порядке восстановления.",
+    )
+
+
+# MARK: Dump
+class LedgerDumpStatusSchema(BaseModel):
+    """Pydantic схема состояния выгрузки реестра."""
+
+    name: str = Field(description="Название выгрузки.")
+    status: Literal["running", "completed", "incomplete"] = Field(
+        description=(
+            "`running` - выполняется в этом процессе, `completed` - завершена, "
+            "`incomplete` - прервана или выполняется в другом процессе."
+        ),
+    )
+    manifest: LedgerManifestSchema | None = Field(
+        default=None,
+        description="Манифест завершенной выгрузки.",
+    )
@@ -0,0 +1,3 @@
+from src.ledger.services.ledger_service import LedgerService, ledger_service
+
+__all__ = ("LedgerService", "ledger_service")
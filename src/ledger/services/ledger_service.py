@@ -0,0 +1,576 @@
+"""Модуль для выгрузки и восстановления реестра через `COPY`."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import zlib
+from datetime import UTC, datetime
+from functools import partial
+from typing import IO, Any, AsyncIterator, Literal
+
+import asyncpg
+from sqlalchemy import Table
+
+import src.ledger.schemas as ledger_schemas
+from src import exceptions
+from src.accounts.models import (
+    AccountBalanceCheckpointModel,
+    AccountBalanceShardModel,
+    AccountModel,
+)
+from src.database import get_asyncpg_dsn
+from src.settings import settings
+from src.transactions.models import TransactionModel
+from src.users.models import UserModel
+
+logger = logging.getLogger(__name__)
+
+# Таблицы реестра в порядке восстановления: внешние ключи ссылаются
+# только на предыдущие таблицы
+LEDGER_TABLES: tuple[Table, ...] = (
+    UserModel.__table__,
+    AccountModel.__table__,
+    AccountBalanceShardModel.__table__,
+    TransactionModel.__table__,
+)
+# Таблицы, вычисляемые по реестру: не выгружаются, но очищаются
+# перед восстановлением
+LEDGER_DERIVED_TABLES: tuple[Table, ...] = (AccountBalanceCheckpointModel.__table__,)
+
+MANIFEST_FILE_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+# Сжатие zlib с заголовком и контрольной суммой gzip
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+IO_BLOCK_SIZE = 1024 * 1024
+DUMP_NAME_FORMAT = "%Y%m%dT%H%M%S%fZ"
+DUMP_NAME_PATTERN = re.compile(r"^\d{8}T\d{12}Z$")
+
+LedgerFormat = Literal["binary", "csv"]
+
+
+# MARK: Utils
+def _quote(name: str) -> str:
+    """Экранировать идентификатор Postgres."""
+
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _get_copy_rows(status: str) -> int:
+    """Получить количество строк из статуса `COPY <n>`."""
+
+    return int(status.rsplit(" ", 1)[-1])
+
+
+def _get_copy_options(format: LedgerFormat) -> dict[str, Any]:
+    """Параметры `COPY` для формата выгрузки."""
+
+    if format == "csv":
+        return {"format": "csv", "header": True}
+    return {"format": "binary"}
+
+
+class LedgerChunkWriter:
+    """
+    Запись потока `COPY TO` одной таблицы в сжатые gzip файлы частей.
+
+    Данные накапливаются в буфере и сжимаются и записываются блоками
+    по `IO_BLOCK_SIZE` в пуле потоков, поэтому цикл событий не блокируется,
+    а в памяти находится не больше одного блока. Новая часть начинается,
+    когда размер данных части достигает `chunk_bytes`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        table_name: str,
+        extension: str,
+        chunk_bytes: int,
+        compression_level: int,
+    ):
+        """
+        Args:
+            directory (str): Директория выгрузки.
+            table_name (str): Название таблицы.
+            extension (str): Расширение файлов частей до `.gz`.
+            chunk_bytes (int): Размер данных части до сжатия.
+            compression_level (int): Уровень сжатия zlib.
+        """
+
+        self.directory = directory
+        self.table_name = table_name
+        self.extension = extension
+        self.chunk_bytes = chunk_bytes
+        self.compression_level = compression_level
+
+        self.chunks: list[ledger_schemas.LedgerChunkSchema] = []
+
+        self._buffer = bytearray()
+        self._file: IO[bytes] | None = None
+        self._file_name = ""
+        self._compressor: Any = None
+        self._hash: Any = None
+        self._size = 0
+        self._compressed_size = 0
+
+    async def write(self, data: bytes) -> None:
+        """Добавить данные потока `COPY TO`."""
+
+        self._buffer += data
+        if len(self._buffer) >= IO_BLOCK_SIZE:
+            await self._flush()
+
+    async def close(self) -> list[ledger_schemas.LedgerChunkSchema]:
+        """
+        Записать оставшиеся данные и закрыть последнюю часть.
+
+        Returns:
+            list[LedgerChunkSchema]: Части выгрузки таблицы.
+        """
+
+        await self._flush()
+        await asyncio.to_thread(self._finish_chunk)
+        return self.chunks
+
+    async def abort(self) -> None:
+        """Закрыть файл текущей части без записи в манифест."""
+
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        await asyncio.to_thread(self._write_block, data)
+
+    def _write_block(self, data: bytes) -> None:
+        if self._file is None:
+            self._open_chunk()
+
+        self._size += len(data)
+        self._write_compressed(self._compressor.compress(data))
+
+        if self._size >= self.chunk_bytes:
+            self._finish_chunk()
+
+    def _open_chunk(self) -> None:
+        self._file_name = (
+            f"{self.table_name}.{len(self.chunks):05d}.{self.extension}.gz"
+        )
+        self._file = open(os.path.join(self.directory, self._file_name), "xb")
+        self._compressor = zlib.compressobj(
+            self.compression_level,
+            zlib.DEFLATED,
+            GZIP_WBITS,
+        )
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._compressed_size = 0
+
+    def _write_compressed(self, data: bytes) -> None:
+        self._file.write(data)
+        self._hash.update(data)
+        self._compressed_size += len(data)
+
+    def _finish_chunk(self) -> None:
+        if self._file is None:
+            return
+
+        self._write_compressed(self._compressor.flush())
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+        self.chunks.append(
+            ledger_schemas.LedgerChunkSchema(
+                file=self._file_name,
+                size=self._size,
+                compressed_size=self._compressed_size,
+                sha256=self._hash.hexdigest(),
+            )
+        )
+
+
+async def read_chunks(
+    directory: str,
+    chunks: list[ledger_schemas.LedgerChunkSchema],
+) -> AsyncIterator[bytes]:
+    """
+    Читать распакованные данные частей выгрузки подряд, проверяя их SHA-256.
+
+    Чтение и распаковка выполняются блоками в пуле потоков.
+
+    Raises:
+        ValueError: SHA-256 части не совпадает с манифестом.
+    """
+
+    def read_block(file: IO[bytes], decompressor: Any, hash: Any) -> bytes | None:
+        block = file.read(IO_BLOCK_SIZE)
+        if not block:
+            return None
+        hash.update(block)
+        return decompressor.decompress(block)
+
+    for chunk in chunks:
+        file = await asyncio.to_thread(open, os.path.join(directory, chunk.file), "rb")
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        hash = hashlib.sha256()
+
+        try:
+            while True:
+                data = await asyncio.to_thread(read_block, file, decompressor, hash)
+                if data is None:
+                    break
+                if data:
+                    yield data
+
+            data = decompressor.flush()
+            if data:
+                yield data
+        finally:
+            await asyncio.to_thread(file.close)
+
+        if hash.hexdigest() != chunk.sha256:
+            raise ValueError(f"Checksum mismatch in ledger chunk {chunk.file}")
+
+
+# MARK: Service
+class LedgerService:
+    """
+    Сервис для выгрузки и восстановления таблиц реестра `LEDGER_TABLES`.
+
+    Таблицы выгружаются через `COPY TO` в одной транзакции
+    `REPEATABLE READ`, поэтому выгрузка согласована между таблицами.
+    Поток каждой таблицы сжимается в файлы частей, а после выгрузки
+    всех таблиц записывается манифест с колонками, количеством строк
+    и SHA-256 частей. Выгрузка без манифеста считается незавершенной.
+
+    Восстановление передает распакованные части в `COPY FROM`
+    в одной транзакции, поэтому данные не проходят через модели
+    SQLAlchemy или Pydantic.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        format: LedgerFormat,
+        chunk_bytes: int,
+        compression_level: int,
+    ):
+        """
+        Args:
+            directory (str): Директория выгрузок.
+            format (LedgerFormat): Формат `COPY`: `binary` или `csv`.
+            chunk_bytes (int): Размер данных части до сжатия.
+            compression_level (int): Уровень сжатия zlib.
+        """
+
+        self.directory = directory
+        self.format = format
+        self.chunk_bytes = chunk_bytes
+        self.compression_level = compression_level
+
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def _get_path(self, name: str) -> str:
+        """
+        Получить путь к выгрузке по ее названию.
+
+        Raises:
+            LedgerDumpNotFoundException: Некорректное название выгрузки.
+        """
+
+        if not DUMP_NAME_PATTERN.match(name):
+            raise exceptions.LedgerDumpNotFoundException()
+
+        return os.path.join(self.directory, name)
+
+    # MARK: Dump
+    async def dump(
+        self, name: str | None = None
+    ) -> ledger_schemas.LedgerManifestSchema:
+        """
+        Выгрузить таблицы реестра в новую директорию выгрузки.
+
+        Args:
+            name (str | None): Название выгрузки, по умолчанию - по текущему
+                времени.
+
+        Returns:
+            LedgerManifestSchema: Манифест выгрузки.
+        """
+
+        created_at = datetime.now(UTC)
+        name = name or created_at.strftime(DUMP_NAME_FORMAT)
+        path = os.path.join(self.directory, name)
+        await asyncio.to_thread(os.makedirs, path)
+
+        tables = []
+        connection = await asyncpg.connect(get_asyncpg_dsn())
+        try:
+            async with connection.transaction(
+                isolation="repeatable_read",
+                readonly=True,
+            ):
+                for table in LEDGER_TABLES:
+                    tables.append(await self._dump_table(connection, table, path))
+        finally:
+            await connection.close()
+
+        manifest = ledger_schemas.LedgerManifestSchema(
+            version=MANIFEST_VERSION,
+            name=name,
+            created_at=created_at,
+            format=self.format,
+            compression="gzip",
+            tables=tables,
+        )
+        await asyncio.to_thread(self._write_manifest, path, manifest)
+
+        return manifest
+
+    async def _dump_table(
+        self,
+        connection: asyncpg.Connection,
+        table: Table,
+        path: str,
+    ) -> ledger_schemas.LedgerTableSchema:
+        """Выгрузить таблицу через `COPY TO` в файлы частей."""
+
+        columns = [column.name for column in table.columns]
+        writer = LedgerChunkWriter(
+            directory=path,
+            table_name=table.name,
+            extension="bin" if self.format == "binary" else "csv",
+            chunk_bytes=self.chunk_bytes,
+            compression_level=self.compression_level,
+        )
+
+        try:
+            status = await connection.copy_from_table(
+                table.name,
+                columns=columns,
+                output=writer.write,
+                **_get_copy_options(self.format),
+            )
+            chunks = await writer.close()
+        except BaseException:
+            await writer.abort()
+            raise
+
+        return ledger_schemas.LedgerTableSchema(
+            name=table.name,
+            columns=columns,
+            rows=_get_copy_rows(status),
+            chunks=chunks,
+        )
+
+    @staticmethod
+    def _write_manifest(
+        path: str,
+        manifest: ledger_schemas.LedgerManifestSchema,
+    ) -> None:
+        """Атомарно записать манифест выгрузки."""
+
+        manifest_path = os.path.join(path, MANIFEST_FILE_NAME)
+        with open(f"{manifest_path}.tmp", "w") as file:
+            file.write(manifest.model_dump_json(indent=2))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    @staticmethod
+    def _read_manifest(path: str) -> ledger_schemas.LedgerManifestSchema:
+        """Прочитать манифест выгрузки."""
+
+        with open(os.path.join(path, MANIFEST_FILE_NAME)) as file:
+            return ledger_schemas.LedgerManifestSchema.model_validate_json(file.read())
+
+    # MARK: Restore
+    async def restore(
+        self,
+        path: str,
+        truncate: bool = False,
+    ) -> ledger_schemas.LedgerManifestSchema:
+        """
+        Восстановить таблицы реестра из выгрузки.
+
+        Таблицы восстанавливаются в одной транзакции, а после
+        восстановления последовательности колонок `IDENTITY` продолжаются
+        после наибольшего восстановленного значения. Кэши запущенных
+        процессов приложения не сбрасываются, поэтому восстановление
+        выполняется при остановленном приложении.
+
+        Args:
+            path (str): Путь к директории выгрузки.
+            truncate (bool): Очистить таблицы реестра и вычисляемые
+                по нему таблицы перед восстановлением. Иначе таблицы
+                реестра должны быть пустыми.
+
+        Returns:
+            LedgerManifestSchema: Манифест восстановленной выгрузки.
+
+        Raises:
+            FileNotFoundError: Нет директории выгрузки, манифеста или
+                файла части.
+            ValidationError: Манифест не соответствует схеме.
+            ValueError: Некорректный манифест, непустая таблица,
+                поврежденная часть или количество строк не совпадает
+                с манифестом.
+        """
+
+        manifest = await asyncio.to_thread(self._read_manifest, path)
+        if manifest.version != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported ledger manifest version {manifest.version}")
+
+        tables = {table.name: table for table in LEDGER_TABLES}
+        for table_manifest in manifest.tables:
+            if table_manifest.name not in tables:
+                raise ValueError(f"Unknown ledger table {table_manifest.name}")
+
+        connection = await asyncpg.connect(get_asyncpg_dsn())
+        try:
+            async with connection.transaction():
+                if truncate:
+                    await connection.execute(
+                        "TRUNCATE "
+                        + ", ".join(
+                            _quote(table.name)
+                            for table in LEDGER_TABLES + LEDGER_DERIVED_TABLES
+                        )
+                    )
+
+                for table_manifest in manifest.tables:
+                    await self._restore_table(
+                        connection,
+                        tables[table_manifest.name],
+                        table_manifest,
+                        path,
+                        manifest.format,
+                    )
+        finally:
+            await connection.close()
+
+        return manifest
+
+    async def _restore_table(
+        self,
+        connection: asyncpg.Connection,
+        table: Table,
+        table_manifest: ledger_schemas.LedgerTableSchema,
+        path: str,
+        format: LedgerFormat,
+    ) -> None:
+        """Восстановить таблицу через `COPY FROM` из файлов частей."""
+
+        if await connection.fetchval(
+            f"SELECT EXISTS (SELECT 1 FROM {_quote(table.name)})"
+        ):
+            raise ValueError(f"Ledger table {table.name} is not empty")
+
+        if table_manifest.chunks:
+            status = await connection.copy_to_table(
+                table.name,
+                source=read_chunks(path, table_manifest.chunks),
+                columns=table_manifest.columns,
+                **_get_copy_options(format),
+            )
+            rows = _get_copy_rows(status)
+            if rows != table_manifest.rows:
+                raise ValueError(
+                    f"Restored {rows} rows into {table.name}, "
+                    f"expected {table_manifest.rows}"
+                )
+
+        for column in table.columns:
+            if column.identity is not None:
+                await connection.execute(
+                    f"SELECT setval(pg_get_serial_sequence($1, $2), "
+                    f"coalesce(max({_quote(column.name)}), 0) + 1, false) "
+                    f"FROM {_quote(table.name)}",
+                    table.name,
+                    column.name,
+                )
+
+    # MARK: Background
+    def start_dump(self) -> ledger_schemas.LedgerDumpStatusSchema:
+        """
+        Запустить выгрузку в фоне текущего процесса.
+
+        Returns:
+            LedgerDumpStatusSchema: Состояние запущенной выгрузки.
+        """
+
+        name = datetime.now(UTC).strftime(DUMP_NAME_FORMAT)
+        task = asyncio.create_task(self.dump(name))
+        self._tasks[name] = task
+        task.add_done_callback(partial(self._on_dump_done, name))
+
+        return ledger_schemas.LedgerDumpStatusSchema(name=name, status="running")
+
+    def _on_dump_done(self, name: str, task: asyncio.Task) -> None:
+        self._tasks.pop(name, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Failed to dump ledger %s",
+                name,
+                exc_info=task.exception(),
+            )
+
+    async def get_dump(self, name: str) -> ledger_schemas.LedgerDumpStatusSchema:
+        """
+        Получить состояние выгрузки.
+
+        Args:
+            name (str): Название выгрузки.
+
+        Returns:
+            LedgerDumpStatusSchema: Состояние выгрузки и ее манифест,
+                если она завершена.
+
+        Raises:
+            LedgerDumpNotFoundException: Выгрузка не найдена.
+        """
+
+        path = self._get_path(name)
+
+        if name in self._tasks:
+            return ledger_schemas.LedgerDumpStatusSchema(name=name, status="running")
+
+        try:
+            manifest = await asyncio.to_thread(self._read_manifest, path)
+        except FileNotFoundError:
+            if not await asyncio.to_thread(os.path.isdir, path):
+                raise exceptions.LedgerDumpNotFoundException()
+            return ledger_schemas.LedgerDumpStatusSchema(
+                name=name,
+                status="incomplete",
+            )
+
+        return ledger_schemas.LedgerDumpStatusSchema(
+            name=name,
+            status="completed",
+            manifest=manifest,
+        )
+
+    async def stop(self) -> None:
+        """Отменить выгрузки, выполняющиеся в фоне."""
+
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+ledger_service = LedgerService(
+    directory=settings.LEDGER_DUMP_DIR,
+    format=settings.LEDGER_DUMP_FORMAT,
+    chunk_bytes=settings.LEDGER_DUMP_CHUNK_BYTES,
+    compression_level=settings.LEDGER_DUMP_COMPRESSION_LEVEL,
+)
@@ -1,20 +1,75 @@
 """Основной модуль для конфигурации FastAPI."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 
 from src.accounts.routers import account_router
+from src.accounts.services import (
+    account_balance_checkpointer,
+    account_balance_sharding,
+)
 from src.auth.routers import auth_router
+from src.cache_invalidation import cache_invalidation_bus
 from src.constants import CORS_HEADERS, CORS_METHODS
+from src.database import DATABASE_UNAVAILABLE_ERRORS, SessionLocal, replica_router
 from src.healthcheck import health_check_router
+from src.ledger.routers import ledger_router
+from src.ledger.services import ledger_service
 from src.settings import settings
-from src.transcations.routers import transaction_router
+from src.transactions.routers import transaction_router
+from src.transactions.services import (
+    transaction_group_committer,
+    transaction_id_filter,
+    transaction_ingest_queue,
+    transaction_spool,
+)
 from src.users.routers import user_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Запуск и остановка фоновых задач приложения."""
+
+    replica_router.start()
+    if settings.TRANSACTION_ID_FILTER_ENABLED:
+        try:
+            async with SessionLocal() as session:
+                await transaction_id_filter.seed(session)
+        except DATABASE_UNAVAILABLE_ERRORS:
+            # Фильтр заполняется по мере работы, если БД недоступна при запуске
+            pass
+    if settings.TRANSACTION_GROUP_COMMIT_ENABLED:
+        transaction_group_committer.start()
+    if settings.TRANSACTION_INGEST_MODE == "async":
+        transaction_ingest_queue.start()
+    if settings.TRANSACTION_SPOOL_ENABLED:
+        transaction_spool.start()
+    if settings.CACHE_INVALIDATION_ENABLED:
+        cache_invalidation_bus.start()
+    if settings.ACCOUNT_BALANCE_SHARDING_ENABLED:
+        account_balance_sharding.start()
+    if settings.ACCOUNT_BALANCE_CHECKPOINT_ENABLED:
+        account_balance_checkpointer.start()
+
+    yield
+
+    await ledger_service.stop()
+    await account_balance_checkpointer.stop()
+    await account_balance_sharding.stop()
+    await cache_invalidation_bus.stop()
+    await transaction_ingest_queue.stop()
+    await transaction_group_committer.stop()
+    await transaction_spool.stop()
+    await replica_router.stop()
+
+
 app = FastAPI(
     title="FastAPI Template",
     version=settings.APP_VERSION,
+    lifespan=lifespan,
 )
 
 
@@ -33,6 +88,7 @@ available_routers = [
     user_router,
     transaction_router,
     account_router,
+    ledger_router,
 ]
 
 for router in available_routers:
@@ -3,6 +3,7 @@
 from pydantic import BaseModel, Field
 
 from src import constants
+from src.utils import ExportFormat
 
 
 class PaginationBaseSchema(BaseModel):
@@ -18,9 +19,69 @@ class PaginationBaseSchema(BaseModel):
     )
 
 
+class CursorPaginationBaseSchema(BaseModel):
+    """Базовая схема query параметров для курсорной пагинации."""
+
+    cursor: str | None = Field(
+        default=None,
+        description="Курсор страницы, полученный в поле `next_cursor`.",
+    )
+    limit: int = Field(
+        default=constants.DEFAULT_QUERY_LIMIT,
+        ge=1,
+        le=constants.MAX_QUERY_LIMIT,
+        description="Размер выборки.",
+    )
+
+
+class CountQueryBaseSchema(BaseModel):
+    """Базовая схема query параметров для подсчета количества сущностей."""
+
+    count_strategy: constants.CountStrategy | None = Field(
+        default=None,
+        description=(
+            "Стратегия подсчета общего количества сущностей: "
+            "`exact` - точное количество отдельным запросом, "
+            "`window` - тем же запросом, что и страница, "
+            "`estimated` - оценка по статистике БД для больших списков, "
+            "`capped` - точное количество до ограничения. "
+            "По умолчанию - стратегия из настроек."
+        ),
+    )
+
+
+class ExportQuerySchema(BaseModel):
+    """Базовая схема query параметров для потоковой выгрузки."""
+
+    format: ExportFormat = Field(
+        default="ndjson",
+        description="Формат выгрузки: `ndjson` или `csv`.",
+    )
+
+    class Config:
+        extra = "forbid"
+
+
 class DataListReadBaseSchema(BaseModel):
     """Базовая схема для отображения списка сущностей."""
 
     count: int = Field(
         description="Общее количество сущностей без учета пагинации.",
     )
+    count_accuracy: constants.CountAccuracy = Field(
+        default="exact",
+        description=(
+            "Точность `count`: `exact` - точное количество, "
+            "`estimated` - оценка по статистике БД, "
+            "`at_least` - нижняя граница количества."
+        ),
+    )
+
+
+class CursorListReadBaseSchema(BaseModel):
+    """Базовая схема для отображения страницы сущностей при курсорной пагинации."""
+
+    next_cursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы или `None`, если страниц больше нет.",
+    )
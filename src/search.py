@@ -0,0 +1,112 @@
+"""Модуль для планирования текстового поиска по полям моделей."""
+
+from typing import Literal
+
+from sqlalchemy import ColumnElement, bindparam, false, func, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src import constants
+
+# Вид поиска: по началу значения или по подстроке
+SearchMode = Literal["prefix", "substring"]
+
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(value: str) -> str:
+    """Экранировать спецсимволы шаблона LIKE в значении."""
+
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def plan_search(value: str) -> SearchMode:
+    """
+    Выбрать вид поиска по длине значения.
+
+    Индекс `gin_trgm_ops` находит подстроку только по ее триграммам,
+    поэтому для значений короче `SEARCH_TRIGRAM_MIN_LENGTH` поиск
+    подстроки выполняется полным просмотром таблицы. Такие значения
+    ищутся по началу строки с индексом `text_pattern_ops`.
+
+    Returns:
+        SearchMode: `prefix` или `substring`.
+    """
+
+    if len(value) < constants.SEARCH_TRIGRAM_MIN_LENGTH:
+        return "prefix"
+    return "substring"
+
+
+def get_search_condition(
+    field: InstrumentedAttribute,
+    value: str,
+) -> ColumnElement[bool]:
+    """
+    Получить условие поиска значения в поле без учета регистра.
+
+    Условие сравнивает `lower(field)`, поэтому использует индексы
+    по `lower(field)`: `gin_trgm_ops` для подстроки
+    и `text_pattern_ops` для начала строки.
+
+    Args:
+        field (InstrumentedAttribute): Текстовое поле модели.
+        value (str): Искомое значение.
+
+    Returns:
+        ColumnElement[bool]: Условие поиска.
+    """
+
+    value = value.strip().lower()
+    if not value:
+        return false()
+
+    pattern = escape_like(value) + "%"
+    if plan_search(value) == "substring":
+        return func.lower(field).like("%" + pattern, escape=LIKE_ESCAPE)
+
+    # Индекс `text_pattern_ops` применим, только если шаблон известен
+    # при планировании, поэтому шаблон подставляется в текст запроса
+    return func.lower(field).like(
+        bindparam(None, pattern, literal_execute=True),
+        escape=LIKE_ESCAPE,
+    )
+
+
+def get_search_any_condition(
+    search_fields: dict[InstrumentedAttribute, str],
+) -> ColumnElement[bool]:
+    """
+    Получить условие поиска значения хотя бы в одном из полей.
+
+    Returns:
+        ColumnElement[bool]: Условие поиска.
+    """
+
+    return or_(
+        *(get_search_condition(field, value) for field, value in search_fields.items())
+    )
+
+
+def get_search_rank(
+    search_fields: dict[InstrumentedAttribute, str],
+) -> ColumnElement[float]:
+    """
+    Получить оценку сходства значений полей с искомыми значениями
+    для сортировки результатов поиска по убыванию.
+
+    Оценка - наибольшее `similarity` pg_trgm среди полей.
+
+    Returns:
+        ColumnElement[float]: Оценка сходства от 0 до 1.
+    """
+
+    return func.greatest(
+        *(
+            func.similarity(func.lower(field), value.strip().lower())
+            for field, value in search_fields.items()
+        )
+    )
@@ -24,14 +24,96 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: str
 
+    # Postgres pool
+    DB_POOL_MODE: Literal["queue", "null"] = "queue"
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_SINGLE_FLIGHT_ENABLED: bool = True
+    DB_STREAM_FETCH_SIZE: int = 1000
+    DB_BULK_COPY_THRESHOLD: int = 10000
+    DB_COUNT_STRATEGY: Literal["exact", "window", "estimated", "capped"] = "window"
+    DB_COUNT_CAP: int = 1000
+    DB_COUNT_ESTIMATE_THRESHOLD: int = 10000
+
+    # Postgres replicas
+    POSTGRES_REPLICA_HOSTS: list[str] = []
+    DB_REPLICA_SELECTION: Literal["round_robin", "least_latency"] = "round_robin"
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5
+    DB_REPLICA_HEALTHCHECK_INTERVAL_SECONDS: float = 5
+    DB_REPLICA_HEALTHCHECK_TIMEOUT_SECONDS: float = 1
+
     # JWT
     JWT_ACCESS_SECRET: str
     JWT_REFRESH_SECRET: str
     JWT_ACCESS_EXPIRE_MINUTES: int
     JWT_REFRESH_EXPIRE_MINUTES: int
+    JWT_STATELESS_AUTH: bool = False
+    JWT_CACHE_ENABLED: bool = True
+    JWT_CACHE_MAX_SIZE: int = 10000
+    JWT_CACHE_INVALID_TTL_SECONDS: float = 30
+
+    # Passwords
+    PASSWORD_HASH_SCRYPT_N: int = 16384
+    PASSWORD_HASH_SCRYPT_R: int = 8
+    PASSWORD_HASH_SCRYPT_P: int = 1
+    PASSWORD_HASH_SALT_LENGTH: int = 16
+    PASSWORD_HASH_LENGTH: int = 32
+    PASSWORD_HASH_WORKERS: int = 2
+
+    # Cache invalidation
+    CACHE_INVALIDATION_ENABLED: bool = False
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+    CACHE_INVALIDATION_RECONNECT_SECONDS: float = 1
+
+    # Users cache
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL_SECONDS: float = 30
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_SHARED_DIR: str | None = None
+
+    # Accounts
+    ACCOUNT_BALANCE_SHARDING_ENABLED: bool = False
+    ACCOUNT_BALANCE_SHARDS: int = 8
+    ACCOUNT_BALANCE_HOT_PROMOTE_RATE: float = 50
+    ACCOUNT_BALANCE_HOT_DEMOTE_RATE: float = 5
+    ACCOUNT_BALANCE_COMPACT_INTERVAL_SECONDS: float = 5
+    ACCOUNT_BALANCE_CHECKPOINT_ENABLED: bool = False
+    ACCOUNT_BALANCE_CHECKPOINT_INTERVAL_SECONDS: float = 60
+    ACCOUNT_BALANCE_CHECKPOINT_LAG_SECONDS: float = 30
 
     # Transaction
     TRANSACTION_SIGNATURE_SECRET: str
+    TRANSACTION_SIGNATURE_PREVIOUS_SECRETS: list[str] = []
+    TRANSACTION_SIGNATURE_LEGACY_ENABLED: bool = True
+    TRANSACTION_SIGNATURE_BATCH_THRESHOLD: int = 256
+    TRANSACTION_SIGNATURE_WORKERS: int = 0
+    TRANSACTION_GROUP_COMMIT_ENABLED: bool = False
+    TRANSACTION_GROUP_COMMIT_WINDOW_MS: float = 2
+    TRANSACTION_GROUP_COMMIT_MAX_ITEMS: int = 100
+    TRANSACTION_INGEST_MODE: Literal["sync", "async"] = "sync"
+    TRANSACTION_INGEST_QUEUE_SIZE: int = 10000
+    TRANSACTION_INGEST_WORKERS: int = 2
+    TRANSACTION_INGEST_BATCH_SIZE: int = 500
+    TRANSACTION_INGEST_STATUS_MAX_SIZE: int = 100000
+    TRANSACTION_SPOOL_ENABLED: bool = False
+    TRANSACTION_SPOOL_DIR: str = "spool"
+    TRANSACTION_SPOOL_SEGMENT_MAX_BYTES: int = 16 * 1024 * 1024
+    TRANSACTION_SPOOL_FSYNC_WINDOW_MS: float = 5
+    TRANSACTION_SPOOL_REPLAY_INTERVAL_SECONDS: float = 5
+    TRANSACTION_ID_FILTER_ENABLED: bool = True
+    TRANSACTION_ID_FILTER_LRU_SIZE: int = 100000
+    TRANSACTION_ID_FILTER_BLOOM_CAPACITY: int = 1000000
+    TRANSACTION_ID_FILTER_BLOOM_ERROR_RATE: float = 0.001
+    TRANSACTION_ID_FILTER_SEED_SIZE: int = 100000
+
+    # Ledger
+    LEDGER_DUMP_DIR: str = "ledger"
+    LEDGER_DUMP_FORMAT: Literal["binary", "csv"] = "binary"
+    LEDGER_DUMP_CHUNK_BYTES: int = 256 * 1024 * 1024
+    LEDGER_DUMP_COMPRESSION_LEVEL: int = 3
 
     @property
     def DATABASE_URL(self):
@@ -40,6 +122,18 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def REPLICA_DATABASE_URLS(self) -> list[str]:
+        urls = []
+        for host in self.POSTGRES_REPLICA_HOSTS:
+            if ":" not in host:
+                host = f"{host}:{self.POSTGRES_PORT}"
+            urls.append(
+                f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+                f"@{host}/{self.POSTGRES_DB}"
+            )
+        return urls
+
     model_config = SettingsConfigDict(env_file=ENV_FILE_PATH)
 
 
@@ -1,11 +1,13 @@
 """Модуль для SQLAlchemy моделей транзакций."""
 
 import uuid
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, ForeignKey
+from sqlalchemy import TIMESTAMP, UUID, BigInteger, ForeignKey, Identity, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.constants import CURRENT_TIMESTAMP_UTC
 from src.database import Base
 
 if TYPE_CHECKING:
@@ -17,11 +19,26 @@ class TransactionModel(Base):
     """Модель транзакции."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("transactions_user_id_created_at_id_idx", "user_id", "created_at", "id"),
+        Index(
+            "transactions_account_id_created_at_id_idx",
+            "account_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         primary_key=True,
         comment="Идентификатор транзакции.",
     )
+    seq: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(),
+        unique=True,
+        comment="Монотонно возрастающий номер транзакции.",
+    )
     account_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("accounts.id"),
@@ -38,6 +55,11 @@ class TransactionModel(Base):
     signature: Mapped[str] = mapped_column(
         comment="Подпись транзакции.",
     )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=CURRENT_TIMESTAMP_UTC,
+        comment="Дата создания транзакции.",
+    )
 
     account: Mapped["AccountModel"] = relationship(
         back_populates="transactions",
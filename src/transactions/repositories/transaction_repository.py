@@ -1,6 +1,14 @@
 """Модуль для репозиториев транзакций."""
 
+import uuid
+from typing import Any
+
+from sqlalchemy import Row, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
 import src.transactions.schemas as transaction_schemas
+from src.accounts.repositories import AccountRepository
 from src.base_repository import BaseRepository
 from src.transactions.models import TransactionModel
 
@@ -18,3 +26,117 @@ class TransactionRepository(
     """
 
     model = TransactionModel
+
+    @classmethod
+    async def add_with_balance_update(
+        cls,
+        session: AsyncSession,
+        obj_in: transaction_schemas.TransactionSchema,
+        shard: int | None = None,
+    ) -> tuple[TransactionModel, int]:
+        """
+        Добавить транзакцию и применить ее сумму к балансу аккаунта
+        одним выражением.
+
+        Аккаунт создается, если его еще нет, иначе его баланс атомарно
+        увеличивается на сумму транзакции. Если передан `shard`, вместо
+        баланса существующего аккаунта увеличивается его часть баланса.
+        Если транзакция с таким `id` уже существует, выражение завершается
+        ошибкой целиком, и баланс аккаунта не изменяется.
+
+        Returns:
+            (transaction, balance): созданная транзакция и новый баланс аккаунта
+                или, если передан `shard`, новый баланс его части.
+        """
+
+        account_id = uuid.UUID(str(obj_in.account_id))
+        user_id = uuid.UUID(str(obj_in.user_id))
+
+        if shard is None:
+            account_cte = AccountRepository.get_upsert_balance_stmt(
+                id=account_id,
+                user_id=user_id,
+                amount=obj_in.amount,
+            ).cte("upserted_account")
+        else:
+            account_cte = AccountRepository.get_upsert_shard_balance_stmt(
+                id=account_id,
+                shard=shard,
+                amount=obj_in.amount,
+            ).cte("upserted_account")
+
+        transaction_cte = (
+            insert(TransactionModel)
+            .from_select(
+                ["id", "account_id", "user_id", "amount", "signature"],
+                select(
+                    literal(obj_in.id, type_=TransactionModel.id.type),
+                    account_cte.c.id,
+                    literal(user_id, type_=TransactionModel.user_id.type),
+                    literal(obj_in.amount, type_=TransactionModel.amount.type),
+                    literal(obj_in.signature, type_=TransactionModel.signature.type),
+                ),
+            )
+            .returning(*TransactionModel.__table__.c)
+            .cte("inserted_transaction")
+        )
+
+        stmt = select(
+            aliased(TransactionModel, transaction_cte),
+            account_cte.c.balance,
+        )
+        result = await session.execute(stmt)
+        transaction, balance = result.one()
+
+        return transaction, balance
+
+    @classmethod
+    async def add_bulk_skip_duplicates(
+        cls,
+        session: AsyncSession,
+        data: list[dict[str, Any]],
+    ) -> list[Row]:
+        """
+        Добавить несколько транзакций в текущую сессию, пропуская транзакции,
+        `id` которых уже есть в БД.
+
+        Returns:
+            list[Row]: `id`, `account_id` и `amount` добавленных транзакций.
+        """
+
+        return await cls.add_bulk(
+            session,
+            data,
+            on_conflict="nothing",
+            conflict_fields=["id"],
+            returning=[
+                TransactionModel.id,
+                TransactionModel.account_id,
+                TransactionModel.amount,
+            ],
+        )
+
+    @classmethod
+    async def find_latest_ids(
+        cls,
+        session: AsyncSession,
+        limit: int,
+    ) -> list[str]:
+        """
+        Получить `id` последних созданных транзакций, от новых к старым.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            limit (int): Количество транзакций.
+
+        Returns:
+            list[str]: `id` транзакций.
+        """
+
+        stmt = (
+            select(TransactionModel.id)
+            .order_by(TransactionModel.created_at.desc(), TransactionModel.id.desc())
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
@@ -2,29 +2,64 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.transactions.schemas as transaction_schemas
-from src import dependencies
-from src.transactions.services import TransactionService
-from src.users.models import UserModel
+import src.users.schemas as user_schemas
+from src import dependencies, utils
+from src.schemas import ExportQuerySchema
+from src.transactions.services import (
+    TransactionService,
+    transaction_id_filter,
+    transaction_ingest_queue,
+    transaction_spool,
+)
 
 transaction_router = APIRouter(prefix="/transactions", tags=["transactions"])
 
 
 @transaction_router.get(path="")
 async def get_all_transactions_route(
-    session: AsyncSession = Depends(dependencies.get_session),
-    user: UserModel = Depends(dependencies.get_current_user),
-) -> list[transaction_schemas.TransactionSchema]:
+    query_params: transaction_schemas.TransactionsQuerySchema = Query(),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> transaction_schemas.TransactionListReadSchema:
     """
-    Получить все транзакции пользователя.
+    Получить транзакции пользователя постранично, от новых к старым.
 
     Доступно только авторизованному пользвоателю.
     """
 
-    return await TransactionService.get_all_by_user_id(session, user_id=user.id)
+    return await TransactionService.get_all_by_user_id(
+        session,
+        user_id=user.id,
+        query_params=query_params,
+    )
+
+
+@transaction_router.get(path="/export", response_class=StreamingResponse)
+async def export_transactions_route(
+    query_params: ExportQuerySchema = Query(),
+    session_factory: dependencies.SessionFactory = Depends(
+        dependencies.get_read_session_factory
+    ),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
+) -> StreamingResponse:
+    """
+    Выгрузить все транзакции пользователя в формате NDJSON или CSV,
+    от старых к новым.
+
+    Доступно только авторизованному пользователю.
+    """
+
+    return utils.export_response(
+        TransactionService.export_by_user_id(session_factory, user_id=user.id),
+        schema=transaction_schemas.TransactionSchema,
+        format=query_params.format,
+        filename="transactions",
+    )
 
 
 @transaction_router.get(
@@ -33,30 +68,189 @@ async def get_all_transactions_route(
 )
 async def get_all_transactions_by_user_id_route(
     user_id: uuid.UUID,
-    session: AsyncSession = Depends(dependencies.get_session),
-) -> list[transaction_schemas.TransactionSchema]:
+    query_params: transaction_schemas.TransactionsQuerySchema = Query(),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+) -> transaction_schemas.TransactionListReadSchema:
+    """
+    Получить транзакции пользователя постранично, от новых к старым.
+
+    Доступно только администратору.
     """
-    Получить все транзакции пользователя.
+
+    return await TransactionService.get_all_by_user_id(
+        session,
+        user_id=user_id,
+        query_params=query_params,
+    )
+
+
+@transaction_router.get(
+    path="/{user_id}/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def export_transactions_by_user_id_route(
+    user_id: uuid.UUID,
+    query_params: ExportQuerySchema = Query(),
+    session_factory: dependencies.SessionFactory = Depends(
+        dependencies.get_read_session_factory
+    ),
+) -> StreamingResponse:
+    """
+    Выгрузить все транзакции пользователя в формате NDJSON или CSV,
+    от старых к новым.
 
     Доступно только администратору.
     """
 
-    return await TransactionService.get_all_by_user_id(session, user_id=user_id)
+    return utils.export_response(
+        TransactionService.export_by_user_id(session_factory, user_id=user_id),
+        schema=transaction_schemas.TransactionSchema,
+        format=query_params.format,
+        filename=f"transactions_{user_id}",
+    )
 
 
 @transaction_router.post(
     path="",
     dependencies=[Depends(dependencies.get_current_admin)],
-    response_model=transaction_schemas.TransactionSchema,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": transaction_schemas.TransactionIngestStatusSchema,
+        },
+    },
 )
 async def create_transaction_route(
     data: transaction_schemas.TransactionSchema,
+    response: Response,
     session: AsyncSession = Depends(dependencies.get_session),
-) -> transaction_schemas.TransactionSchema:
+) -> (
+    transaction_schemas.TransactionSchema
+    | transaction_schemas.TransactionIngestStatusSchema
+):
     """
     Создать транзакцию.
 
+    В асинхронном режиме приема транзакция ставится в очередь
+    и возвращается ее статус с кодом `202 Accepted`.
+
+    Доступно только администратору.
+    """
+
+    result = await TransactionService.accept(session, data)
+    if isinstance(result, transaction_schemas.TransactionIngestStatusSchema):
+        response.status_code = status.HTTP_202_ACCEPTED
+
+    return result
+
+
+@transaction_router.get(
+    path="/status/{id}",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def get_transaction_ingest_status_route(
+    id: str,
+    session: AsyncSession = Depends(dependencies.get_read_session),
+) -> transaction_schemas.TransactionIngestStatusSchema:
+    """
+    Получить статус транзакции, принятой в асинхронном режиме.
+
+    Доступно только администратору.
+    """
+
+    return await TransactionService.get_ingest_status(session, id)
+
+
+@transaction_router.get(
+    path="/ingest/stats",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def get_transaction_ingest_stats_route() -> (
+    transaction_schemas.TransactionIngestStatsSchema
+):
+    """
+    Получить метрики очереди асинхронного приема транзакций.
+
     Доступно только администратору.
     """
 
-    return await TransactionService.create(session, data)
+    return transaction_schemas.TransactionIngestStatsSchema(
+        **transaction_ingest_queue.get_stats()
+    )
+
+
+@transaction_router.get(
+    path="/spool/stats",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def get_transaction_spool_stats_route() -> (
+    transaction_schemas.TransactionSpoolStatsSchema
+):
+    """
+    Получить метрики локального журнала транзакций.
+
+    Доступно только администратору.
+    """
+
+    return transaction_schemas.TransactionSpoolStatsSchema(
+        **transaction_spool.get_stats()
+    )
+
+
+@transaction_router.get(
+    path="/id_filter/stats",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def get_transaction_id_filter_stats_route() -> (
+    transaction_schemas.TransactionIdFilterStatsSchema
+):
+    """
+    Получить метрики фильтра повторных доставок транзакций.
+
+    Доступно только администратору.
+    """
+
+    return transaction_schemas.TransactionIdFilterStatsSchema(
+        **transaction_id_filter.get_stats()
+    )
+
+
+@transaction_router.post(
+    path="/batch",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def create_transactions_batch_route(
+    data: list[transaction_schemas.TransactionSchema],
+    session: AsyncSession = Depends(dependencies.get_session),
+) -> transaction_schemas.TransactionBatchResultSchema:
+    """
+    Создать пакет транзакций, переданный JSON массивом.
+
+    Результат возвращается для каждой транзакции пакета.
+
+    Доступно только администратору.
+    """
+
+    return await TransactionService.create_batch(session, data)
+
+
+@transaction_router.post(
+    path="/batch/ndjson",
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def create_transactions_batch_ndjson_route(
+    request: Request,
+    session: AsyncSession = Depends(dependencies.get_session),
+) -> transaction_schemas.TransactionBatchResultSchema:
+    """
+    Создать пакет транзакций, переданный в формате NDJSON
+    (`application/x-ndjson`, одна транзакция на строку).
+
+    Результат возвращается для каждой транзакции пакета.
+
+    Доступно только администратору.
+    """
+
+    data = await TransactionService.parse_ndjson_batch(request.stream())
+
+    return await TransactionService.create_batch(session, data)
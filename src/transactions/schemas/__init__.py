@@ -1,3 +1,23 @@
-from src.transactions.schemas.transaction_schemas import TransactionSchema
+from src.transactions.schemas.transaction_schemas import (
+    TransactionBatchItemResultSchema,
+    TransactionBatchResultSchema,
+    TransactionIdFilterStatsSchema,
+    TransactionIngestStatsSchema,
+    TransactionIngestStatusSchema,
+    TransactionListReadSchema,
+    TransactionSchema,
+    TransactionSpoolStatsSchema,
+    TransactionsQuerySchema,
+)
 
-__all__ = ["TransactionSchema"]
+__all__ = [
+    "TransactionBatchItemResultSchema",
+    "TransactionBatchResultSchema",
+    "TransactionIdFilterStatsSchema",
+    "TransactionIngestStatsSchema",
+    "TransactionIngestStatusSchema",
+    "TransactionListReadSchema",
+    "TransactionSchema",
+    "TransactionSpoolStatsSchema",
+    "TransactionsQuerySchema",
+]
@@ -1,8 +1,11 @@
 """Модуль для Pydantic схем транзакций."""
 
 import uuid
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.schemas import CursorListReadBaseSchema, CursorPaginationBaseSchema
 
 
 class TransactionSchema(BaseModel):
@@ -17,3 +20,122 @@ class TransactionSchema(BaseModel):
     class Config:
         from_attributes = True
         json_encoders = {uuid.UUID: str}
+
+
+class TransactionListReadSchema(CursorListReadBaseSchema):
+    """Схема страницы транзакций."""
+
+    transactions: list[TransactionSchema] = Field(
+        description="Транзакции, отсортированные от новых к старым.",
+    )
+
+
+# MARK: Batch
+class TransactionBatchItemResultSchema(BaseModel):
+    """Схема результата обработки транзакции из пакета."""
+
+    id: str = Field(description="Идентификатор транзакции.")
+    status: Literal["created", "duplicate", "invalid_signature"] = Field(
+        description=(
+            "Результат обработки: транзакция создана, уже существует "
+            "или имеет некорректную подпись."
+        ),
+    )
+
+
+class TransactionBatchResultSchema(BaseModel):
+    """Схема результата обработки пакета транзакций."""
+
+    created: int = Field(description="Количество созданных транзакций.")
+    duplicates: int = Field(description="Количество повторных транзакций.")
+    invalid_signatures: int = Field(
+        description="Количество транзакций с некорректной подписью.",
+    )
+    results: list[TransactionBatchItemResultSchema] = Field(
+        description="Результаты обработки в порядке транзакций в пакете.",
+    )
+
+
+# MARK: Ingest
+class TransactionIngestStatusSchema(BaseModel):
+    """Схема статуса транзакции, принятой в асинхронном режиме."""
+
+    id: str = Field(description="Идентификатор транзакции.")
+    status: Literal["queued", "spooled", "created", "duplicate", "failed"] = Field(
+        description=(
+            "Статус транзакции: ожидает записи, записана в локальный журнал "
+            "до восстановления БД, создана, уже существовала "
+            "или не может быть записана."
+        ),
+    )
+
+
+class TransactionIngestStatsSchema(BaseModel):
+    """Схема метрик очереди асинхронного приема транзакций."""
+
+    depth: int = Field(description="Количество транзакций в очереди.")
+    max_depth: int = Field(description="Максимальный размер очереди.")
+    in_flight: int = Field(description="Количество транзакций в процессе записи.")
+    workers: int = Field(description="Количество запущенных корутин-писателей.")
+    accepted_total: int = Field(description="Количество принятых транзакций.")
+    rejected_total: int = Field(
+        description="Количество транзакций, отклоненных из-за заполненной очереди.",
+    )
+    created_total: int = Field(description="Количество созданных транзакций.")
+    duplicates_total: int = Field(description="Количество повторных транзакций.")
+    failed_total: int = Field(
+        description="Количество транзакций, которые не удалось записать.",
+    )
+    batches_total: int = Field(description="Количество записанных пакетов.")
+
+
+class TransactionSpoolStatsSchema(BaseModel):
+    """Схема метрик локального журнала транзакций."""
+
+    segments: int = Field(description="Количество сегментов журнала.")
+    size_bytes: int = Field(description="Размер сегментов журнала в байтах.")
+    pending: int = Field(
+        description="Количество транзакций процесса, ожидающих записи в БД.",
+    )
+    spooled_total: int = Field(
+        description="Количество транзакций, записанных в журнал.",
+    )
+    replayed_total: int = Field(
+        description="Количество транзакций, созданных из журнала.",
+    )
+    duplicates_total: int = Field(
+        description="Количество повторных транзакций при записи журнала.",
+    )
+    dead_letters_total: int = Field(
+        description="Количество транзакций, которые не удалось записать в БД.",
+    )
+    corrupted_total: int = Field(
+        description="Количество поврежденных строк журнала.",
+    )
+    fsyncs_total: int = Field(description="Количество сбросов журнала на диск.")
+
+
+class TransactionIdFilterStatsSchema(BaseModel):
+    """Схема метрик фильтра повторных доставок транзакций."""
+
+    lru_size: int = Field(description="Количество `id` в LRU множестве.")
+    bloom_count: int = Field(
+        description="Количество `id` в обоих поколениях фильтра Блума.",
+    )
+    duplicates_total: int = Field(
+        description="Количество отклоненных повторных доставок.",
+    )
+    bloom_hits_total: int = Field(
+        description="Количество срабатываний фильтра Блума, проверенных в БД.",
+    )
+    bloom_false_positives_total: int = Field(
+        description="Количество ложных срабатываний фильтра Блума.",
+    )
+
+
+# MARK: Query
+class TransactionsQuerySchema(CursorPaginationBaseSchema):
+    """Схема query параметров для запроса списка транзакций."""
+
+    class Config:
+        extra = "forbid"
@@ -1,3 +1,37 @@
-from src.transactions.services.transaction_service import TransactionService
+from src.transactions.services.transaction_group_committer import (
+    TransactionGroupCommitter,
+)
+from src.transactions.services.transaction_id_filter import TransactionIdFilter
+from src.transactions.services.transaction_ingest_queue import (
+    LocalTransactionBroker,
+    TransactionBroker,
+    TransactionIngestQueue,
+)
+from src.transactions.services.transaction_service import (
+    TransactionService,
+    transaction_group_committer,
+    transaction_id_filter,
+    transaction_ingest_queue,
+    transaction_signature_verifier,
+    transaction_spool,
+)
+from src.transactions.services.transaction_signature_verifier import (
+    TransactionSignatureVerifier,
+)
+from src.transactions.services.transaction_spool import TransactionSpool
 
-__all__ = ["TransactionService"]
+__all__ = [
+    "TransactionService",
+    "TransactionGroupCommitter",
+    "transaction_group_committer",
+    "TransactionBroker",
+    "LocalTransactionBroker",
+    "TransactionIngestQueue",
+    "transaction_ingest_queue",
+    "TransactionSpool",
+    "transaction_spool",
+    "TransactionIdFilter",
+    "transaction_id_filter",
+    "TransactionSignatureVerifier",
+    "transaction_signature_verifier",
+]
@@ -0,0 +1,193 @@
+"""Модуль для группового коммита транзакций."""
+
+import asyncio
+from typing import Awaitable, Callable
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.transactions.schemas as transaction_schemas
+from src import exceptions
+
+GroupHandler = Callable[
+    [AsyncSession, list[transaction_schemas.TransactionSchema]],
+    Awaitable[set[str]],
+]
+
+_Item = tuple[transaction_schemas.TransactionSchema, asyncio.Future]
+
+
+class TransactionGroupCommitter:
+    """
+    Групповой коммит транзакций в пределах процесса.
+
+    Транзакции, поступившие от параллельных запросов, накапливаются
+    в течение окна `window_seconds` или до `max_items` штук
+    и записываются одной транзакцией БД. Каждый вызывающий получает
+    результат своей транзакции.
+    """
+
+    def __init__(
+        self,
+        handler: GroupHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+        window_seconds: float,
+        max_items: int,
+    ):
+        """
+        Args:
+            handler (GroupHandler):
+                Функция добавления группы транзакций в сессию без коммита,
+                возвращающая `id` созданных транзакций.
+            session_factory (async_sessionmaker[AsyncSession]):
+                Фабрика сессий для записи групп.
+            window_seconds (float): Окно накопления группы в секундах.
+            max_items (int): Максимальный размер группы.
+        """
+
+        self.handler = handler
+        self.session_factory = session_factory
+        self.window_seconds = window_seconds
+        self.max_items = max_items
+
+        self.groups_total = 0
+        self.items_total = 0
+
+        self._queue: asyncio.Queue[_Item | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    # MARK: Lifecycle
+    def start(self) -> None:
+        """Запустить корутину группового коммита, если она не запущена."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Записать уже принятые транзакции и остановить корутину."""
+
+        if self._task is None or self._task.done():
+            return
+
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    # MARK: Submit
+    async def submit(self, data: transaction_schemas.TransactionSchema) -> bool:
+        """
+        Передать транзакцию с проверенной подписью в ближайшую группу
+        и дождаться коммита группы.
+
+        Args:
+            data (TransactionSchema): Транзакция с проверенной подписью.
+
+        Returns:
+            bool: True, если транзакция создана, False, если она уже существует.
+
+        Raises:
+            TransactionConflictException: Конфликт при создании транзакции.
+        """
+
+        self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((data, future))
+
+        return await future
+
+    # MARK: Commit
+    async def _run(self) -> None:
+        """Собирать группы транзакций из очереди и записывать их."""
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+
+            group, is_stopping = [item], False
+            deadline = loop.time() + self.window_seconds
+
+            while len(group) < self.max_items:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+
+                if item is None:
+                    is_stopping = True
+                    break
+                group.append(item)
+
+            await self._commit_group(group)
+
+            if is_stopping:
+                return
+
+    async def _commit_group(self, group: list[_Item]) -> None:
+        """
+        Записать группу транзакций одной транзакцией БД и передать
+        результаты вызывающим.
+
+        Повторы `id` внутри группы считаются повторными транзакциями.
+        При ошибке целостности транзакции группы записываются по одной,
+        чтобы ошибка одной транзакции не затрагивала остальные.
+        """
+
+        unique: dict[str, _Item] = {}
+        for data, future in group:
+            if data.id in unique:
+                self._set_result(future, False)
+            else:
+                unique[data.id] = (data, future)
+
+        try:
+            async with self.session_factory() as session:
+                created_ids = await self.handler(
+                    session,
+                    [data for data, _ in unique.values()],
+                )
+                await session.commit()
+
+        except IntegrityError as ex:
+            if len(unique) > 1:
+                for item in unique.values():
+                    await self._commit_group([item])
+                return
+
+            for _, future in unique.values():
+                self._set_exception(
+                    future, exceptions.TransactionConflictException(exc=ex)
+                )
+            return
+
+        except Exception as ex:
+            for _, future in unique.values():
+                self._set_exception(future, ex)
+            return
+
+        self.groups_total += 1
+        self.items_total += len(unique)
+
+        for data, future in unique.values():
+            self._set_result(future, data.id in created_ids)
+
+    @staticmethod
+    def _set_result(future: asyncio.Future, result: bool) -> None:
+        """Передать результат, если вызывающий еще ожидает его."""
+
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, exc: Exception) -> None:
+        """Передать исключение, если вызывающий еще ожидает результат."""
+
+        if not future.done():
+            future.set_exception(exc)
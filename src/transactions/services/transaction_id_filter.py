@@ -0,0 +1,163 @@
+"""Модуль для фильтра повторных доставок транзакций."""
+
+from typing import Any, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src import utils
+from src.transactions.repositories import TransactionRepository
+
+IdFilterResult = Literal["duplicate", "maybe", "new"]
+
+
+class TransactionIdFilter:
+    """
+    Фильтр недавно созданных транзакций в пределах процесса.
+
+    LRU множество хранит `id` транзакций, созданных или найденных в БД,
+    и достоверно отвечает о повторной доставке. Фильтр Блума покрывает
+    больший объем `id`: его срабатывание проверяется запросом по первичному
+    ключу, а отсутствие в фильтре означает, что транзакция не создавалась
+    этим процессом. Источником истины остается первичный ключ в БД.
+
+    Фильтров Блума два поколения: `id` добавляются в текущий фильтр,
+    а проверяются в обоих. Когда текущий фильтр заполняется, он становится
+    предыдущим, а прежний предыдущий отбрасывается, поэтому фильтры
+    всегда покрывают не меньше `bloom_capacity` последних `id`.
+    """
+
+    def __init__(
+        self,
+        lru_size: int,
+        bloom_capacity: int,
+        bloom_error_rate: float,
+        seed_size: int,
+    ):
+        """
+        Args:
+            lru_size (int): Размер LRU множества.
+            bloom_capacity (int): Расчетное количество элементов фильтра Блума.
+            bloom_error_rate (float):
+                Допустимая вероятность ложного срабатывания фильтра Блума.
+            seed_size (int): Количество последних транзакций,
+                загружаемых в фильтр при запуске.
+        """
+
+        self.seed_size = seed_size
+
+        self.duplicates_total = 0
+        self.bloom_hits_total = 0
+        self.bloom_false_positives_total = 0
+
+        self._lru = utils.LRUSet(max_size=lru_size)
+        self._bloom = utils.BloomFilter(
+            capacity=bloom_capacity,
+            error_rate=bloom_error_rate,
+        )
+        self._previous_bloom: utils.BloomFilter | None = None
+
+    def add(self, id: str) -> None:
+        """
+        Запомнить `id` транзакции, сохраненной в БД.
+
+        Заполненный фильтр Блума становится предыдущим поколением,
+        а `id` добавляются в новый фильтр, чтобы вероятность
+        ложного срабатывания не росла.
+
+        Args:
+            id (str): ID транзакции.
+        """
+
+        self._lru.add(id)
+
+        if self._bloom.is_full:
+            self._previous_bloom = self._bloom
+            self._bloom = utils.BloomFilter(
+                capacity=self._bloom.capacity,
+                error_rate=self._bloom.error_rate,
+            )
+
+        self._bloom.add(id)
+
+    async def seed(self, session: AsyncSession) -> None:
+        """
+        Загрузить `id` последних транзакций из БД.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+        """
+
+        ids = await TransactionRepository.find_latest_ids(
+            session=session,
+            limit=self.seed_size,
+        )
+        for id in reversed(ids):
+            self.add(id)
+
+    async def is_duplicate(self, session: AsyncSession, id: str) -> bool:
+        """
+        Проверить, создана ли уже транзакция.
+
+        Запрос в БД выполняется только при срабатывании фильтра Блума
+        для `id`, отсутствующего в LRU множестве.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (str): ID транзакции.
+
+        Returns:
+            bool: True, если транзакция уже создана.
+        """
+
+        result = self.check(id)
+
+        if result == "maybe":
+            self.bloom_hits_total += 1
+            if await TransactionRepository.exists(session=session, id=id):
+                self.add(id)
+                result = "duplicate"
+            else:
+                self.bloom_false_positives_total += 1
+
+        if result == "duplicate":
+            self.duplicates_total += 1
+            return True
+
+        return False
+
+    def check(self, id: str) -> IdFilterResult:
+        """
+        Проверить `id` транзакции без запросов в БД.
+
+        Args:
+            id (str): ID транзакции.
+
+        Returns:
+            IdFilterResult: `duplicate`, если транзакция точно создана,
+                `maybe`, если сработал только фильтр Блума, иначе `new`.
+        """
+
+        if id in self._lru:
+            return "duplicate"
+        if id in self._bloom or (
+            self._previous_bloom is not None and id in self._previous_bloom
+        ):
+            return "maybe"
+        return "new"
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики фильтра.
+
+        Returns:
+            dict[str, Any]: Метрики фильтра.
+        """
+
+        return {
+            "lru_size": len(self._lru),
+            "bloom_count": self._bloom.count
+            + (self._previous_bloom.count if self._previous_bloom else 0),
+            "duplicates_total": self.duplicates_total,
+            "bloom_hits_total": self.bloom_hits_total,
+            "bloom_false_positives_total": self.bloom_false_positives_total,
+        }
@@ -0,0 +1,337 @@
+"""Модуль для асинхронного приема транзакций через очередь."""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.transactions.schemas as transaction_schemas
+from src import exceptions
+from src.database import DATABASE_UNAVAILABLE_ERRORS
+
+logger = logging.getLogger(__name__)
+
+IngestHandler = Callable[
+    [AsyncSession, list[transaction_schemas.TransactionSchema]],
+    Awaitable[set[str]],
+]
+
+IngestStatus = Literal["queued", "created", "duplicate", "failed"]
+
+
+# MARK: Broker
+class TransactionBroker(ABC):
+    """
+    Базовый класс брокера очереди принятых транзакций.
+
+    Реализации для внешних брокеров должны обеспечивать
+    ограниченный размер очереди и пакетное чтение.
+    """
+
+    @abstractmethod
+    def publish(self, data: transaction_schemas.TransactionSchema) -> None:
+        """
+        Поставить транзакцию в очередь без ожидания.
+
+        Args:
+            data (TransactionSchema): Транзакция с проверенной подписью.
+
+        Raises:
+            TransactionIngestQueueFullException: Очередь заполнена.
+        """
+
+    @abstractmethod
+    async def consume(
+        self,
+        max_items: int,
+    ) -> list[transaction_schemas.TransactionSchema]:
+        """
+        Дождаться хотя бы одной транзакции и забрать
+        из очереди не больше `max_items` транзакций.
+
+        Args:
+            max_items (int): Максимальный размер пакета.
+
+        Returns:
+            list[TransactionSchema]: Пакет транзакций.
+        """
+
+    @abstractmethod
+    def depth(self) -> int:
+        """Получить количество транзакций в очереди."""
+
+    @abstractmethod
+    def max_depth(self) -> int:
+        """Получить максимальное количество транзакций в очереди."""
+
+
+class LocalTransactionBroker(TransactionBroker):
+    """Брокер на основе ограниченной очереди в памяти процесса."""
+
+    def __init__(self, max_size: int):
+        self._queue: asyncio.Queue[transaction_schemas.TransactionSchema] = (
+            asyncio.Queue(maxsize=max_size)
+        )
+
+    def publish(self, data: transaction_schemas.TransactionSchema) -> None:
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            raise exceptions.TransactionIngestQueueFullException()
+
+    async def consume(
+        self,
+        max_items: int,
+    ) -> list[transaction_schemas.TransactionSchema]:
+        batch = [await self._queue.get()]
+        while len(batch) < max_items and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        return batch
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def max_depth(self) -> int:
+        return self._queue.maxsize
+
+
+# MARK: Queue
+class TransactionIngestQueue:
+    """
+    Асинхронный прием транзакций.
+
+    Транзакции с проверенной подписью ставятся в очередь брокера,
+    а фоновые корутины-писатели забирают их пакетами и записывают
+    в БД. Статус каждой принятой транзакции доступен по ее `id`.
+    """
+
+    def __init__(
+        self,
+        broker: TransactionBroker,
+        handler: IngestHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+        workers: int,
+        batch_size: int,
+        status_max_size: int,
+        retry_seconds: float = 1,
+        on_created: Callable[[set[str]], None] | None = None,
+    ):
+        """
+        Args:
+            broker (TransactionBroker): Брокер очереди транзакций.
+            handler (IngestHandler):
+                Функция добавления пакета транзакций в сессию без коммита,
+                возвращающая `id` созданных транзакций.
+            session_factory (async_sessionmaker[AsyncSession]):
+                Фабрика сессий для записи пакетов.
+            workers (int): Количество корутин-писателей.
+            batch_size (int): Максимальный размер записываемого пакета.
+            status_max_size (int):
+                Максимальное количество хранимых статусов транзакций.
+            retry_seconds (float):
+                Пауза перед повторной записью пакета при недоступности БД.
+            on_created (Callable[[set[str]], None] | None):
+                Функция, вызываемая с `id` созданных транзакций после коммита.
+        """
+
+        self.broker = broker
+        self.handler = handler
+        self.session_factory = session_factory
+        self.workers = workers
+        self.batch_size = batch_size
+        self.status_max_size = status_max_size
+        self.on_created = on_created
+        self.retry_seconds = retry_seconds
+
+        self.accepted_total = 0
+        self.rejected_total = 0
+        self.created_total = 0
+        self.duplicates_total = 0
+        self.failed_total = 0
+        self.batches_total = 0
+        self.in_flight = 0
+
+        self._statuses: OrderedDict[str, IngestStatus] = OrderedDict()
+        self._tasks: list[asyncio.Task] = []
+
+    # MARK: Lifecycle
+    def start(self) -> None:
+        """Запустить корутины-писатели, если они не запущены."""
+
+        self._tasks = [task for task in self._tasks if not task.done()]
+        for _ in range(self.workers - len(self._tasks)):
+            self._tasks.append(asyncio.create_task(self._run()))
+
+    async def stop(self, timeout: float = 10) -> None:
+        """
+        Дождаться записи принятых транзакций и остановить корутины-писатели.
+
+        Args:
+            timeout (float): Максимальное время ожидания записи в секундах.
+        """
+
+        if not self._tasks:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (self.broker.depth() or self.in_flight) and loop.time() < deadline:
+            await asyncio.sleep(0.05)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    # MARK: Publish
+    def publish(
+        self,
+        data: transaction_schemas.TransactionSchema,
+    ) -> transaction_schemas.TransactionIngestStatusSchema:
+        """
+        Поставить транзакцию с проверенной подписью в очередь.
+
+        Args:
+            data (TransactionSchema): Транзакция с проверенной подписью.
+
+        Returns:
+            TransactionIngestStatusSchema: Статус принятой транзакции.
+
+        Raises:
+            TransactionIngestQueueFullException: Очередь заполнена.
+        """
+
+        self.start()
+
+        try:
+            self.broker.publish(data)
+        except exceptions.TransactionIngestQueueFullException:
+            self.rejected_total += 1
+            raise
+
+        self.accepted_total += 1
+        self._set_status(data.id, "queued")
+
+        return transaction_schemas.TransactionIngestStatusSchema(
+            id=data.id,
+            status="queued",
+        )
+
+    # MARK: Status
+    def get_status(self, id: str) -> IngestStatus | None:
+        """
+        Получить статус принятой транзакции.
+
+        Args:
+            id (str): ID транзакции.
+
+        Returns:
+            IngestStatus | None: Статус транзакции или None,
+                если транзакция не принималась или ее статус вытеснен.
+        """
+
+        return self._statuses.get(id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики очереди приема транзакций.
+
+        Returns:
+            dict[str, Any]: Метрики очереди.
+        """
+
+        return {
+            "depth": self.broker.depth(),
+            "max_depth": self.broker.max_depth(),
+            "in_flight": self.in_flight,
+            "workers": len([task for task in self._tasks if not task.done()]),
+            "accepted_total": self.accepted_total,
+            "rejected_total": self.rejected_total,
+            "created_total": self.created_total,
+            "duplicates_total": self.duplicates_total,
+            "failed_total": self.failed_total,
+            "batches_total": self.batches_total,
+        }
+
+    def _set_status(self, id: str, status: IngestStatus) -> None:
+        """Сохранить статус транзакции, вытесняя самые старые статусы."""
+
+        self._statuses[id] = status
+        self._statuses.move_to_end(id)
+        while len(self._statuses) > self.status_max_size:
+            self._statuses.popitem(last=False)
+
+    # MARK: Write
+    async def _run(self) -> None:
+        """Забирать пакеты транзакций из очереди и записывать их в БД."""
+
+        while True:
+            batch = await self.broker.consume(self.batch_size)
+            self.in_flight += len(batch)
+
+            try:
+                await self._write(batch)
+            finally:
+                self.in_flight -= len(batch)
+
+    async def _write(self, batch: list[transaction_schemas.TransactionSchema]) -> None:
+        """
+        Записать пакет транзакций, повторяя запись, пока БД недоступна.
+
+        При других ошибках, например ошибке целостности или данных,
+        транзакции пакета записываются по одной, чтобы ошибка одной
+        транзакции не затрагивала остальные, а транзакция с ошибкой
+        получает статус `failed`.
+        """
+
+        unique: dict[str, transaction_schemas.TransactionSchema] = {}
+        for data in batch:
+            if data.id in unique:
+                self._finish(data.id, "duplicate")
+            else:
+                unique[data.id] = data
+
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    created_ids = await self.handler(session, list(unique.values()))
+                    await session.commit()
+                break
+
+            except DATABASE_UNAVAILABLE_ERRORS:
+                logger.exception("Failed to write ingested transactions, retrying")
+                await asyncio.sleep(self.retry_seconds)
+
+            except Exception:
+                if len(unique) > 1:
+                    for data in unique.values():
+                        await self._write([data])
+                    return
+
+                logger.exception("Failed to write ingested transaction")
+                for id in unique:
+                    self._finish(id, "failed")
+                return
+
+        if self.on_created is not None:
+            self.on_created(created_ids)
+
+        self.batches_total += 1
+        for id in unique:
+            self._finish(id, "created" if id in created_ids else "duplicate")
+
+    def _finish(self, id: str, status: IngestStatus) -> None:
+        """Сохранить итоговый статус транзакции и учесть его в метриках."""
+
+        if status == "created":
+            self.created_total += 1
+        elif status == "duplicate":
+            self.duplicates_total += 1
+        else:
+            self.failed_total += 1
+
+        self._set_status(id, status)
@@ -1,16 +1,33 @@
 """Модуль для сервисов транзакций."""
 
 import uuid
+from typing import AsyncIterator, Iterable
 
+from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-import src.accounts.schemas as account_schemas
 import src.transactions.schemas as transaction_schemas
-from src import exceptions, utils
-from src.accounts.services import AccountService
+from src import constants, exceptions
+from src.accounts.repositories import AccountRepository
+from src.accounts.services import AccountService, account_balance_sharding
+from src.cache_invalidation import cache_invalidation_bus
+from src.database import DATABASE_UNAVAILABLE_ERRORS, SessionFactory, SessionLocal
 from src.settings import settings
+from src.transactions.models import TransactionModel
 from src.transactions.repositories import TransactionRepository
+from src.transactions.services.transaction_group_committer import (
+    TransactionGroupCommitter,
+)
+from src.transactions.services.transaction_id_filter import TransactionIdFilter
+from src.transactions.services.transaction_ingest_queue import (
+    LocalTransactionBroker,
+    TransactionIngestQueue,
+)
+from src.transactions.services.transaction_signature_verifier import (
+    TransactionSignatureVerifier,
+)
+from src.transactions.services.transaction_spool import TransactionSpool
 
 
 class TransactionService:
@@ -23,7 +40,7 @@ class TransactionService:
         data: transaction_schemas.TransactionSchema,
     ) -> bool:
         """
-        Проверка подписи транзакции.
+        Проверка подписи транзакции с помощью `transaction_signature_verifier`.
 
         Args:
             data (TransactionSchema):
@@ -33,15 +50,105 @@ class TransactionService:
             bool: True, если подпись транзакции корректна, иначе False.
         """
 
-        signature = utils.get_hash(
-            str(data.account_id)
-            + str(data.amount)
-            + data.id
-            + str(data.user_id)
-            + settings.TRANSACTION_SIGNATURE_SECRET
-        )
+        return transaction_signature_verifier.verify(data)
+
+    @classmethod
+    async def check_duplicate_delivery(
+        cls,
+        session: AsyncSession,
+        data: transaction_schemas.TransactionSchema,
+    ) -> None:
+        """
+        Отсеять повторную доставку транзакции до записи в БД
+        с помощью `transaction_id_filter`.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            data (TransactionSchema): Данные транзакции.
+
+        Raises:
+            TransactionConflictException: Транзакция уже существует.
+        """
+
+        if not settings.TRANSACTION_ID_FILTER_ENABLED:
+            return
+
+        if await transaction_id_filter.is_duplicate(session=session, id=data.id):
+            raise exceptions.TransactionConflictException()
+
+    @classmethod
+    def remember_created(cls, ids: Iterable[str]) -> None:
+        """
+        Запомнить `id` транзакций, сохраненных в БД,
+        в `transaction_id_filter`.
+
+        Args:
+            ids (Iterable[str]): `id` сохраненных транзакций.
+        """
+
+        if not settings.TRANSACTION_ID_FILTER_ENABLED:
+            return
+
+        for id in ids:
+            transaction_id_filter.add(id)
+
+    @classmethod
+    def handle_invalidation(cls, id: str | None, version: int | None) -> None:
+        """
+        Запомнить `id` транзакции, созданной другим процессом,
+        в `transaction_id_filter`.
+
+        Args:
+            id (str | None): ID транзакции или None, если события
+                могли быть пропущены.
+            version (int | None): Не используется.
+        """
+
+        if id is not None:
+            cls.remember_created([id])
+
+    @classmethod
+    async def parse_ndjson_batch(
+        cls,
+        stream: AsyncIterator[bytes],
+    ) -> list[transaction_schemas.TransactionSchema]:
+        """
+        Разобрать пакет транзакций в формате NDJSON по мере его получения.
+
+        Args:
+            stream (AsyncIterator[bytes]): Поток тела запроса.
+
+        Returns:
+            list[TransactionSchema]: Транзакции пакета.
+
+        Raises:
+            TransactionBatchTooLargeException: Превышен размер пакета.
+            TransactionBatchInvalidPayloadException: Некорректная строка пакета.
+        """
+
+        data = []
+
+        def parse_lines(lines: list[bytes]) -> None:
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    data.append(
+                        transaction_schemas.TransactionSchema.model_validate_json(line)
+                    )
+                except ValidationError:
+                    raise exceptions.TransactionBatchInvalidPayloadException()
 
-        return signature == data.signature
+            if len(data) > constants.MAX_TRANSACTION_BATCH_SIZE:
+                raise exceptions.TransactionBatchTooLargeException()
+
+        buffer = b""
+        async for chunk in stream:
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            parse_lines(lines)
+        parse_lines([buffer])
+
+        return data
 
     # MARK: Create
     @classmethod
@@ -53,6 +160,18 @@ class TransactionService:
         """
         Создать транзакцию в БД.
 
+        Аккаунт создается при его отсутствии, а сумма транзакции
+        атомарно применяется к его балансу. Все изменения выполняются
+        одним выражением и фиксируются одним коммитом, поэтому
+        параллельные транзакции одного аккаунта не теряют обновления баланса.
+
+        Повторные доставки, известные `transaction_id_filter`,
+        отклоняются после проверки подписи, до запросов на запись.
+
+        При `TRANSACTION_GROUP_COMMIT_ENABLED` транзакция передается
+        в `transaction_group_committer` и фиксируется одним коммитом
+        с транзакциями параллельных запросов.
+
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             data (TransactionSchema):
@@ -62,7 +181,7 @@ class TransactionService:
             TransactionSchema: Добавленная транзакция.
 
         Raises:
-            TransactionAlreadyExistsException: Транзакция уже существует.
+            TransactionConflictException: Транзакция уже существует.
             TransactionInvalidSignatureException: Некорректная подпись транзакции.
         """
 
@@ -70,69 +189,553 @@ class TransactionService:
         if not await cls.check_transaction_signature(data):
             raise exceptions.TransactionInvalidSignatureException()
 
-        # Если аккаунт не существует, то создаем его
-        try:
-            account = await AccountService.get(session=session, id=data.account_id)
+        return await cls._create_verified(session, data)
 
-        except exceptions.AccountNotFoundException:
-            schema = account_schemas.AccountCreateSchema(
-                id=data.account_id,
-                balance=0,
-                user_id=data.user_id,
-            )
-            account = await AccountService.create(session=session, data=schema)
+    @classmethod
+    async def _create_verified(
+        cls,
+        session: AsyncSession,
+        data: transaction_schemas.TransactionSchema,
+    ) -> transaction_schemas.TransactionSchema:
+        """
+        Создать в БД транзакцию с проверенной подписью, как `create`.
+
+        Raises:
+            TransactionConflictException: Транзакция уже существует.
+        """
+
+        # Отсеивание известных повторных доставок
+        await cls.check_duplicate_delivery(session, data)
+
+        # В режиме группового коммита транзакция записывается вместе
+        # с транзакциями параллельных запросов
+        if settings.TRANSACTION_GROUP_COMMIT_ENABLED:
+            is_created = await transaction_group_committer.submit(data)
+            cls.remember_created([data.id])
+            if not is_created:
+                raise exceptions.TransactionConflictException()
+
+            return data
 
         try:
-            # Добавление транзакции в БД
-            transaction = await TransactionRepository.add(
+            # Добавление транзакции, создание аккаунта при его отсутствии
+            # и обновление баланса в одной транзакции БД
+            transaction, _ = await TransactionRepository.add_with_balance_update(
                 session=session,
                 obj_in=data,
+                shard=account_balance_sharding.route(uuid.UUID(str(data.account_id))),
+            )
+            await cache_invalidation_bus.publish(
+                session=session,
+                entity="transaction",
+                ids=[transaction.id],
             )
             await session.commit()
 
         except IntegrityError as ex:
+            await session.rollback()
             raise exceptions.TransactionConflictException(exc=ex)
 
-        # Обновить баланс счета
-        await AccountService.update_balance(
+        cls.remember_created([transaction.id])
+
+        return transaction_schemas.TransactionSchema.model_validate(transaction)
+
+    @classmethod
+    async def accept(
+        cls,
+        session: AsyncSession,
+        data: transaction_schemas.TransactionSchema,
+    ) -> (
+        transaction_schemas.TransactionSchema
+        | transaction_schemas.TransactionIngestStatusSchema
+    ):
+        """
+        Принять транзакцию в режиме `TRANSACTION_INGEST_MODE`.
+
+        Подпись транзакции проверяется до любых запросов к БД.
+        В синхронном режиме транзакция создается сразу. В асинхронном
+        режиме транзакция ставится в очередь `transaction_ingest_queue`
+        и записывается в БД в фоне.
+
+        При `TRANSACTION_SPOOL_ENABLED` транзакция, которую нельзя записать
+        из-за недоступности БД или заполненной очереди, записывается
+        в локальный журнал `transaction_spool` и создается после
+        восстановления БД.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            data (TransactionSchema):
+                Данные для создания транзакции.
+
+        Returns:
+            TransactionSchema | TransactionIngestStatusSchema:
+                Добавленная транзакция или статус транзакции в очереди.
+
+        Raises:
+            TransactionConflictException: Транзакция уже существует.
+            TransactionInvalidSignatureException: Некорректная подпись транзакции.
+            TransactionIngestQueueFullException: Очередь приема заполнена.
+        """
+
+        # Проверка подписи транзакции. В журнал и очередь попадают
+        # только транзакции с проверенной подписью.
+        if not await cls.check_transaction_signature(data):
+            raise exceptions.TransactionInvalidSignatureException()
+
+        if settings.TRANSACTION_INGEST_MODE == "sync":
+            try:
+                return await cls._create_verified(session, data)
+            except DATABASE_UNAVAILABLE_ERRORS:
+                if not settings.TRANSACTION_SPOOL_ENABLED:
+                    raise
+                return await cls.spool(data)
+
+        # Отсеивание известных повторных доставок
+        await cls.check_duplicate_delivery(session, data)
+
+        try:
+            return transaction_ingest_queue.publish(data)
+        except exceptions.TransactionIngestQueueFullException:
+            if not settings.TRANSACTION_SPOOL_ENABLED:
+                raise
+            return await cls.spool(data)
+
+    @classmethod
+    async def spool(
+        cls,
+        data: transaction_schemas.TransactionSchema,
+    ) -> transaction_schemas.TransactionIngestStatusSchema:
+        """
+        Записать транзакцию с проверенной подписью в локальный журнал.
+
+        Args:
+            data (TransactionSchema): Транзакция с проверенной подписью.
+
+        Returns:
+            TransactionIngestStatusSchema: Статус транзакции в журнале.
+        """
+
+        await transaction_spool.append(data)
+
+        return transaction_schemas.TransactionIngestStatusSchema(
+            id=data.id,
+            status="spooled",
+        )
+
+    @classmethod
+    async def create_batch(
+        cls,
+        session: AsyncSession,
+        data: list[transaction_schemas.TransactionSchema],
+    ) -> transaction_schemas.TransactionBatchResultSchema:
+        """
+        Создать пакет транзакций в БД одной транзакцией БД.
+
+        Повторные транзакции и транзакции с некорректной подписью
+        не прерывают обработку пакета, а отражаются в результате
+        для каждой транзакции.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            data (list[TransactionSchema]): Пакет транзакций.
+
+        Returns:
+            TransactionBatchResultSchema: Результаты обработки пакета.
+
+        Raises:
+            TransactionBatchTooLargeException: Превышен размер пакета.
+            TransactionConflictException: Конфликт при создании транзакций.
+        """
+
+        if len(data) > constants.MAX_TRANSACTION_BATCH_SIZE:
+            raise exceptions.TransactionBatchTooLargeException()
+
+        # Проверка подписей. Повторы `id` внутри пакета и транзакции,
+        # известные `transaction_id_filter`, считаются повторными.
+        signatures = await transaction_signature_verifier.verify_batch(data)
+
+        statuses: list[str | None] = []
+        verified: dict[str, transaction_schemas.TransactionSchema] = {}
+        for transaction, is_signature_valid in zip(data, signatures):
+            if not is_signature_valid:
+                statuses.append("invalid_signature")
+            elif transaction.id in verified or (
+                settings.TRANSACTION_ID_FILTER_ENABLED
+                and transaction_id_filter.check(transaction.id) == "duplicate"
+            ):
+                statuses.append("duplicate")
+            else:
+                verified[transaction.id] = transaction
+                statuses.append(None)
+
+        try:
+            created_ids = await cls.add_verified_batch(
+                session=session,
+                data=list(verified.values()),
+            )
+            await session.commit()
+
+        except IntegrityError as ex:
+            await session.rollback()
+            raise exceptions.TransactionConflictException(exc=ex)
+
+        cls.remember_created(verified)
+
+        results = [
+            transaction_schemas.TransactionBatchItemResultSchema(
+                id=transaction.id,
+                status=status
+                or ("created" if transaction.id in created_ids else "duplicate"),
+            )
+            for transaction, status in zip(data, statuses)
+        ]
+
+        return transaction_schemas.TransactionBatchResultSchema(
+            created=sum(result.status == "created" for result in results),
+            duplicates=sum(result.status == "duplicate" for result in results),
+            invalid_signatures=sum(
+                result.status == "invalid_signature" for result in results
+            ),
+            results=results,
+        )
+
+    @classmethod
+    async def add_verified_batch(
+        cls,
+        session: AsyncSession,
+        data: list[transaction_schemas.TransactionSchema],
+    ) -> set[str]:
+        """
+        Добавить в текущую сессию пакет транзакций с проверенной подписью
+        и применить их суммы к балансам аккаунтов.
+
+        Отсутствующие аккаунты создаются, транзакции вставляются
+        многострочными INSERT с пропуском уже существующих `id`,
+        а суммы созданных транзакций применяются к балансу каждого
+        аккаунта одним изменением. Созданные `id` публикуются
+        в `cache_invalidation_bus`. Коммит выполняется вызывающим кодом.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            data (list[TransactionSchema]): Транзакции с проверенной подписью.
+
+        Returns:
+            set[str]: `id` созданных транзакций.
+        """
+
+        if not data:
+            return set()
+
+        accounts = {}
+        transactions = []
+        for transaction in data:
+            account_id = uuid.UUID(str(transaction.account_id))
+            user_id = uuid.UUID(str(transaction.user_id))
+            accounts.setdefault(
+                account_id,
+                {"id": account_id, "user_id": user_id, "balance": 0},
+            )
+            transactions.append(
+                {
+                    "id": transaction.id,
+                    "account_id": account_id,
+                    "user_id": user_id,
+                    "amount": transaction.amount,
+                    "signature": transaction.signature,
+                }
+            )
+
+        await AccountRepository.add_missing_bulk(
+            session=session,
+            data=[accounts[account_id] for account_id in sorted(accounts)],
+        )
+        inserted = await TransactionRepository.add_bulk_skip_duplicates(
             session=session,
-            id=account.id,
-            new_balance=account.balance + data.amount,
+            data=transactions,
         )
 
-        return transaction_schemas.TransactionSchema.model_validate(transaction)
+        amounts: dict[uuid.UUID, int] = {}
+        writes: dict[uuid.UUID, int] = {}
+        for row in inserted:
+            amounts[row.account_id] = amounts.get(row.account_id, 0) + row.amount
+            writes[row.account_id] = writes.get(row.account_id, 0) + 1
+
+        # Суммы аккаунтов с `is_hot` применяются к одной из частей баланса
+        balances: dict[uuid.UUID, int] = {}
+        shard_balances: dict[tuple[uuid.UUID, int], int] = {}
+        for account_id, amount in amounts.items():
+            shard = account_balance_sharding.route(account_id, writes[account_id])
+            if shard is None:
+                balances[account_id] = amount
+            else:
+                shard_balances[(account_id, shard)] = amount
+
+        await AccountRepository.increment_balances(session=session, amounts=balances)
+        await AccountRepository.increment_shard_balances(
+            session=session,
+            amounts=shard_balances,
+        )
+
+        created_ids = {row.id for row in inserted}
+        await cache_invalidation_bus.publish(
+            session=session,
+            entity="transaction",
+            ids=list(created_ids),
+        )
+
+        return created_ids
 
     # MARK: Get
+    @classmethod
+    async def get_ingest_status(
+        cls,
+        session: AsyncSession,
+        id: str,
+    ) -> transaction_schemas.TransactionIngestStatusSchema:
+        """
+        Получить статус транзакции, принятой в асинхронном режиме.
+
+        Если статус транзакции не хранится в очереди приема
+        и в локальном журнале, транзакция ищется в БД.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (str): ID транзакции.
+
+        Returns:
+            TransactionIngestStatusSchema: Статус транзакции.
+
+        Raises:
+            TransactionNotFoundException: Транзакция не найдена.
+        """
+
+        status = transaction_ingest_queue.get_status(id)
+        if status is None and transaction_spool.contains(id):
+            status = "spooled"
+
+        if status is None:
+            transaction = await TransactionRepository.find_one_or_none(
+                session=session,
+                id=id,
+            )
+            if transaction is None:
+                raise exceptions.TransactionNotFoundException()
+            status = "created"
+
+        return transaction_schemas.TransactionIngestStatusSchema(id=id, status=status)
+
     @classmethod
     async def get_all_by_user_id(
         cls,
         session: AsyncSession,
         user_id: uuid.UUID,
-    ) -> list[transaction_schemas.TransactionSchema]:
+        query_params: transaction_schemas.TransactionsQuerySchema,
+    ) -> transaction_schemas.TransactionListReadSchema:
         """
-        Поиск транзакций по ID пользователя.
+        Поиск транзакций по ID пользователя, от новых к старым.
 
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             user_id (uuid.UUID): ID пользователя.
+            query_params (TransactionsQuerySchema): Query параметры пагинации.
 
         Returns:
-            list[TransactionSchema]: Найденные транзакции.
+            TransactionListReadSchema: Страница найденных транзакций.
 
         Raises:
-            TransactionNotFoundException: Транзакция не найдена.
+            InvalidCursorException: Некорректный курсор пагинации.
         """
 
-        # Поиск транзакции в БД
-        transactions_db = await TransactionRepository.find_all(
+        # Поиск транзакций в БД
+        transactions_db, next_cursor = await TransactionRepository.find_all_by_cursor(
             session=session,
+            sort_fields=[TransactionModel.created_at, TransactionModel.id],
+            cursor=query_params.cursor,
+            limit=query_params.limit,
+            ascending=False,
             user_id=user_id,
         )
 
-        if transactions_db is None:
-            raise exceptions.TransactionNotFoundException()
+        return transaction_schemas.TransactionListReadSchema(
+            transactions=[
+                transaction_schemas.TransactionSchema.model_validate(transaction)
+                for transaction in transactions_db
+            ],
+            next_cursor=next_cursor,
+        )
 
-        return [
-            transaction_schemas.TransactionSchema.model_validate(transaction)
-            for transaction in transactions_db
-        ]
+    @classmethod
+    async def get_all_by_account_id(
+        cls,
+        session: AsyncSession,
+        account_id: uuid.UUID,
+        query_params: transaction_schemas.TransactionsQuerySchema,
+        user_id: uuid.UUID | None = None,
+    ) -> transaction_schemas.TransactionListReadSchema:
+        """
+        Поиск транзакций аккаунта, от новых к старым.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            account_id (uuid.UUID): ID аккаунта.
+            query_params (TransactionsQuerySchema): Query параметры пагинации.
+            user_id (uuid.UUID | None):
+                ID пользователя-владельца аккаунта. Если передан,
+                аккаунты других пользователей считаются не найденными.
+
+        Returns:
+            TransactionListReadSchema: Страница найденных транзакций.
+
+        Raises:
+            AccountNotFoundException: Аккаунт не найден.
+            InvalidCursorException: Некорректный курсор пагинации.
+        """
+
+        account = await AccountService.get(
+            session=session,
+            id=account_id,
+            user_id=user_id,
+        )
+
+        # Поиск транзакций в БД
+        transactions_db, next_cursor = await TransactionRepository.find_all_by_cursor(
+            session=session,
+            sort_fields=[TransactionModel.created_at, TransactionModel.id],
+            cursor=query_params.cursor,
+            limit=query_params.limit,
+            ascending=False,
+            account_id=account.id,
+        )
+
+        return transaction_schemas.TransactionListReadSchema(
+            transactions=[
+                transaction_schemas.TransactionSchema.model_validate(transaction)
+                for transaction in transactions_db
+            ],
+            next_cursor=next_cursor,
+        )
+
+    # MARK: Export
+    @classmethod
+    async def _export(
+        cls,
+        session_factory: SessionFactory,
+        **filter_by,
+    ) -> AsyncIterator[transaction_schemas.TransactionSchema]:
+        """Получать транзакции из серверного курсора в отдельной сессии."""
+
+        async with session_factory() as session:
+            async for transaction in TransactionRepository.stream(
+                session,
+                order_by=[TransactionModel.created_at, TransactionModel.id],
+                **filter_by,
+            ):
+                yield transaction_schemas.TransactionSchema.model_validate(transaction)
+
+    @classmethod
+    def export_by_user_id(
+        cls,
+        session_factory: SessionFactory,
+        user_id: uuid.UUID,
+    ) -> AsyncIterator[transaction_schemas.TransactionSchema]:
+        """
+        Выгрузить все транзакции пользователя, от старых к новым.
+
+        Транзакции читаются из серверного курсора по мере отправки,
+        в сессии `session_factory`, которая открывается при начале
+        выгрузки и закрывается после нее.
+
+        Args:
+            session_factory (SessionFactory):
+                Фабрика сессий только для чтения.
+            user_id (uuid.UUID): ID пользователя.
+
+        Returns:
+            AsyncIterator[TransactionSchema]: Транзакции пользователя.
+        """
+
+        return cls._export(session_factory, user_id=user_id)
+
+    @classmethod
+    async def export_by_account_id(
+        cls,
+        session: AsyncSession,
+        session_factory: SessionFactory,
+        account_id: uuid.UUID,
+        user_id: uuid.UUID | None = None,
+    ) -> AsyncIterator[transaction_schemas.TransactionSchema]:
+        """
+        Выгрузить все транзакции аккаунта, от старых к новым.
+
+        Доступ к аккаунту проверяется в `session` до начала выгрузки,
+        а транзакции читаются как в `export_by_user_id`.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            session_factory (SessionFactory):
+                Фабрика сессий только для чтения.
+            account_id (uuid.UUID): ID аккаунта.
+            user_id (uuid.UUID | None): ID пользователя-владельца аккаунта.
+
+        Returns:
+            AsyncIterator[TransactionSchema]: Транзакции аккаунта.
+
+        Raises:
+            AccountNotFoundException: Аккаунт не найден.
+        """
+
+        account = await AccountService.get(
+            session=session,
+            id=account_id,
+            user_id=user_id,
+        )
+
+        return cls._export(session_factory, account_id=account.id)
+
+
+transaction_signature_verifier = TransactionSignatureVerifier(
+    secrets=[
+        settings.TRANSACTION_SIGNATURE_SECRET,
+        *settings.TRANSACTION_SIGNATURE_PREVIOUS_SECRETS,
+    ],
+    is_legacy_enabled=settings.TRANSACTION_SIGNATURE_LEGACY_ENABLED,
+    batch_threshold=settings.TRANSACTION_SIGNATURE_BATCH_THRESHOLD,
+    workers=settings.TRANSACTION_SIGNATURE_WORKERS,
+)
+
+transaction_group_committer = TransactionGroupCommitter(
+    handler=TransactionService.add_verified_batch,
+    session_factory=SessionLocal,
+    window_seconds=settings.TRANSACTION_GROUP_COMMIT_WINDOW_MS / 1000,
+    max_items=settings.TRANSACTION_GROUP_COMMIT_MAX_ITEMS,
+)
+
+transaction_ingest_queue = TransactionIngestQueue(
+    broker=LocalTransactionBroker(max_size=settings.TRANSACTION_INGEST_QUEUE_SIZE),
+    handler=TransactionService.add_verified_batch,
+    session_factory=SessionLocal,
+    workers=settings.TRANSACTION_INGEST_WORKERS,
+    batch_size=settings.TRANSACTION_INGEST_BATCH_SIZE,
+    status_max_size=settings.TRANSACTION_INGEST_STATUS_MAX_SIZE,
+    on_created=TransactionService.remember_created,
+)
+
+transaction_spool = TransactionSpool(
+    directory=settings.TRANSACTION_SPOOL_DIR,
+    handler=TransactionService.add_verified_batch,
+    session_factory=SessionLocal,
+    segment_max_bytes=settings.TRANSACTION_SPOOL_SEGMENT_MAX_BYTES,
+    fsync_window_seconds=settings.TRANSACTION_SPOOL_FSYNC_WINDOW_MS / 1000,
+    replay_interval_seconds=settings.TRANSACTION_SPOOL_REPLAY_INTERVAL_SECONDS,
+    batch_size=settings.TRANSACTION_INGEST_BATCH_SIZE,
+    on_created=TransactionService.remember_created,
+)
+
+transaction_id_filter = TransactionIdFilter(
+    lru_size=settings.TRANSACTION_ID_FILTER_LRU_SIZE,
+    bloom_capacity=settings.TRANSACTION_ID_FILTER_BLOOM_CAPACITY,
+    bloom_error_rate=settings.TRANSACTION_ID_FILTER_BLOOM_ERROR_RATE,
+    seed_size=settings.TRANSACTION_ID_FILTER_SEED_SIZE,
+)
+
+cache_invalidation_bus.subscribe("transaction", TransactionService.handle_invalidation)
@@ -0,0 +1,180 @@
+"""Модуль для проверки подписей транзакций."""
+
+import asyncio
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import src.transactions.schemas as transaction_schemas
+from src import utils
+
+
+class TransactionSignatureVerifier:
+    """
+    Проверка подписей транзакций HMAC-SHA256.
+
+    Для каждого секрета заранее вычисляется состояние HMAC с ключом,
+    которое копируется для каждой подписи. Одновременно действуют
+    несколько секретов, что позволяет менять секрет без простоя:
+    новый секрет добавляется первым, а прежний удаляется после того,
+    как отправители перейдут на новый. Подписи сравниваются
+    за постоянное время.
+    """
+
+    def __init__(
+        self,
+        secrets: list[str],
+        is_legacy_enabled: bool,
+        batch_threshold: int,
+        workers: int = 0,
+    ):
+        """
+        Args:
+            secrets (list[str]): Действующие секреты, первый используется
+                для создания подписей.
+            is_legacy_enabled (bool): Принимать подписи прежнего формата
+                `sha256(account_id + amount + id + user_id + secret)`.
+            batch_threshold (int): Размер пакета, начиная с которого
+                проверка распределяется по пулу потоков.
+            workers (int): Количество потоков пула,
+                при 0 - количество процессоров.
+        """
+
+        self.secrets = secrets
+        self.is_legacy_enabled = is_legacy_enabled
+        self.batch_threshold = batch_threshold
+        self.workers = workers or os.cpu_count() or 1
+
+        self._keyed = [
+            hmac.new(secret.encode(), digestmod=hashlib.sha256) for secret in secrets
+        ]
+        self._executor: ThreadPoolExecutor | None = None
+
+    # MARK: Sign
+    @staticmethod
+    def get_message(data: transaction_schemas.TransactionSchema) -> bytes:
+        """
+        Получить подписываемое сообщение транзакции.
+
+        Поля разделяются символом `|`, поэтому разные значения полей
+        не дают одинаковое сообщение.
+
+        Args:
+            data (TransactionSchema): Данные транзакции.
+
+        Returns:
+            bytes: Подписываемое сообщение.
+        """
+
+        return (f"{data.account_id}|{data.amount}|{data.id}|{data.user_id}").encode()
+
+    def sign(self, data: transaction_schemas.TransactionSchema) -> str:
+        """
+        Подписать транзакцию первым действующим секретом.
+
+        Args:
+            data (TransactionSchema): Данные транзакции.
+
+        Returns:
+            str: Подпись транзакции в шестнадцатеричном виде.
+        """
+
+        keyed = self._keyed[0].copy()
+        keyed.update(self.get_message(data))
+        return keyed.hexdigest()
+
+    # MARK: Verify
+    def verify(self, data: transaction_schemas.TransactionSchema) -> bool:
+        """
+        Проверить подпись транзакции.
+
+        Args:
+            data (TransactionSchema): Данные транзакции.
+
+        Returns:
+            bool: True, если подпись создана одним из действующих секретов.
+        """
+
+        signature = data.signature.encode()
+        message = self.get_message(data)
+
+        for keyed in self._keyed:
+            candidate = keyed.copy()
+            candidate.update(message)
+            if hmac.compare_digest(candidate.hexdigest().encode(), signature):
+                return True
+
+        if self.is_legacy_enabled:
+            for secret in self.secrets:
+                legacy = utils.get_hash(
+                    str(data.account_id)
+                    + str(data.amount)
+                    + data.id
+                    + str(data.user_id)
+                    + secret
+                )
+                if hmac.compare_digest(legacy.encode(), signature):
+                    return True
+
+        return False
+
+    def verify_many(
+        self,
+        data: list[transaction_schemas.TransactionSchema],
+    ) -> list[bool]:
+        """
+        Проверить подписи нескольких транзакций.
+
+        Args:
+            data (list[TransactionSchema]): Транзакции.
+
+        Returns:
+            list[bool]: Результаты проверки в порядке транзакций.
+        """
+
+        return [self.verify(transaction) for transaction in data]
+
+    async def verify_batch(
+        self,
+        data: list[transaction_schemas.TransactionSchema],
+    ) -> list[bool]:
+        """
+        Проверить подписи пакета транзакций.
+
+        Пакеты от `batch_threshold` транзакций делятся на части,
+        которые проверяются в пуле потоков, не блокируя цикл событий.
+
+        Args:
+            data (list[TransactionSchema]): Пакет транзакций.
+
+        Returns:
+            list[bool]: Результаты проверки в порядке транзакций.
+        """
+
+        if len(data) < self.batch_threshold:
+            return self.verify_many(data)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="transaction-signature",
+            )
+
+        loop = asyncio.get_running_loop()
+        chunk_size = max(
+            self.batch_threshold // 2,
+            -(-len(data) // self.workers),
+        )
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._executor,
+                    self.verify_many,
+                    data[start : start + chunk_size],
+                )
+                for start in range(0, len(data), chunk_size)
+            )
+        )
+
+        return [result for chunk in chunks for result in chunk]
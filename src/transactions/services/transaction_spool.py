@@ -0,0 +1,443 @@
+"""Модуль для локального журнала транзакций при недоступности БД."""
+
+import asyncio
+import fcntl
+import logging
+import os
+import socket
+import zlib
+from typing import Any, Awaitable, BinaryIO, Callable
+
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.transactions.schemas as transaction_schemas
+from src.database import DATABASE_UNAVAILABLE_ERRORS
+
+logger = logging.getLogger(__name__)
+
+SpoolHandler = Callable[
+    [AsyncSession, list[transaction_schemas.TransactionSchema]],
+    Awaitable[set[str]],
+]
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".ndjson"
+DEAD_LETTER_FILE_NAME = "dead-letter.ndjson"
+
+
+class TransactionSpool:
+    """
+    Локальный журнал транзакций с проверенной подписью, только для дозаписи.
+
+    Журнал состоит из сегментов, в каждой строке которых хранится
+    контрольная сумма CRC32 и транзакция в формате JSON. Записи,
+    поступившие в течение `fsync_window_seconds`, сбрасываются на диск
+    одним `fsync`. Повторная запись журнала в БД выполняется
+    по сегментам, от старых к новым; повторы транзакций пропускаются
+    по `id`, поэтому сегмент можно записывать повторно.
+
+    Процессы, использующие одну директорию, пишут в свои сегменты,
+    в имени которых указаны хост и PID процесса. Процесс держит
+    блокировку `flock` открытого сегмента до его закрытия, а повторная
+    запись берет сегмент только под этой же блокировкой, поэтому
+    не затрагивает сегменты, в которые еще пишут другие процессы.
+    Сегменты завершившихся процессов записываются любым процессом.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        handler: SpoolHandler,
+        session_factory: async_sessionmaker[AsyncSession],
+        segment_max_bytes: int,
+        fsync_window_seconds: float,
+        replay_interval_seconds: float,
+        batch_size: int,
+        on_created: Callable[[set[str]], None] | None = None,
+    ):
+        """
+        Args:
+            directory (str): Директория сегментов журнала.
+            handler (SpoolHandler):
+                Функция добавления пакета транзакций в сессию без коммита,
+                возвращающая `id` созданных транзакций.
+            session_factory (async_sessionmaker[AsyncSession]):
+                Фабрика сессий для повторной записи журнала.
+            segment_max_bytes (int): Размер сегмента, после которого
+                записи продолжаются в новый сегмент.
+            fsync_window_seconds (float): Окно накопления записей перед `fsync`.
+            replay_interval_seconds (float): Интервал повторной записи журнала.
+            batch_size (int): Размер пакета при повторной записи журнала.
+            on_created (Callable[[set[str]], None] | None):
+                Функция, вызываемая с `id` созданных транзакций после коммита.
+        """
+
+        self.directory = directory
+        self.handler = handler
+        self.session_factory = session_factory
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_window_seconds = fsync_window_seconds
+        self.replay_interval_seconds = replay_interval_seconds
+        self.batch_size = batch_size
+        self.on_created = on_created
+
+        self.spooled_total = 0
+        self.replayed_total = 0
+        self.duplicates_total = 0
+        self.dead_letters_total = 0
+        self.corrupted_total = 0
+        self.fsyncs_total = 0
+
+        self._file = None
+        self._file_size = 0
+        self._next_segment_number: int | None = None
+        self._pending: list[tuple[bytes, asyncio.Future]] = []
+        self._pending_ids: set[str] = set()
+        self._write_lock = asyncio.Lock()
+        self._replay_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._replay_task: asyncio.Task | None = None
+
+    # MARK: Lifecycle
+    def start(self) -> None:
+        """Запустить периодическую повторную запись журнала в БД."""
+
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = asyncio.create_task(self._run_replay())
+
+    async def stop(self) -> None:
+        """Сбросить накопленные записи на диск и закрыть текущий сегмент."""
+
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+            await asyncio.gather(self._replay_task, return_exceptions=True)
+            self._replay_task = None
+
+        if self._flush_task is not None:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+
+        async with self._write_lock:
+            await asyncio.to_thread(self._seal_segment)
+
+    # MARK: Append
+    async def append(self, data: transaction_schemas.TransactionSchema) -> None:
+        """
+        Записать транзакцию в журнал и дождаться ее сброса на диск.
+
+        Args:
+            data (TransactionSchema): Транзакция с проверенной подписью.
+        """
+
+        self.start()
+
+        payload = data.model_dump_json().encode()
+        line = b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((line, future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+
+        await future
+
+        self.spooled_total += 1
+        self._pending_ids.add(data.id)
+
+    def contains(self, id: str) -> bool:
+        """
+        Проверить, ожидает ли транзакция повторной записи в БД.
+
+        Учитываются только транзакции, записанные в журнал текущим процессом.
+
+        Args:
+            id (str): ID транзакции.
+
+        Returns:
+            bool: True, если транзакция ожидает повторной записи.
+        """
+
+        return id in self._pending_ids
+
+    async def _flush(self) -> None:
+        """Сбрасывать на диск записи, накопленные за окно `fsync`."""
+
+        while self._pending:
+            await asyncio.sleep(self.fsync_window_seconds)
+
+            async with self._write_lock:
+                pending, self._pending = self._pending, []
+
+                try:
+                    await asyncio.to_thread(
+                        self._write_lines,
+                        [line for line, _ in pending],
+                    )
+                except Exception as ex:
+                    for _, future in pending:
+                        if not future.done():
+                            future.set_exception(ex)
+                    continue
+
+            for _, future in pending:
+                if not future.done():
+                    future.set_result(None)
+
+    # MARK: Replay
+    async def replay(self) -> int:
+        """
+        Записать в БД транзакции из всех сегментов журнала.
+
+        Текущий сегмент закрывается, а новые записи продолжаются
+        в следующий. Записанный сегмент удаляется. Если БД недоступна,
+        запись прерывается, и сегмент остается в журнале.
+
+        Returns:
+            int: Количество созданных транзакций.
+        """
+
+        async with self._replay_lock:
+            # Сегменты, открытые после закрытия текущего, записываются
+            # при следующем запуске
+            async with self._write_lock:
+                await asyncio.to_thread(self._seal_segment)
+                paths = await asyncio.to_thread(self._list_segments)
+
+            created_total = 0
+            for path in paths:
+                # Сегмент, в который пишет или который записывает
+                # другой процесс, пропускается
+                file = await asyncio.to_thread(self._lock_segment, path)
+                if file is None:
+                    continue
+
+                try:
+                    records = await asyncio.to_thread(self._read_segment, file)
+
+                    for start in range(0, len(records), self.batch_size):
+                        created_total += await self._replay_batch(
+                            records[start : start + self.batch_size]
+                        )
+
+                    await asyncio.to_thread(os.remove, path)
+                finally:
+                    file.close()
+
+                self._pending_ids.difference_update(record.id for record in records)
+
+            return created_total
+
+    async def _replay_batch(
+        self,
+        batch: list[transaction_schemas.TransactionSchema],
+    ) -> int:
+        """
+        Записать пакет транзакций журнала в БД.
+
+        При ошибке запроса, например ошибке целостности или данных,
+        транзакции пакета записываются по одной, а транзакции, которые
+        не удается записать, переносятся в отдельный файл для разбора.
+        Ошибка недоступности БД прерывает повторную запись.
+        """
+
+        try:
+            async with self.session_factory() as session:
+                created_ids = await self.handler(session, batch)
+                await session.commit()
+
+        except DATABASE_UNAVAILABLE_ERRORS:
+            raise
+
+        except DBAPIError:
+            if len(batch) == 1:
+                logger.exception("Moving spooled transaction to dead letters")
+                await asyncio.to_thread(self._write_dead_letter, batch[0])
+                self.dead_letters_total += 1
+                return 0
+
+            created_total = 0
+            for data in batch:
+                created_total += await self._replay_batch([data])
+            return created_total
+
+        if self.on_created is not None:
+            self.on_created(created_ids)
+
+        self.replayed_total += len(created_ids)
+        self.duplicates_total += len(batch) - len(created_ids)
+
+        return len(created_ids)
+
+    async def _run_replay(self) -> None:
+        """Периодически записывать журнал в БД."""
+
+        while True:
+            await asyncio.sleep(self.replay_interval_seconds)
+
+            try:
+                await self.replay()
+            except Exception:
+                logger.exception("Failed to replay spooled transactions")
+
+    # MARK: Stats
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики журнала.
+
+        Returns:
+            dict[str, Any]: Метрики журнала.
+        """
+
+        segments = self._list_segments()
+
+        size_bytes = 0
+        for path in segments:
+            # Сегмент мог быть удален повторной записью другого процесса
+            try:
+                size_bytes += os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+
+        return {
+            "segments": len(segments),
+            "size_bytes": size_bytes,
+            "pending": len(self._pending_ids),
+            "spooled_total": self.spooled_total,
+            "replayed_total": self.replayed_total,
+            "duplicates_total": self.duplicates_total,
+            "dead_letters_total": self.dead_letters_total,
+            "corrupted_total": self.corrupted_total,
+            "fsyncs_total": self.fsyncs_total,
+        }
+
+    # MARK: Files
+    def _list_segments(self) -> list[str]:
+        """Получить пути сегментов журнала, от старых к новым."""
+
+        if not os.path.isdir(self.directory):
+            return []
+
+        return [
+            os.path.join(self.directory, name)
+            for name in sorted(os.listdir(self.directory))
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        ]
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """Дописать строки в текущий сегмент и сбросить их на диск."""
+
+        if self._file is None:
+            self._open_segment()
+
+        data = b"".join(lines)
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self.fsyncs_total += 1
+        self._file_size += len(data)
+
+        if self._file_size >= self.segment_max_bytes:
+            self._seal_segment()
+
+    def _open_segment(self) -> None:
+        """Открыть новый сегмент, следующий за существующими."""
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        if self._next_segment_number is None:
+            segments = self._list_segments()
+            self._next_segment_number = 0
+            if segments:
+                name = os.path.basename(segments[-1])
+                number = name.removeprefix(SEGMENT_PREFIX).removesuffix(SEGMENT_SUFFIX)
+                self._next_segment_number = int(number.split("-", 1)[0]) + 1
+
+        path = os.path.join(
+            self.directory,
+            f"{SEGMENT_PREFIX}{self._next_segment_number:020d}"
+            f"-{socket.gethostname()}-{os.getpid()}{SEGMENT_SUFFIX}",
+        )
+        self._next_segment_number += 1
+
+        self._file = open(path, "ab")
+        self._file_size = 0
+
+        # Блокировка снимается при закрытии сегмента или завершении процесса
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+
+        # Сброс записи о новом файле в директории
+        directory_fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+    def _seal_segment(self) -> None:
+        """Закрыть текущий сегмент, чтобы записи продолжились в следующий."""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_size = 0
+
+    def _lock_segment(self, path: str) -> BinaryIO | None:
+        """
+        Открыть сегмент и взять его блокировку для повторной записи.
+
+        Returns:
+            BinaryIO | None: Открытый сегмент под блокировкой или None,
+                если в сегмент пишет или его записывает другой процесс
+                либо сегмент уже удален.
+        """
+
+        try:
+            file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            # Сегмент мог быть записан и удален, пока ожидалась блокировка
+            if os.stat(path).st_ino != os.fstat(file.fileno()).st_ino:
+                raise FileNotFoundError(path)
+        except (BlockingIOError, FileNotFoundError):
+            file.close()
+            return None
+
+        return file
+
+    def _read_segment(
+        self,
+        file: BinaryIO,
+    ) -> list[transaction_schemas.TransactionSchema]:
+        """
+        Прочитать транзакции сегмента.
+
+        Строки с неверной контрольной суммой, например недописанная
+        последняя строка после аварийного завершения, пропускаются.
+        """
+
+        records = []
+        for line in file:
+            checksum, _, payload = line.rstrip(b"\n").partition(b" ")
+            try:
+                if int(checksum, 16) != zlib.crc32(payload):
+                    raise ValueError(checksum)
+                records.append(
+                    transaction_schemas.TransactionSchema.model_validate_json(payload)
+                )
+            except (ValueError, ValidationError):
+                self.corrupted_total += 1
+
+        return records
+
+    def _write_dead_letter(self, data: transaction_schemas.TransactionSchema) -> None:
+        """Дописать транзакцию, которую не удалось записать в БД."""
+
+        with open(os.path.join(self.directory, DEAD_LETTER_FILE_NAME), "ab") as file:
+            file.write(data.model_dump_json().encode() + b"\n")
+            file.flush()
+            os.fsync(file.fileno())
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP
+from sqlalchemy import TIMESTAMP, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.accounts.models import AccountModel
@@ -16,6 +16,7 @@ class UserModel(Base):
     """SQLAlchemy модель пользователя."""
 
     __tablename__ = "users"
+    __table_args__ = (Index("users_created_at_id_idx", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         default=uuid.uuid4,
@@ -36,6 +37,13 @@ class UserModel(Base):
         default=False,
         comment="Является ли пользователь администратором.",
     )
+    token_version: Mapped[int] = mapped_column(
+        default=0,
+        server_default="0",
+        comment=(
+            "Версия токенов пользователя. Токены с другой версией недействительны."
+        ),
+    )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=CURRENT_TIMESTAMP_UTC,
@@ -52,3 +60,29 @@ class UserModel(Base):
     transactions: Mapped[list[TransactionModel]] = relationship(
         back_populates="user",
     )
+
+
+# Индексы поиска по `lower()` текстовых полей: `gin_trgm_ops` для подстроки
+# и `text_pattern_ops` для начала строки, см. `src.search`
+Index(
+    "users_email_trgm_idx",
+    func.lower(UserModel.email).label("lower_email"),
+    postgresql_using="gin",
+    postgresql_ops={"lower_email": "gin_trgm_ops"},
+)
+Index(
+    "users_full_name_trgm_idx",
+    func.lower(UserModel.full_name).label("lower_full_name"),
+    postgresql_using="gin",
+    postgresql_ops={"lower_full_name": "gin_trgm_ops"},
+)
+Index(
+    "users_email_lower_idx",
+    func.lower(UserModel.email).label("lower_email"),
+    postgresql_ops={"lower_email": "text_pattern_ops"},
+)
+Index(
+    "users_full_name_lower_idx",
+    func.lower(UserModel.full_name).label("lower_full_name"),
+    postgresql_ops={"lower_full_name": "text_pattern_ops"},
+)
@@ -1,10 +1,14 @@
 """Модуль для репозиториев пользователей."""
 
+import uuid
 from typing import Tuple
 
-from sqlalchemy import Select, select
+from sqlalchemy import Row, Select, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 import src.users.schemas as user_schemas
+from src import search
 from src.base_repository import BaseRepository
 from src.users.models import UserModel
 
@@ -35,25 +39,19 @@ class UserRepository(
         применив основные query параметры без учета пагинации,
         для получения списка пользователей.
 
+        При сортировке `relevance` пользователи сортируются по убыванию
+        сходства `email` и `full_name` с искомыми значениями.
+
         Returns:
             stmt: Подготовленное выражение для запроса в БД.
         """
 
         stmt = select(UserModel)
 
-        # Фильтрация по текстовым полям с использованием ilike.
-        text_fields = {
-            "email": query_params.email,
-            "full_name": query_params.full_name,
-        }
-
-        for field_name, field_value in text_fields.items():
-            if field_value:
-                stmt = stmt.where(
-                    UserModel.__getattribute__(field_name).ilike(
-                        f"%{field_value.lower()}%"
-                    )
-                )
+        # Поиск по текстовым полям, вид поиска выбирается по длине значения.
+        search_fields = cls.get_search_fields(query_params)
+        for field, value in search_fields.items():
+            stmt = stmt.where(search.get_search_condition(field, value))
 
         # Фильтрация статусу пользователя на платформе.
         if query_params.is_admin is not None:
@@ -62,10 +60,114 @@ class UserRepository(
             else:
                 stmt = stmt.where(UserModel.is_admin.is_(False))
 
+        # Сортировка по сходству с искомыми значениями.
+        if search_fields and query_params.order_by != "created_at":
+            return stmt.order_by(
+                search.get_search_rank(search_fields).desc(),
+                UserModel.id,
+            )
+
         # Сортировка по дате создания.
         if not query_params.asc:
-            stmt = stmt.order_by(UserModel.created_at.desc())
+            stmt = stmt.order_by(UserModel.created_at.desc(), UserModel.id.desc())
         else:
-            stmt = stmt.order_by(UserModel.created_at)
+            stmt = stmt.order_by(UserModel.created_at, UserModel.id)
 
         return stmt
+
+    @classmethod
+    def get_search_fields(
+        cls,
+        query_params: user_schemas.UsersQuerySchema,
+    ) -> dict[InstrumentedAttribute, str]:
+        """
+        Получить текстовые поля поиска и искомые значения из query параметров.
+
+        Returns:
+            dict[InstrumentedAttribute, str]: Поля и непустые искомые значения.
+        """
+
+        text_fields = {
+            UserModel.email: query_params.email,
+            UserModel.full_name: query_params.full_name,
+        }
+
+        return {
+            field: value
+            for field, value in text_fields.items()
+            if value and value.strip()
+        }
+
+    @classmethod
+    async def find_identity(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+    ) -> Row | None:
+        """
+        Получить только данные пользователя, необходимые для авторизации.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (uuid.UUID): ID пользователя.
+
+        Returns:
+            Row | None: `id`, `is_admin` и `token_version` пользователя
+                или None, если пользователь не найден.
+        """
+
+        stmt = select(
+            UserModel.id,
+            UserModel.is_admin,
+            UserModel.token_version,
+        ).where(UserModel.id == id)
+        result = await session.execute(stmt)
+        return result.one_or_none()
+
+    @classmethod
+    async def find_token_version(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+    ) -> int | None:
+        """
+        Получить версию токенов пользователя.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (uuid.UUID): ID пользователя.
+
+        Returns:
+            int | None: Версия токенов или None, если пользователь не найден.
+        """
+
+        stmt = select(UserModel.token_version).where(UserModel.id == id)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def increment_token_version(
+        cls,
+        session: AsyncSession,
+        id: uuid.UUID,
+    ) -> int:
+        """
+        Увеличить версию токенов пользователя в текущей сессии,
+        сделав ранее выданные токены недействительными.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            id (uuid.UUID): ID пользователя.
+
+        Returns:
+            int: Новая версия токенов пользователя.
+        """
+
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == id)
+            .values(token_version=UserModel.token_version + 1)
+            .returning(UserModel.token_version)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one()
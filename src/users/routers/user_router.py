@@ -5,7 +5,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.users.schemas as user_schemas
 from src import dependencies
-from src.users.models import UserModel
 from src.users.services import UserService
 
 user_router = APIRouter(
@@ -22,7 +21,8 @@ user_router = APIRouter(
     response_model=user_schemas.UserReadSchema,
 )
 async def get_current_user_route(
-    user: UserModel = Depends(dependencies.get_current_user),
+    session: AsyncSession = Depends(dependencies.get_read_session),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
 ) -> user_schemas.UserReadSchema:
     """
     Получить данные текущего пользователя.
@@ -30,7 +30,7 @@ async def get_current_user_route(
     Доступно авторизованному пользователю.
     """
 
-    return user_schemas.UserReadSchema.model_validate(user)
+    return await UserService.get_by_id(session, user.id)
 
 
 @user_router.get(
@@ -42,7 +42,7 @@ async def get_current_user_route(
 )
 async def get_user_by_id_route(
     id: str,
-    session: AsyncSession = Depends(dependencies.get_session),
+    session: AsyncSession = Depends(dependencies.get_read_session),
 ) -> user_schemas.UserReadSchema:
     """
     Получить данные пользователя по id.
@@ -62,7 +62,7 @@ async def get_user_by_id_route(
 )
 async def get_users_by_admin_route(
     query_params: user_schemas.UsersQuerySchema = Query(),
-    session: AsyncSession = Depends(dependencies.get_session),
+    session: AsyncSession = Depends(dependencies.get_read_session),
 ) -> user_schemas.UserListReadSchema:
     """
     Получить список пользователей и их общее количество
@@ -94,6 +94,25 @@ async def create_user_by_admin_route(
     return await UserService.create(session, data)
 
 
+@user_router.post(
+    "/{id}/revoke_tokens",
+    summary="Администратор. Отозвать токены пользователя.",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(dependencies.get_current_admin)],
+)
+async def revoke_user_tokens_by_admin_route(
+    id: str,
+    session: AsyncSession = Depends(dependencies.get_session),
+) -> None:
+    """
+    Отозвать все выданные пользователю токены.
+
+    Доступно только администратору.
+    """
+
+    await UserService.revoke_tokens(session, id)
+
+
 # MARK: Patch
 @user_router.patch(
     "/me",
@@ -105,7 +124,7 @@ async def create_user_by_admin_route(
 async def update_user_route(
     data: user_schemas.UserUpdateSchema,
     session: AsyncSession = Depends(dependencies.get_session),
-    user: UserModel = Depends(dependencies.get_current_user),
+    user: user_schemas.UserIdentitySchema = Depends(dependencies.get_current_user),
 ) -> user_schemas.UserReadSchema:
     """
     Обновить данные текущего пользователя.
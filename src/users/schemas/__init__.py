@@ -3,6 +3,7 @@ from src.users.schemas.user_schema import (
     UserCreateRepositoryAdminSchema,
     UserCreateRepositorySchema,
     UserCreateSchema,
+    UserIdentitySchema,
     UserListReadSchema,
     UserLoginSchema,
     UserReadAdminSchema,
@@ -28,4 +29,5 @@ __all__ = [
     "UserUpdateRepositorySchema",
     "UserCreateRepositoryAdminSchema",
     "UserCreateRepositorySchema",
+    "UserIdentitySchema",
 ]
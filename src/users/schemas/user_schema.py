@@ -1,13 +1,19 @@
 """Модуль для Pydantic схем пользователей."""
 
 import uuid
+from typing import Literal
 
 from pydantic import (
     BaseModel,
     Field,
 )
 
-from src.schemas import DataListReadBaseSchema, PaginationBaseSchema
+from src.schemas import (
+    CountQueryBaseSchema,
+    CursorListReadBaseSchema,
+    DataListReadBaseSchema,
+    PaginationBaseSchema,
+)
 
 
 # MARK: User
@@ -23,6 +29,20 @@ class UserReadSchema(BaseModel):
         from_attributes = True
 
 
+class UserIdentitySchema(BaseModel):
+    """Pydantic схема данных пользователя, необходимых для авторизации."""
+
+    id: uuid.UUID = Field(description="ID пользователя.")
+    is_admin: bool = Field(description="Является ли пользователь администратором.")
+    token_version: int = Field(
+        default=0,
+        description="Версия действующих токенов пользователя.",
+    )
+
+    class Config:
+        from_attributes = True
+
+
 class UserLoginSchema(BaseModel):
     """Pydantic схема для авторизации пользователя."""
 
@@ -125,7 +145,7 @@ class UserUpdateRepositoryAdminSchema(UserUpdateRepositorySchema):
     )
 
 
-class UserListReadSchema(DataListReadBaseSchema):
+class UserListReadSchema(DataListReadBaseSchema, CursorListReadBaseSchema):
     """Pydantic схема для получения пользователя."""
 
     users: list[UserReadAdminSchema] = Field(
@@ -134,28 +154,50 @@ class UserListReadSchema(DataListReadBaseSchema):
 
 
 # MARK: Query
-class UsersQuerySchema(PaginationBaseSchema):
+class UsersQuerySchema(PaginationBaseSchema, CountQueryBaseSchema):
     """
     Основная схема query параметров для запроса
     списка пользователей от имени администратора.
     """
 
+    cursor: str | None = Field(
+        default=None,
+        description=(
+            "Курсор страницы, полученный в поле `next_cursor`. "
+            "Если передан, `offset` не учитывается."
+        ),
+    )
     id: uuid.UUID | None = Field(
         default=None,
         description="ID пользователя.",
     )
     email: str | None = Field(
         default=None,
-        description="Электронная почта пользователя.",
+        description=(
+            "Часть электронной почты пользователя без учета регистра. "
+            "Значения короче 3 символов ищутся по началу почты."
+        ),
     )
     full_name: str | None = Field(
         default=None,
-        description="Полное имя пользователя.",
+        description=(
+            "Часть полного имени пользователя без учета регистра. "
+            "Значения короче 3 символов ищутся по началу имени."
+        ),
     )
     is_admin: bool | None = Field(
         default=None,
         description="Является ли пользователь администратором.",
     )
+    order_by: Literal["created_at", "relevance"] | None = Field(
+        default=None,
+        description=(
+            "Сортировка пользователей: `created_at` - по дате создания, "
+            "`relevance` - по сходству `email` и `full_name` с искомыми "
+            "значениями с пагинацией по `offset`, без `cursor`. "
+            "По умолчанию — `relevance` при поиске, иначе `created_at`."
+        ),
+    )
     asc: bool = Field(
         default=False,
         description=(
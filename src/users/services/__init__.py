@@ -1,5 +1,9 @@
+from src.users.services.password_service import PasswordService
+from src.users.services.user_cache_service import UserCacheService
 from src.users.services.user_service import UserService
 
 __all__ = [
+    "PasswordService",
+    "UserCacheService",
     "UserService",
 ]
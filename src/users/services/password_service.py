@@ -0,0 +1,191 @@
+"""Модуль для сервиса хэширования паролей."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from src import utils
+from src.settings import settings
+
+SCRYPT_PREFIX = "scrypt"
+
+
+class PasswordService:
+    """
+    Сервис для хэширования и проверки паролей.
+
+    Пароли хэшируются функцией `scrypt` с солью в пуле из
+    `PASSWORD_HASH_WORKERS` потоков, поэтому хэширование не блокирует
+    цикл событий, а одновременно выполняется не больше
+    `PASSWORD_HASH_WORKERS` вычислений. Хэш хранится в виде
+    `scrypt$<n>$<r>$<p>$<соль>$<хэш>`.
+
+    Также проверяются хэши прежнего формата - SHA-256 без соли.
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+    _dummy_hash: str | None = None
+
+    # MARK: Utils
+    @staticmethod
+    def _scrypt(
+        password: str,
+        salt: bytes,
+        n: int,
+        r: int,
+        p: int,
+        length: int,
+    ) -> bytes:
+        """Вычислить хэш пароля функцией `scrypt`."""
+
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            # Память, необходимая scrypt, с запасом
+            maxmem=128 * r * (n + p + 2) + 1024 * 1024,
+            dklen=length,
+        )
+
+    @classmethod
+    async def _run(
+        cls,
+        password: str,
+        salt: bytes,
+        n: int,
+        r: int,
+        p: int,
+        length: int,
+    ) -> bytes:
+        """Вычислить хэш пароля в пуле потоков."""
+
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            cls._executor,
+            cls._scrypt,
+            password,
+            salt,
+            n,
+            r,
+            p,
+            length,
+        )
+
+    @staticmethod
+    def _encode(data: bytes) -> str:
+        return base64.b64encode(data).decode()
+
+    # MARK: Hash
+    @classmethod
+    async def hash(cls, password: str) -> str:
+        """
+        Захэшировать пароль с текущими параметрами `scrypt`.
+
+        Args:
+            password (str): Пароль.
+
+        Returns:
+            str: Хэш пароля с параметрами и солью.
+        """
+
+        n = settings.PASSWORD_HASH_SCRYPT_N
+        r = settings.PASSWORD_HASH_SCRYPT_R
+        p = settings.PASSWORD_HASH_SCRYPT_P
+        salt = os.urandom(settings.PASSWORD_HASH_SALT_LENGTH)
+
+        hashed = await cls._run(password, salt, n, r, p, settings.PASSWORD_HASH_LENGTH)
+
+        return "$".join(
+            (
+                SCRYPT_PREFIX,
+                str(n),
+                str(r),
+                str(p),
+                cls._encode(salt),
+                cls._encode(hashed),
+            )
+        )
+
+    # MARK: Verify
+    @classmethod
+    async def verify(cls, password: str, hashed_password: str) -> bool:
+        """
+        Проверить пароль.
+
+        Args:
+            password (str): Пароль.
+            hashed_password (str): Хэш пароля из БД.
+
+        Returns:
+            bool: True, если пароль соответствует хэшу.
+        """
+
+        if not hashed_password.startswith(f"{SCRYPT_PREFIX}$"):
+            return hmac.compare_digest(
+                utils.get_hash(password).encode(),
+                hashed_password.encode(),
+            )
+
+        try:
+            _, n, r, p, salt, expected = hashed_password.split("$")
+            salt_bytes = base64.b64decode(salt)
+            expected_bytes = base64.b64decode(expected)
+            n, r, p = int(n), int(r), int(p)
+        except ValueError:
+            return False
+
+        hashed = await cls._run(password, salt_bytes, n, r, p, len(expected_bytes))
+        return hmac.compare_digest(hashed, expected_bytes)
+
+    @classmethod
+    async def get_dummy_hash(cls) -> str:
+        """
+        Вернуть хэш случайного пароля с текущими параметрами `scrypt`.
+
+        Используется для проверки пароля, когда пользователь не найден,
+        чтобы время ответа не выдавало существование email.
+
+        Returns:
+            str: Хэш, вычисленный один раз на процесс.
+        """
+
+        if cls._dummy_hash is None:
+            cls._dummy_hash = await cls.hash(cls._encode(os.urandom(16)))
+
+        return cls._dummy_hash
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        Проверить, нужно ли пересчитать хэш пароля.
+
+        Хэш пересчитывается, если он имеет прежний формат
+        или получен с другими параметрами `scrypt`.
+
+        Args:
+            hashed_password (str): Хэш пароля из БД.
+
+        Returns:
+            bool: True, если хэш нужно пересчитать.
+        """
+
+        parameters = "$".join(
+            (
+                SCRYPT_PREFIX,
+                str(settings.PASSWORD_HASH_SCRYPT_N),
+                str(settings.PASSWORD_HASH_SCRYPT_R),
+                str(settings.PASSWORD_HASH_SCRYPT_P),
+            )
+        )
+        return not hashed_password.startswith(f"{parameters}$")
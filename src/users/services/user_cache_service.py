@@ -0,0 +1,218 @@
+"""Модуль для сервиса кэша пользователей."""
+
+import os
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.users.schemas as user_schemas
+from src import exceptions, utils
+from src.cache_invalidation import cache_invalidation_bus
+from src.settings import settings
+from src.users.repositories import UserRepository
+
+
+def _create_cache(
+    name: str,
+    value_format: str,
+) -> utils.TTLCache | utils.SharedMemoryCache:
+    """
+    Создать кэш в разделяемой памяти, если задан `USER_CACHE_SHARED_DIR`,
+    иначе - в памяти процесса.
+
+    Args:
+        name (str): Название кэша.
+        value_format (str): Формат значения `struct` для разделяемой памяти.
+    """
+
+    if settings.USER_CACHE_SHARED_DIR:
+        return utils.SharedMemoryCache(
+            path=os.path.join(settings.USER_CACHE_SHARED_DIR, f"{name}.cache"),
+            max_size=settings.USER_CACHE_MAX_SIZE,
+            ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+            value_format=value_format,
+        )
+
+    return utils.TTLCache(
+        max_size=settings.USER_CACHE_MAX_SIZE,
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    )
+
+
+class UserCacheService:
+    """
+    Сервис кэша данных пользователей, необходимых для авторизации.
+
+    Кэш сбрасывается для пользователя при его изменении или удалении.
+    По умолчанию кэш хранится в памяти процесса, и изменения, выполненные
+    другими процессами, становятся видны не позже, чем через
+    `USER_CACHE_TTL_SECONDS`. При `USER_CACHE_SHARED_DIR` кэш хранится
+    в разделяемой памяти, общей для всех процессов хоста, поэтому
+    сброс виден всем процессам сразу. При `CACHE_INVALIDATION_ENABLED`
+    кэш сбрасывается по событиям `cache_invalidation_bus` от процессов
+    других хостов.
+
+    В кэше хранятся кортежи `(is_admin, token_version)` и `(token_version,)`
+    или None, если пользователь не найден.
+    """
+
+    _cache = _create_cache(name="users", value_format="?q")
+    _token_versions = _create_cache(name="user_token_versions", value_format="q")
+
+    # MARK: Get
+    @classmethod
+    async def get_identity(
+        cls,
+        session: AsyncSession,
+        user_id: uuid.UUID | str,
+    ) -> user_schemas.UserIdentitySchema:
+        """
+        Получить данные пользователя для авторизации из кэша или БД.
+
+        Отсутствие пользователя также кэшируется.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            user_id (uuid.UUID | str): ID пользователя.
+
+        Returns:
+            UserIdentitySchema: Данные пользователя для авторизации.
+
+        Raises:
+            UserNotFoundException: Пользователь не найден.
+        """
+
+        user_id = uuid.UUID(str(user_id))
+
+        if settings.USER_CACHE_ENABLED:
+            cached = cls._cache.get(user_id)
+            if cached is not utils.MISSING:
+                if cached is None:
+                    raise exceptions.UserNotFoundException
+
+                is_admin, token_version = cached
+                return user_schemas.UserIdentitySchema(
+                    id=user_id,
+                    is_admin=is_admin,
+                    token_version=token_version,
+                )
+
+        # Поколение запоминается до запроса, чтобы не записывать в кэш
+        # данные, прочитанные до сброса
+        generation = cls._cache.generation
+        user_db = await UserRepository.find_identity(session=session, id=user_id)
+
+        if settings.USER_CACHE_ENABLED:
+            cls._cache.set(
+                user_id,
+                (user_db.is_admin, user_db.token_version)
+                if user_db is not None
+                else None,
+                generation=generation,
+            )
+
+        if user_db is None:
+            raise exceptions.UserNotFoundException
+
+        return user_schemas.UserIdentitySchema.model_validate(user_db)
+
+    @classmethod
+    async def get_token_version(
+        cls,
+        session: AsyncSession,
+        user_id: uuid.UUID | str,
+    ) -> int:
+        """
+        Получить версию действующих токенов пользователя из кэша или БД.
+
+        Используется для отзыва токенов при авторизации по утверждениям
+        токена, когда остальные данные пользователя не нужны.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            user_id (uuid.UUID | str): ID пользователя.
+
+        Returns:
+            int: Версия токенов пользователя.
+
+        Raises:
+            UserNotFoundException: Пользователь не найден.
+        """
+
+        user_id = uuid.UUID(str(user_id))
+
+        if settings.USER_CACHE_ENABLED:
+            cached = cls._token_versions.get(user_id)
+            if cached is not utils.MISSING:
+                if cached is None:
+                    raise exceptions.UserNotFoundException
+                return cached[0]
+
+        generation = cls._token_versions.generation
+        token_version = await UserRepository.find_token_version(
+            session=session,
+            id=user_id,
+        )
+
+        if settings.USER_CACHE_ENABLED:
+            cls._token_versions.set(
+                user_id,
+                (token_version,) if token_version is not None else None,
+                generation=generation,
+            )
+
+        if token_version is None:
+            raise exceptions.UserNotFoundException
+
+        return token_version
+
+    @classmethod
+    def get_stats(cls) -> dict[str, Any]:
+        """
+        Получить метрики кэша пользователей.
+
+        Returns:
+            dict[str, Any]: Метрики кэша данных пользователей
+                и кэша версий токенов.
+        """
+
+        return {
+            "users": cls._cache.get_stats(),
+            "user_token_versions": cls._token_versions.get_stats(),
+        }
+
+    # MARK: Invalidate
+    @classmethod
+    def invalidate(cls, user_id: uuid.UUID | str) -> None:
+        """
+        Сбросить кэш пользователя.
+
+        Args:
+            user_id (uuid.UUID | str): ID пользователя.
+        """
+
+        user_id = uuid.UUID(str(user_id))
+
+        cls._cache.delete(user_id)
+        cls._token_versions.delete(user_id)
+
+    @classmethod
+    def handle_invalidation(cls, user_id: str | None, version: int | None) -> None:
+        """
+        Обработать событие изменения пользователя из другого процесса.
+
+        Args:
+            user_id (str | None): ID пользователя или None,
+                если нужно сбросить весь кэш.
+            version (int | None): Новая версия токенов пользователя.
+        """
+
+        if user_id is None:
+            cls._cache.clear()
+            cls._token_versions.clear()
+        else:
+            cls.invalidate(user_id)
+
+
+cache_invalidation_bus.subscribe("user", UserCacheService.handle_invalidation)
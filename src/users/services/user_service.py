@@ -6,9 +6,13 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.users.schemas as user_schemas
-from src import exceptions, utils
+from src import exceptions
+from src.cache_invalidation import cache_invalidation_bus
+from src.settings import settings
 from src.users.models import UserModel
 from src.users.repositories import UserRepository
+from src.users.services.password_service import PasswordService
+from src.users.services.user_cache_service import UserCacheService
 
 
 class UserService:
@@ -38,7 +42,7 @@ class UserService:
 
         try:
             # Хэширование пароля
-            hashed_password = utils.get_hash(data.password)
+            hashed_password = await PasswordService.hash(data.password)
             data = user_schemas.UserCreateRepositorySchema(
                 email=data.email,
                 hashed_password=hashed_password,
@@ -95,6 +99,11 @@ class UserService:
         Получить список пользователей и их общее количество
         с фильтрацией по query параметрам, отличным от None.
 
+        Количество считается по стратегии `count_strategy`,
+        по умолчанию - `DB_COUNT_STRATEGY`. Результаты поиска
+        по `email` и `full_name` по умолчанию сортируются по сходству
+        с искомыми значениями и пагинируются по `offset`.
+
         Args:
             session (AsyncSession): Сессия для работы с базой данных.
             query_params (UsersQuerySchema): Query параметры для фильтрации.
@@ -104,29 +113,64 @@ class UserService:
 
         Raises:
             UserNotFoundException: Пользователи не найдены.
+            InvalidCursorException: Некорректный курсор пагинации.
         """
 
         base_stmt = await UserRepository.get_users_stmt_by_query(
             query_params=query_params,
         )
-        users = await UserRepository.get_all_with_pagination_from_stmt(
+        count_strategy = query_params.count_strategy or settings.DB_COUNT_STRATEGY
+
+        # Результаты поиска сортируются по сходству и пагинируются по `offset`
+        if (
+            UserRepository.get_search_fields(query_params)
+            and query_params.order_by != "created_at"
+        ):
+            users = await UserRepository.get_all_with_pagination_from_stmt(
+                session=session,
+                limit=query_params.limit,
+                offset=query_params.offset,
+                stmt=base_stmt,
+            )
+            if not users:
+                raise exceptions.UserNotFoundException
+
+            users_count, count_accuracy = await UserRepository.count_from_stmt(
+                session=session,
+                stmt=base_stmt,
+                strategy=count_strategy,
+            )
+
+            return user_schemas.UserListReadSchema(
+                count=users_count,
+                count_accuracy=count_accuracy,
+                users=users,
+            )
+
+        (
+            users,
+            next_cursor,
+            users_count,
+            count_accuracy,
+        ) = await UserRepository.get_all_with_cursor_and_count_from_stmt(
             session=session,
+            stmt=base_stmt,
+            sort_fields=[UserModel.created_at, UserModel.id],
+            count_strategy=count_strategy,
+            cursor=query_params.cursor,
             limit=query_params.limit,
+            ascending=query_params.asc,
             offset=query_params.offset,
-            stmt=base_stmt,
         )
 
         if not users:
             raise exceptions.UserNotFoundException
 
-        users_count = await UserRepository.count_subquery(
-            session=session,
-            stmt=base_stmt,
-        )
-
         return user_schemas.UserListReadSchema(
             count=users_count,
+            count_accuracy=count_accuracy,
             users=users,
+            next_cursor=next_cursor,
         )
 
     # MARK: Update
@@ -155,11 +199,13 @@ class UserService:
         """
 
         # Поиск пользователя в БД
-        await cls.get_by_id(session=session, user_id=user_id)
+        user = await UserRepository.find_identity(session=session, id=user_id)
+        if user is None:
+            raise exceptions.UserNotFoundException
 
         hashed_password = None
         if data.password:
-            hashed_password = utils.get_hash(data.password)
+            hashed_password = await PasswordService.hash(data.password)
 
         # Обновление пользователя в БД
         try:
@@ -174,12 +220,29 @@ class UserService:
                     else None,
                 ),
             )
+
+            # Смена пароля или роли отзывает ранее выданные токены
+            token_version = updated_user.token_version
+            if hashed_password or user.is_admin != updated_user.is_admin:
+                token_version = await UserRepository.increment_token_version(
+                    session=session,
+                    id=user_id,
+                )
+
+            await cache_invalidation_bus.publish(
+                session=session,
+                entity="user",
+                ids=[user_id],
+                version=token_version,
+            )
             await session.commit()
 
         except IntegrityError as ex:
             print(ex)
             raise exceptions.UserConflictException(exc=ex)
 
+        UserCacheService.invalidate(user_id)
+
         return user_schemas.UserReadAdminSchema.model_validate(updated_user)
 
     # MARK: Delete
@@ -208,4 +271,46 @@ class UserService:
             id=user_id,
             session=session,
         )
+        await cache_invalidation_bus.publish(
+            session=session,
+            entity="user",
+            ids=[user_id],
+        )
         await session.commit()
+
+        UserCacheService.invalidate(user_id)
+
+    # MARK: Revoke
+    @classmethod
+    async def revoke_tokens(
+        cls,
+        session: AsyncSession,
+        user_id: uuid.UUID,
+    ) -> None:
+        """
+        Отозвать все выданные пользователю токены.
+
+        Args:
+            session (AsyncSession): Сессия для работы с базой данных.
+            user_id (uuid.UUID): ID пользователя.
+
+        Raises:
+            UserNotFoundException: Пользователь не найден.
+        """
+
+        # Поиск пользователя в БД
+        await cls.get_by_id(session=session, user_id=user_id)
+
+        token_version = await UserRepository.increment_token_version(
+            session=session,
+            id=user_id,
+        )
+        await cache_invalidation_bus.publish(
+            session=session,
+            entity="user",
+            ids=[user_id],
+            version=token_version,
+        )
+        await session.commit()
+
+        UserCacheService.invalidate(user_id)
@@ -1,5 +1,23 @@
+from src.utils.bloom import BloomFilter
+from src.utils.cache import MISSING, LRUSet, TTLCache
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.export import ExportFormat, export_response
 from src.utils.hash import get_hash
+from src.utils.shared_cache import SharedMemoryCache
+from src.utils.single_flight import SingleFlight
+from src.utils.throughput import ThroughputCounter
 
 __all__ = [
+    "BloomFilter",
+    "ExportFormat",
+    "LRUSet",
+    "MISSING",
+    "SharedMemoryCache",
+    "SingleFlight",
+    "TTLCache",
+    "ThroughputCounter",
+    "decode_cursor",
+    "encode_cursor",
+    "export_response",
     "get_hash",
 ]
@@ -0,0 +1,66 @@
+"""Модуль для фильтра Блума."""
+
+import hashlib
+import math
+
+
+# MARK: Bloom
+class BloomFilter:
+    """
+    Фильтр Блума для строк.
+
+    Отсутствие элемента в фильтре достоверно, а наличие означает,
+    что элемент мог быть добавлен, с вероятностью ложного срабатывания
+    не выше `error_rate`, пока в фильтр добавлено не больше `capacity`
+    элементов.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Args:
+            capacity (int): Расчетное количество элементов.
+            error_rate (float): Допустимая вероятность ложного срабатывания.
+        """
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+
+        self.bits_count = max(
+            1, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes_count = max(
+            1, round(self.bits_count / max(capacity, 1) * math.log(2))
+        )
+        self._bits = bytearray((self.bits_count + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        """Получить номера битов элемента двойным хэшированием."""
+
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        return [
+            (first + i * second) % self.bits_count for i in range(self.hashes_count)
+        ]
+
+    def add(self, item: str) -> None:
+        """Добавить элемент в фильтр."""
+
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    @property
+    def is_full(self) -> bool:
+        """Превышено ли расчетное количество элементов."""
+
+        return self.count >= self.capacity
@@ -0,0 +1,154 @@
+"""Модуль для утилит кэширования в памяти процесса."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator
+
+MISSING = object()
+
+
+# MARK: LRU
+class LRUSet:
+    """
+    Множество ограниченного размера, вытесняющее
+    давно не использованные элементы.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Args:
+            max_size (int): Максимальное количество элементов.
+        """
+
+        self.max_size = max_size
+        self._items: OrderedDict[Hashable, None] = OrderedDict()
+
+    def add(self, item: Hashable) -> None:
+        """Добавить элемент, вытесняя самый давно использованный."""
+
+        self._items[item] = None
+        self._items.move_to_end(item)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def __contains__(self, item: Hashable) -> bool:
+        if item not in self._items:
+            return False
+
+        self._items.move_to_end(item)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+
+
+# MARK: TTL
+class TTLCache:
+    """
+    Кэш ограниченного размера, значения которого устаревают
+    через `ttl_seconds` после записи. При переполнении вытесняются
+    давно не использованные значения.
+
+    Поколение `generation` увеличивается при каждом удалении, что позволяет
+    не записывать значения, прочитанные до удаления.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Args:
+            max_size (int): Максимальное количество значений.
+            ttl_seconds (float): Время жизни значения в секундах.
+        """
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+        self._items: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Получить значение по ключу.
+
+        Returns:
+            Any: Значение или `default`, если ключ отсутствует или устарел.
+        """
+
+        item = self._items.get(key)
+        if item is None or item[0] <= time.monotonic():
+            if item is not None:
+                del self._items[key]
+            self.misses += 1
+            return default
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Записать значение по ключу.
+
+        Args:
+            key (Hashable): Ключ.
+            value (Any): Значение.
+            ttl_seconds (float | None): Время жизни значения,
+                по умолчанию - `ttl_seconds` кэша.
+            generation (int | None): Поколение, при котором было прочитано
+                значение. Значение не записывается, если поколение изменилось.
+        """
+
+        if generation is not None and generation != self.generation:
+            return
+
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+
+        self._items[key] = (time.monotonic() + ttl_seconds, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Удалить значение по ключу, если оно есть."""
+
+        self.generation += 1
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Удалить все значения."""
+
+        self.generation += 1
+        self._items.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики кэша.
+
+        Returns:
+            dict[str, Any]: Размер кэша и количество попаданий и промахов.
+        """
+
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._items)
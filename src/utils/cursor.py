@@ -0,0 +1,82 @@
+"""Модуль для утилит курсорной пагинации."""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+
+# MARK: Cursor
+def _to_json_value(value: Any) -> Any:
+    """Привести значение ключа сортировки к типу, поддерживаемому JSON."""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _from_json_value(value: Any, value_type: type) -> Any:
+    """
+    Привести значение из JSON к Python типу ключа сортировки.
+
+    Raises:
+        ValueError: Значение не соответствует типу ключа сортировки.
+    """
+
+    if value_type in (datetime, uuid.UUID) and not isinstance(value, str):
+        raise ValueError("Cursor value must be a string")
+    if value_type is datetime:
+        return datetime.fromisoformat(value)
+    return value_type(value)
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """
+    Закодировать значения ключа сортировки в непрозрачный курсор.
+
+    Args:
+        values (list[Any]): Значения ключа сортировки последней записи страницы.
+
+    Returns:
+        str: Курсор в формате base64.
+    """
+
+    payload = json.dumps(
+        [_to_json_value(value) for value in values],
+        separators=(",", ":"),
+    )
+
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: list[type]) -> list[Any]:
+    """
+    Декодировать курсор в значения ключа сортировки.
+
+    Args:
+        cursor (str): Курсор в формате base64.
+        types (list[type]): Python типы значений ключа сортировки.
+
+    Returns:
+        list[Any]: Значения ключа сортировки.
+
+    Raises:
+        ValueError: Курсор поврежден или не соответствует ключу сортировки.
+    """
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("Cursor does not match the sort key")
+
+        return [
+            _from_json_value(value, value_type)
+            for value, value_type in zip(values, types)
+        ]
+    except (ValueError, TypeError) as ex:
+        raise ValueError("Invalid cursor") from ex
@@ -0,0 +1,101 @@
+"""Модуль для потоковой выгрузки данных в форматах NDJSON и CSV."""
+
+import csv
+import io
+from typing import AsyncIterable, AsyncIterator, Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Размер части тела ответа, после которого она отправляется клиенту
+EXPORT_CHUNK_SIZE: int = 64 * 1024
+
+
+async def encode_ndjson(items: AsyncIterable[BaseModel]) -> AsyncIterator[bytes]:
+    """
+    Кодировать схемы в NDJSON: одна схема в формате JSON на строку.
+
+    Returns:
+        AsyncIterator[bytes]: Части тела ответа.
+    """
+
+    buffer = bytearray()
+
+    async for item in items:
+        buffer += item.model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= EXPORT_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+async def encode_csv(
+    items: AsyncIterable[BaseModel],
+    schema: type[BaseModel],
+) -> AsyncIterator[bytes]:
+    """
+    Кодировать схемы в CSV с заголовком из полей `schema`.
+
+    Returns:
+        AsyncIterator[bytes]: Части тела ответа.
+    """
+
+    fields = list(schema.model_fields)
+    text = io.StringIO()
+    writer = csv.DictWriter(text, fieldnames=fields, lineterminator="\n")
+
+    # Заголовок отправляется сразу, до чтения первых строк из БД
+    writer.writeheader()
+    yield text.getvalue().encode()
+    text.seek(0)
+    text.truncate()
+
+    async for item in items:
+        writer.writerow(item.model_dump(mode="json", include=set(fields)))
+        if text.tell() >= EXPORT_CHUNK_SIZE:
+            yield text.getvalue().encode()
+            text.seek(0)
+            text.truncate()
+
+    if text.tell():
+        yield text.getvalue().encode()
+
+
+def export_response(
+    items: AsyncIterable[BaseModel],
+    schema: type[BaseModel],
+    format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Создать потоковый ответ с выгрузкой схем в формате `format`.
+
+    Args:
+        items (AsyncIterable[BaseModel]): Выгружаемые схемы.
+        schema (type[BaseModel]): Схема, поля которой являются колонками CSV.
+        format (ExportFormat): Формат выгрузки.
+        filename (str): Имя файла без расширения.
+
+    Returns:
+        StreamingResponse: Ответ, тело которого кодируется по мере чтения.
+    """
+
+    body = encode_csv(items, schema) if format == "csv" else encode_ndjson(items)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{format}"',
+        },
+    )
@@ -0,0 +1,342 @@
+"""Модуль для кэша в разделяемой памяти процессов."""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from src.utils.cache import MISSING
+
+# Заголовок: сигнатура, количество ячеек, размер значения, поколение
+HEADER = struct.Struct("<8sIIQ")
+HEADER_SIZE = 32
+MAGIC = b"PSSHC001"
+
+# Ячейка: счетчик версии, ключ, флаги, время истечения, значение
+SLOT = struct.Struct("<I16sBd")
+
+FLAG_EMPTY = 0
+FLAG_VALUE = 1
+FLAG_NONE = 2
+
+READ_ATTEMPTS = 16
+
+
+# MARK: Shared
+class SharedMemoryCache:
+    """
+    Кэш с ключами `uuid.UUID` в файле, отображенном в память,
+    общий для всех процессов на одном хосте.
+
+    Кэш является хэш-таблицей фиксированного размера с открытой адресацией:
+    значение ключа ищется в `probe_length` ячейках подряд, а при отсутствии
+    свободной ячейки вытесняется значение, которое истекает раньше других.
+    Значения - кортежи фиксированного формата `struct` или None.
+
+    Запись выполняется под блокировкой файла `flock`. Чтение выполняется
+    без блокировки: каждая ячейка содержит счетчик версии, который
+    нечетен во время записи, и чтение повторяется, если счетчик изменился.
+    Удаление значения увеличивает поколение в заголовке, поэтому процессы
+    не записывают значения, прочитанные из БД до удаления.
+
+    Формат и размеры кэша указываются в имени файла, поэтому процессы
+    с другими параметрами используют другой файл, и файл никогда
+    не уменьшается, пока он отображен в память другими процессами.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int,
+        ttl_seconds: float,
+        value_format: str,
+        probe_length: int = 8,
+    ):
+        """
+        Args:
+            path (str): Путь к файлу кэша, например в `/dev/shm`.
+                К имени файла добавляются формат и размеры кэша.
+            max_size (int): Количество ячеек.
+            ttl_seconds (float): Время жизни значения в секундах.
+            value_format (str): Формат значения `struct`.
+            probe_length (int): Количество ячеек, просматриваемых для ключа.
+        """
+
+        self.path = path
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.probe_length = min(probe_length, max_size)
+
+        self.hits = 0
+        self.misses = 0
+
+        self._value = struct.Struct(f"<{value_format.lstrip('<')}")
+        self._slot_size = SLOT.size + self._value.size
+        self._size = HEADER_SIZE + self._slot_size * max_size
+
+        root, extension = os.path.splitext(path)
+        self.file_path = (
+            f"{root}-{MAGIC.decode().lower()}-{max_size}x{self._value.size}{extension}"
+        )
+
+        self._pid: int | None = None
+        self._fd = -1
+        self._mmap: mmap.mmap | None = None
+
+    # MARK: Utils
+    def _open(self) -> mmap.mmap:
+        """
+        Открыть и отобразить в память файл кэша.
+
+        Файл открывается заново в каждом процессе, так как блокировка `flock`
+        дочернего процесса, созданного `fork`, не исключает родительский.
+        Новый файл увеличивается до размера кэша, а существующий
+        не изменяется.
+
+        Raises:
+            ValueError: Файл кэша имеет другой размер или формат.
+        """
+
+        if self._pid == os.getpid() and self._mmap is not None:
+            return self._mmap
+
+        if self._mmap is not None:
+            self._mmap.close()
+            os.close(self._fd)
+
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+        self._fd = os.open(self.file_path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._lock():
+            self._initialize()
+        self._mmap = mmap.mmap(self._fd, self._size)
+        self._pid = os.getpid()
+
+        return self._mmap
+
+    def _initialize(self) -> None:
+        """
+        Записать заголовок нового файла или проверить заголовок
+        существующего. Вызывается под блокировкой файла.
+        """
+
+        file_size = os.fstat(self._fd).st_size
+        if file_size == 0:
+            os.ftruncate(self._fd, self._size)
+        elif file_size != self._size:
+            raise ValueError(f"Shared cache {self.file_path} has unexpected size")
+
+        header = os.pread(self._fd, HEADER.size, 0)
+        if header == bytes(HEADER.size):
+            # Файл создан, но процесс завершился до записи заголовка
+            os.pwrite(
+                self._fd,
+                HEADER.pack(MAGIC, self.max_size, self._value.size, 0),
+                0,
+            )
+            return
+
+        magic, slots, value_size, _ = HEADER.unpack(header)
+        if (magic, slots, value_size) != (MAGIC, self.max_size, self._value.size):
+            raise ValueError(f"Shared cache {self.file_path} has unexpected format")
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Эксклюзивная блокировка файла кэша между процессами."""
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _slots(self, key: bytes) -> list[int]:
+        """Получить смещения ячеек, в которых может находиться ключ."""
+
+        start = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+        return [
+            HEADER_SIZE + ((start + i) % self.max_size) * self._slot_size
+            for i in range(self.probe_length)
+        ]
+
+    def _read_slot(self, offset: int) -> tuple[bytes, int, float, bytes]:
+        """Прочитать согласованное состояние ячейки."""
+
+        buffer = self._open()
+
+        for _ in range(READ_ATTEMPTS):
+            record = buffer[offset : offset + self._slot_size]
+            seq, key, flags, expires_at = SLOT.unpack_from(record)
+            if seq & 1 == 0 and SLOT.unpack_from(buffer, offset)[0] == seq:
+                return key, flags, expires_at, record[SLOT.size :]
+
+        # Ячейка постоянно перезаписывается - считаем ее пустой
+        return b"", FLAG_EMPTY, 0.0, b""
+
+    def _write_slot(
+        self,
+        offset: int,
+        key: bytes,
+        flags: int,
+        expires_at: float,
+        value: bytes,
+    ) -> None:
+        """Записать ячейку. Вызывается под блокировкой файла."""
+
+        buffer = self._open()
+
+        seq = SLOT.unpack_from(buffer, offset)[0]
+        struct.pack_into("<I", buffer, offset, seq + 1)
+        buffer[offset + 4 : offset + self._slot_size] = (
+            SLOT.pack(0, key, flags, expires_at)[4:] + value
+        )
+        struct.pack_into("<I", buffer, offset, seq + 2)
+
+    @property
+    def generation(self) -> int:
+        """Поколение кэша, увеличивающееся при каждом удалении."""
+
+        return HEADER.unpack_from(self._open(), 0)[3]
+
+    def _increment_generation(self) -> None:
+        """Увеличить поколение. Вызывается под блокировкой файла."""
+
+        buffer = self._open()
+
+        magic, slots, value_size, generation = HEADER.unpack_from(buffer, 0)
+        HEADER.pack_into(buffer, 0, magic, slots, value_size, generation + 1)
+
+    # MARK: Get
+    def get(self, key: uuid.UUID, default: Any = MISSING) -> Any:
+        """
+        Получить значение по ключу.
+
+        Returns:
+            Any: Значение или `default`, если ключ отсутствует или устарел.
+        """
+
+        key_bytes = key.bytes
+        now = time.time()
+
+        for offset in self._slots(key_bytes):
+            slot_key, flags, expires_at, value = self._read_slot(offset)
+            if flags != FLAG_EMPTY and slot_key == key_bytes and expires_at > now:
+                self.hits += 1
+                return None if flags == FLAG_NONE else self._value.unpack(value)
+
+        self.misses += 1
+        return default
+
+    # MARK: Set
+    def set(
+        self,
+        key: uuid.UUID,
+        value: tuple | None,
+        ttl_seconds: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Записать значение по ключу.
+
+        Args:
+            key (uuid.UUID): Ключ.
+            value (tuple | None): Значение в формате `value_format` или None.
+            ttl_seconds (float | None): Время жизни значения,
+                по умолчанию - `ttl_seconds` кэша.
+            generation (int | None): Поколение, при котором было прочитано
+                значение. Значение не записывается, если поколение изменилось.
+        """
+
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+
+        key_bytes = key.bytes
+        flags, packed = (
+            (FLAG_NONE, bytes(self._value.size))
+            if value is None
+            else (FLAG_VALUE, self._value.pack(*value))
+        )
+
+        self._open()
+        with self._lock():
+            if generation is not None and generation != self.generation:
+                return
+
+            now = time.time()
+            target, target_expires_at = None, None
+
+            for offset in self._slots(key_bytes):
+                slot_key, slot_flags, expires_at, _ = self._read_slot(offset)
+                if slot_flags != FLAG_EMPTY and slot_key == key_bytes:
+                    target = offset
+                    break
+                if slot_flags == FLAG_EMPTY or expires_at <= now:
+                    expires_at = 0.0
+                if target_expires_at is None or expires_at < target_expires_at:
+                    target, target_expires_at = offset, expires_at
+
+            self._write_slot(target, key_bytes, flags, now + ttl_seconds, packed)
+
+    # MARK: Delete
+    def delete(self, key: uuid.UUID) -> None:
+        """Удалить значение по ключу во всех процессах."""
+
+        key_bytes = key.bytes
+
+        self._open()
+        with self._lock():
+            self._increment_generation()
+            for offset in self._slots(key_bytes):
+                slot_key, flags, _, _ = self._read_slot(offset)
+                if flags != FLAG_EMPTY and slot_key == key_bytes:
+                    self._write_slot(
+                        offset, bytes(16), FLAG_EMPTY, 0.0, bytes(self._value.size)
+                    )
+
+    def clear(self) -> None:
+        """Удалить все значения во всех процессах."""
+
+        self._open()
+        with self._lock():
+            self._increment_generation()
+            for index in range(self.max_size):
+                self._write_slot(
+                    HEADER_SIZE + index * self._slot_size,
+                    bytes(16),
+                    FLAG_EMPTY,
+                    0.0,
+                    bytes(self._value.size),
+                )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики кэша.
+
+        Returns:
+            dict[str, Any]: Размер кэша и количество попаданий
+                и промахов текущего процесса.
+        """
+
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        now = time.time()
+        size = 0
+
+        for index in range(self.max_size):
+            _, flags, expires_at, _ = self._read_slot(
+                HEADER_SIZE + index * self._slot_size
+            )
+            if flags != FLAG_EMPTY and expires_at > now:
+                size += 1
+
+        return size
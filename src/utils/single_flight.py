@@ -0,0 +1,84 @@
+"""Модуль для объединения одинаковых параллельных вызовов."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+# MARK: Single flight
+class SingleFlight:
+    """
+    Объединение одинаковых параллельных вызовов в пределах процесса.
+
+    Пока вызов с ключом выполняется, вызовы с тем же ключом не выполняются,
+    а ожидают и получают его результат или исключение. Если ожидаемый
+    вызов отменен, ожидающие вызовы выполняются заново.
+    """
+
+    def __init__(self):
+        self.calls_total = 0
+        self.shared_total = 0
+
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """
+        Выполнить вызов или дождаться результата такого же вызова.
+
+        Args:
+            key (Hashable): Ключ вызова.
+            func (Callable[[], Awaitable[Any]]): Вызов.
+
+        Returns:
+            (result, is_shared): результат вызова и признак того,
+                что он получен от другого вызова.
+        """
+
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared_total += 1
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                # Отменен ожидаемый вызов, а не текущий
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.do(key, func)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.calls_total += 1
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            # Исключение передается вызывающему коду, даже без ожидающих
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Получить метрики объединения вызовов.
+
+        Returns:
+            dict[str, Any]: Количество выполненных и объединенных вызовов.
+        """
+
+        return {
+            "calls_total": self.calls_total,
+            "shared_total": self.shared_total,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,89 @@
+"""Модуль для счетчиков пропускной способности операций."""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+# MARK: Throughput
+class ThroughputCounter:
+    """
+    Счетчики пропускной способности операций в пределах процесса.
+
+    Для каждой пары `(name, operation)` накапливаются количество вызовов,
+    строк, частей и время выполнения, а также сохраняются показатели
+    последнего вызова.
+    """
+
+    def __init__(self):
+        self._operations: dict[tuple[str, str], dict[str, Any]] = {}
+
+    def record(
+        self,
+        name: str,
+        operation: str,
+        rows: int,
+        chunks: int,
+        seconds: float,
+    ) -> dict[str, Any]:
+        """
+        Учесть вызов операции.
+
+        Args:
+            name (str): Название объекта операции, например таблицы.
+            operation (str): Название операции.
+            rows (int): Количество обработанных строк.
+            chunks (int): Количество частей, например запросов.
+            seconds (float): Время выполнения в секундах.
+
+        Returns:
+            dict[str, Any]: Показатели вызова.
+        """
+
+        rows_per_second = rows / seconds if seconds > 0 else 0.0
+
+        stats = self._operations.setdefault(
+            (name, operation),
+            {
+                "name": name,
+                "operation": operation,
+                "calls_total": 0,
+                "rows_total": 0,
+                "chunks_total": 0,
+                "seconds_total": 0.0,
+            },
+        )
+        stats["calls_total"] += 1
+        stats["rows_total"] += rows
+        stats["chunks_total"] += chunks
+        stats["seconds_total"] += seconds
+        stats["last_rows"] = rows
+        stats["last_rows_per_second"] = rows_per_second
+
+        logger.debug(
+            "%s %s: %d rows in %d chunks, %.3f s, %.0f rows/s",
+            name,
+            operation,
+            rows,
+            chunks,
+            seconds,
+            rows_per_second,
+        )
+
+        return {
+            "rows": rows,
+            "chunks": chunks,
+            "seconds": seconds,
+            "rows_per_second": rows_per_second,
+        }
+
+    def get_stats(self) -> list[dict[str, Any]]:
+        """
+        Получить накопленные показатели операций.
+
+        Returns:
+            list[dict[str, Any]]: Показатели каждой операции.
+        """
+
+        return [dict(stats) for stats in self._operations.values()]
@@ -204,7 +204,10 @@ async def user_jwt_tokens(user_db: UserModel) -> auth_schemas.JWTGetSchema:
 async def admin_jwt_tokens(user_admin_db: UserModel) -> auth_schemas.JWTGetSchema:
     """Создать JWT токены  для тестового пользователя-администратора."""
 
-    return await JWTService.create_tokens(user_id=user_admin_db.id)
+    return await JWTService.create_tokens(
+        user_id=user_admin_db.id,
+        is_admin=user_admin_db.is_admin,
+    )
 
 
 # MARK: Accounts
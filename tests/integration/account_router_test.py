@@ -2,12 +2,16 @@
 
 import httpx
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.accounts.schemas as account_schemas
 import src.auth.schemas as auth_schemas
+import src.transactions.schemas as transaction_schemas
 from src import constants
 from src.accounts.models import AccountModel
+from src.accounts.repositories import AccountRepository
 from src.accounts.routers import account_router
+from src.transactions.models import TransactionModel
 from src.users.models import UserModel
 from tests.integration.conftest import BaseTestRouter
 
@@ -34,14 +38,48 @@ class TestAccountRouter(BaseTestRouter):
 
         assert response.status_code == status.HTTP_200_OK
 
-        data = [
-            account_schemas.AccountGetSchema(**account) for account in response.json()
-        ]
+        data = account_schemas.AccountListReadSchema(**response.json()).accounts
 
         assert data[0].id == account_db.id
         assert data[0].balance == account_db.balance
         assert str(data[0].user_id) == user_db.id
 
+    async def test_get_account_balance_with_shards(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        account_db: AccountModel,
+    ):
+        """Проверка, что баланс аккаунта включает части баланса."""
+
+        balance = account_db.balance
+
+        await AccountRepository.increment_shard_balances(
+            session=session,
+            amounts={(account_db.id, 0): 100, (account_db.id, 1): -30},
+        )
+        await session.commit()
+
+        response = await router_client.get(
+            url="/accounts",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = account_schemas.AccountListReadSchema(**response.json()).accounts
+
+        assert data[0].balance == balance + 70
+
+        compacted = await AccountRepository.compact_balance_shards(session)
+        await session.commit()
+
+        assert compacted == {account_db.id}
+        assert await AccountRepository.get_total_balance(session, id=account_db.id) == (
+            account_db.balance + 70
+        )
+
     async def test_get_all_accounts_by_user_id(
         self,
         router_client: httpx.AsyncClient,
@@ -58,10 +96,88 @@ class TestAccountRouter(BaseTestRouter):
 
         assert response.status_code == status.HTTP_200_OK
 
-        data = [
-            account_schemas.AccountGetSchema(**account) for account in response.json()
-        ]
+        data = account_schemas.AccountListReadSchema(**response.json()).accounts
 
         assert data[0].id == account_db.id
         assert data[0].balance == account_db.balance
         assert str(data[0].user_id) == user_db.id
+
+    async def test_get_account_transactions(
+        self,
+        router_client: httpx.AsyncClient,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        account_db: AccountModel,
+        transaction_db: TransactionModel,
+    ):
+        """Проверка получения транзакций аккаунта его владельцем."""
+
+        response = await router_client.get(
+            url=f"/accounts/{account_db.id}/transactions",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = transaction_schemas.TransactionListReadSchema(**response.json())
+
+        assert len(data.transactions) == 1
+        assert data.transactions[0].id == transaction_db.id
+        assert data.next_cursor is None
+
+    async def test_get_account_transactions_summary(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        account_db: AccountModel,
+        transaction_db: TransactionModel,
+    ):
+        """Проверка получения сводки по транзакциям аккаунта администратором."""
+
+        response = await router_client.get(
+            url=f"/accounts/{account_db.id}/summary",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = account_schemas.AccountTransactionsSummarySchema(**response.json())
+
+        assert data.account_id == account_db.id
+        assert data.transactions_count == 1
+        assert data.last_transaction.id == transaction_db.id
+
+    async def test_get_account_balance_as_of(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        account_db: AccountModel,
+        transaction_db: TransactionModel,
+    ):
+        """Проверка получения баланса аккаунта на момент времени."""
+
+        amount = transaction_db.amount
+
+        await AccountRepository.add_balance_checkpoints(session, lag_seconds=0)
+        await session.commit()
+
+        response = await router_client.get(
+            url=f"/accounts/{account_db.id}/balance",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = account_schemas.AccountBalanceAsOfSchema(**response.json())
+
+        assert data.account_id == account_db.id
+        assert data.balance == amount
+
+        response = await router_client.get(
+            url=f"/accounts/{account_db.id}/balance",
+            params={"as_of": "2000-01-01T00:00:00+00:00"},
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert account_schemas.AccountBalanceAsOfSchema(**response.json()).balance == 0
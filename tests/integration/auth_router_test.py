@@ -9,6 +9,7 @@ import src.users.schemas as user_schemas
 from src import utils
 from src.auth.routers import auth_router
 from src.users.repositories import UserRepository
+from src.users.services import PasswordService
 from tests.conftest import faker
 from tests.integration.conftest import BaseTestRouter
 
@@ -89,6 +90,12 @@ class TestAuthRouter(BaseTestRouter):
         assert tokens.expires_at is not None
         assert tokens.token_type == "Bearer"
 
+        # Хэш прежнего формата пересчитывается при авторизации
+        user_db = await UserRepository.find_one_or_none(session=session, email=email)
+        await session.refresh(user_db)
+        assert not PasswordService.needs_rehash(user_db.hashed_password)
+        assert await PasswordService.verify(password, user_db.hashed_password)
+
     async def test_refresh_tokens(
         self,
         router_client: httpx.AsyncClient,
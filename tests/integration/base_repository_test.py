@@ -0,0 +1,255 @@
+"""Модуль для тестирования src.base_repository"""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src import constants
+from src.accounts.models import AccountModel
+from src.accounts.repositories import AccountRepository
+from src.base_repository import Explain, bulk_write_stats
+from src.settings import settings
+from src.users.models import UserModel
+
+
+def get_bulk_write_stats(operation: str) -> dict:
+    """Получить статистику массовой записи в таблицу аккаунтов."""
+
+    for stats in bulk_write_stats.get_stats():
+        if stats["name"] == "accounts" and stats["operation"] == operation:
+            return stats
+    return {}
+
+
+async def find_accounts(
+    session: AsyncSession, user_id: uuid.UUID
+) -> list[AccountModel]:
+    """Получить аккаунты пользователя из БД."""
+
+    session.expire_all()
+    result = await session.execute(
+        select(AccountModel)
+        .where(AccountModel.user_id == user_id)
+        .order_by(AccountModel.balance)
+    )
+    return list(result.scalars().all())
+
+
+@pytest.fixture
+def user_id(user_db: UserModel) -> uuid.UUID:
+    """ID пользователя в БД."""
+
+    return uuid.UUID(user_db.id)
+
+
+class TestBaseRepositoryBulk:
+    """Класс для тестирования массовой записи BaseRepository."""
+
+    async def test_add_bulk_copy(self, mocker, session, user_id):
+        """
+        Записи не меньше `DB_BULK_COPY_THRESHOLD` загружаются через `COPY`,
+        а отсутствующие поля заполняются значениями по умолчанию SQLAlchemy.
+        """
+
+        mocker.patch.object(settings, "DB_BULK_COPY_THRESHOLD", 2)
+        copy_records = mocker.spy(AccountRepository, "_copy_records")
+        execute_bulk = mocker.spy(AccountRepository, "_execute_bulk")
+        calls_total = get_bulk_write_stats("copy").get("calls_total", 0)
+
+        result = await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id, "balance": balance} for balance in range(3)],
+            returning=None,
+        )
+
+        assert result is None
+        assert copy_records.spy_return is True
+        execute_bulk.assert_not_called()
+
+        accounts = await find_accounts(session, user_id)
+
+        assert [account.balance for account in accounts] == [0, 1, 2]
+        assert len({account.id for account in accounts}) == 3
+        assert not any(account.is_hot for account in accounts)
+        assert get_bulk_write_stats("copy")["calls_total"] == calls_total + 1
+        assert get_bulk_write_stats("copy")["last_rows"] == 3
+
+    async def test_add_bulk_below_copy_threshold(self, mocker, session, user_id):
+        """Записи с RETURNING или ниже порога добавляются через `INSERT`."""
+
+        mocker.patch.object(settings, "DB_BULK_COPY_THRESHOLD", 2)
+        copy_records = mocker.spy(AccountRepository, "_copy_records")
+
+        await AccountRepository.add_bulk(
+            session, [{"user_id": user_id}], returning=None
+        )
+        await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id} for _ in range(2)],
+            returning="ids",
+        )
+
+        copy_records.assert_not_called()
+        assert len(await find_accounts(session, user_id)) == 3
+
+    def test_get_bulk_chunk_size(self):
+        """Размер части ограничен количеством параметров запроса."""
+
+        assert AccountRepository._get_bulk_chunk_size(4, None) == (
+            constants.BULK_INSERT_CHUNK_SIZE
+        )
+        assert AccountRepository._get_bulk_chunk_size(4, 10) == 10
+        assert AccountRepository._get_bulk_chunk_size(1000, 100) == (
+            constants.MAX_QUERY_PARAMETERS // 1000
+        )
+        assert (
+            AccountRepository._get_bulk_chunk_size(
+                constants.MAX_QUERY_PARAMETERS + 1,
+                None,
+            )
+            == 1
+        )
+
+    async def test_add_bulk_chunks(self, mocker, session, user_id):
+        """Записи вставляются частями по `chunk_size`."""
+
+        execute_bulk = mocker.spy(AccountRepository, "_execute_bulk")
+
+        ids = await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id} for _ in range(5)],
+            returning="ids",
+            chunk_size=2,
+        )
+
+        assert execute_bulk.call_count == 3
+        assert len(set(ids)) == 5
+        assert len(await find_accounts(session, user_id)) == 5
+
+    async def test_add_bulk_on_conflict(self, session, user_id):
+        """
+        При конфликте запись обновляется с `on_conflict="update"`
+        и пропускается с `on_conflict="nothing"`.
+        """
+
+        id = uuid.uuid4()
+        await AccountRepository.add_bulk(
+            session,
+            [{"id": id, "user_id": user_id, "balance": 10}],
+            returning=None,
+        )
+
+        updated = await AccountRepository.add_bulk(
+            session,
+            [{"id": id, "user_id": user_id, "balance": 20}],
+            on_conflict="update",
+            update_fields=["balance"],
+        )
+
+        assert [account.balance for account in updated] == [20]
+
+        skipped = await AccountRepository.add_bulk(
+            session,
+            [{"id": id, "user_id": user_id, "balance": 30}],
+            on_conflict="nothing",
+        )
+
+        assert skipped == []
+        assert [
+            account.balance for account in await find_accounts(session, user_id)
+        ] == [20]
+
+    async def test_add_bulk_returning(self, session, user_id):
+        """Возвращаются модели, первичные ключи, указанные столбцы или None."""
+
+        models = await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id, "balance": 1}],
+            returning="model",
+        )
+        ids = await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id, "balance": 2}],
+            returning="ids",
+        )
+        rows = await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id, "balance": 3}],
+            returning=[AccountModel.id, AccountModel.balance],
+        )
+        nothing = await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id, "balance": 4}],
+            returning=None,
+        )
+
+        accounts = await find_accounts(session, user_id)
+
+        assert isinstance(models[0], AccountModel)
+        assert models[0].id == accounts[0].id
+        assert ids == [accounts[1].id]
+        assert [tuple(row) for row in rows] == [(accounts[2].id, 3)]
+        assert nothing is None
+
+    async def test_update_bulk(self, mocker, session, user_id):
+        """Записи обновляются частями по ключевым полям."""
+
+        execute_bulk = mocker.spy(AccountRepository, "_execute_bulk")
+        ids = await AccountRepository.add_bulk(
+            session,
+            [{"user_id": user_id, "balance": balance} for balance in range(3)],
+            returning="ids",
+        )
+
+        updated = await AccountRepository.update_bulk(
+            session,
+            [{"id": id, "balance": 10 + i} for i, id in enumerate(ids)],
+            returning="ids",
+            chunk_size=2,
+        )
+
+        assert sorted(updated) == sorted(ids)
+        assert execute_bulk.call_count == 1 + 2
+        assert [
+            account.balance for account in await find_accounts(session, user_id)
+        ] == [
+            10,
+            11,
+            12,
+        ]
+        assert await AccountRepository.update_bulk(session, [], returning=None) is None
+
+
+class TestBaseRepositoryRead:
+    """Класс для тестирования чтения BaseRepository."""
+
+    def test_get_read_key(self):
+        """
+        Ключ запроса совпадает для одинаковых запросов и различается
+        для разных фильтров и пагинации.
+        """
+
+        def get_key(balance: int, ids: list[uuid.UUID], offset: int = 0):
+            return AccountRepository._get_read_key(
+                select(AccountModel)
+                .where(AccountModel.balance == balance, AccountModel.id.in_(ids))
+                .offset(offset)
+            )
+
+        ids = [uuid.uuid4()]
+
+        assert get_key(1, ids) == get_key(1, list(ids))
+        assert get_key(1, ids) != get_key(2, ids)
+        assert get_key(1, ids) != get_key(1, [uuid.uuid4()])
+        assert get_key(1, ids) != get_key(1, ids, offset=10)
+
+        explain = AccountRepository._get_read_key(
+            Explain(select(AccountModel).where(AccountModel.balance == 1))
+        )
+
+        assert explain is not None
+        assert explain != AccountRepository._get_read_key(
+            Explain(select(AccountModel).where(AccountModel.balance == 2))
+        )
@@ -1,12 +1,13 @@
 """Модуль `conftest` с фикстурами для пакета `tasks.integration`."""
 
+from contextlib import nullcontext
 from typing import AsyncGenerator
 
 import httpx
 import pytest_asyncio
 from fastapi import APIRouter, FastAPI
 
-from src.dependencies import get_session
+from src.dependencies import get_read_session, get_read_session_factory, get_session
 
 
 class BaseTestRouter:
@@ -28,6 +29,10 @@ class BaseTestRouter:
         app.include_router(self.router)
 
         app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[get_read_session] = lambda: session
+        app.dependency_overrides[get_read_session_factory] = lambda: (
+            lambda: nullcontext(session)
+        )
 
         transport = httpx.ASGITransport(app=app)
         async with httpx.AsyncClient(
@@ -0,0 +1,44 @@
+"""Тесты для роутера выгрузок реестра."""
+
+import httpx
+from fastapi import status
+
+import src.auth.schemas as auth_schemas
+from src import constants
+from src.ledger.routers import ledger_router
+from tests.integration.conftest import BaseTestRouter
+
+
+class TestLedgerRouter(BaseTestRouter):
+    """Класс для тестирования роутера ledger_router."""
+
+    router = ledger_router
+
+    # MARK: Get
+    async def test_get_ledger_dump_not_found(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """Проверка получения несуществующей выгрузки реестра."""
+
+        response = await router_client.get(
+            url="/ledger/dumps/20000101T000000000000Z",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_get_ledger_dump_by_user(
+        self,
+        router_client: httpx.AsyncClient,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """Проверка, что выгрузки реестра недоступны пользователю."""
+
+        response = await router_client.get(
+            url="/ledger/dumps/20000101T000000000000Z",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
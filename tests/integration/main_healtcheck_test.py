@@ -1,10 +1,21 @@
 """Модуль для тестирования роутера src.healthcheck.health_check_router"""
 
+import uuid
+
 import httpx
 from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.healthcheck import HealthCheckSchema, health_check_router
+from src.accounts.repositories import AccountRepository
+from src.healthcheck import (
+    BulkWriteStatsSchema,
+    CachesStatsSchema,
+    DatabasePoolStatsSchema,
+    HealthCheckSchema,
+    health_check_router,
+)
 from src.settings import settings
+from src.users.models import UserModel
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -27,3 +38,61 @@ class TestHealtcheckRouter(BaseTestRouter):
         assert health_check_data.mode == settings.MODE
         assert health_check_data.version == settings.APP_VERSION
         assert health_check_data.status == "OK"
+
+    async def test_database_pool_stats(
+        self,
+        router_client: httpx.AsyncClient,
+    ):
+        """Возможно получить статистику пула соединений с БД."""
+
+        response = await router_client.get(url="/health_check/database")
+
+        pool_stats = DatabasePoolStatsSchema(**response.json())
+
+        assert response.status_code == status.HTTP_200_OK
+        assert pool_stats.mode == settings.DB_POOL_MODE
+        assert pool_stats.waiting >= 0
+
+    async def test_caches_stats(
+        self,
+        router_client: httpx.AsyncClient,
+    ):
+        """Возможно получить статистику кэшей процесса."""
+
+        response = await router_client.get(url="/health_check/caches")
+
+        caches_stats = CachesStatsSchema(**response.json())
+
+        assert response.status_code == status.HTTP_200_OK
+        assert caches_stats.users.max_size == settings.USER_CACHE_MAX_SIZE
+        assert caches_stats.jwt.max_size == settings.JWT_CACHE_MAX_SIZE
+
+    async def test_bulk_writes_stats(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        user_db: UserModel,
+    ):
+        """Возможно получить статистику массовой записи процесса."""
+
+        await AccountRepository.add_bulk(
+            session,
+            [{"user_id": uuid.UUID(user_db.id)} for _ in range(3)],
+            returning=None,
+            chunk_size=2,
+        )
+
+        response = await router_client.get(url="/health_check/bulk_writes")
+
+        assert response.status_code == status.HTTP_200_OK
+
+        bulk_writes_stats = {
+            (stats.name, stats.operation): stats
+            for stats in map(BulkWriteStatsSchema.model_validate, response.json())
+        }
+        stats = bulk_writes_stats[("accounts", "insert")]
+
+        assert stats.calls_total >= 1
+        assert stats.rows_total >= 3
+        assert stats.chunks_total >= 2
+        assert stats.last_rows == 3
@@ -1,14 +1,21 @@
 """Тесты для роутера транзакций."""
 
+import uuid
+
 import httpx
 from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.auth.schemas as auth_schemas
 import src.transactions.schemas as transaction_schemas
 from src import constants
+from src.accounts.models import AccountModel
 from src.transactions.models import TransactionModel
 from src.transactions.routers import transaction_router
+from src.transactions.services import transaction_signature_verifier
 from src.users.models import UserModel
+from tests.conftest import faker
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -34,10 +41,9 @@ class TestTransactionRouter(BaseTestRouter):
 
         assert response.status_code == status.HTTP_200_OK
 
-        data = [
-            transaction_schemas.TransactionSchema(**transaction)
-            for transaction in response.json()
-        ]
+        data = transaction_schemas.TransactionListReadSchema(
+            **response.json()
+        ).transactions
 
         assert data[0].id == transaction_db.id
         assert data[0].account_id == str(transaction_db.account_id)
@@ -45,6 +51,94 @@ class TestTransactionRouter(BaseTestRouter):
         assert data[0].amount == transaction_db.amount
         assert str(data[0].user_id) == user_db.id
 
+    async def test_export_transactions(
+        self,
+        router_client: httpx.AsyncClient,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        transaction_db: TransactionModel,
+    ):
+        """Проверка потоковой выгрузки транзакций пользователя в NDJSON и CSV."""
+
+        response = await router_client.get(
+            url="/transactions/export",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        lines = response.text.splitlines()
+
+        assert len(lines) == 1
+        assert (
+            transaction_schemas.TransactionSchema.model_validate_json(lines[0]).id
+            == transaction_db.id
+        )
+
+        response = await router_client.get(
+            url="/transactions/export",
+            params={"format": "csv"},
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        header, row = response.text.splitlines()
+
+        assert header == "id,account_id,user_id,amount,signature"
+        assert row.startswith(f"{transaction_db.id},{transaction_db.account_id},")
+
+    async def test_get_all_transactions_pagination(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        user_db: UserModel,
+        account_db: AccountModel,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        transaction_db: TransactionModel,
+    ):
+        """Проверка получения транзакций пользователя по курсору."""
+
+        second_transaction_db = TransactionModel(
+            id=str(uuid.uuid4()),
+            account_id=account_db.id,
+            amount=faker.random_int(),
+            user_id=user_db.id,
+            signature=faker.password(),
+        )
+        session.add(second_transaction_db)
+        await session.commit()
+
+        first_response = await router_client.get(
+            url="/transactions",
+            params={"limit": 1},
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+        assert first_response.status_code == status.HTTP_200_OK
+
+        first_page = transaction_schemas.TransactionListReadSchema(
+            **first_response.json()
+        )
+        assert len(first_page.transactions) == 1
+        assert first_page.next_cursor is not None
+
+        second_response = await router_client.get(
+            url="/transactions",
+            params={"limit": 1, "cursor": first_page.next_cursor},
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+        assert second_response.status_code == status.HTTP_200_OK
+
+        second_page = transaction_schemas.TransactionListReadSchema(
+            **second_response.json()
+        )
+        assert len(second_page.transactions) == 1
+        assert second_page.next_cursor is None
+        assert {
+            first_page.transactions[0].id,
+            second_page.transactions[0].id,
+        } == {transaction_db.id, second_transaction_db.id}
+
     async def test_get_all_transactions_by_user_id(
         self,
         router_client: httpx.AsyncClient,
@@ -61,10 +155,9 @@ class TestTransactionRouter(BaseTestRouter):
 
         assert response.status_code == status.HTTP_200_OK
 
-        data = [
-            transaction_schemas.TransactionSchema(**transaction)
-            for transaction in response.json()
-        ]
+        data = transaction_schemas.TransactionListReadSchema(
+            **response.json()
+        ).transactions
 
         assert data[0].id == transaction_db.id
         assert data[0].account_id == str(transaction_db.account_id)
@@ -72,10 +165,32 @@ class TestTransactionRouter(BaseTestRouter):
         assert data[0].amount == transaction_db.amount
         assert str(data[0].user_id) == user_db.id
 
+    async def test_get_transaction_ingest_status(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        transaction_db: TransactionModel,
+    ):
+        """Проверка получения статуса записанной транзакции."""
+
+        response = await router_client.get(
+            url=f"/transactions/status/{transaction_db.id}",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = transaction_schemas.TransactionIngestStatusSchema(**response.json())
+
+        assert data.id == transaction_db.id
+        assert data.status == "created"
+
     async def test_create_transaction(
         self,
         router_client: httpx.AsyncClient,
+        session: AsyncSession,
         user_db: UserModel,
+        account_db: AccountModel,
         admin_jwt_tokens: auth_schemas.JWTGetSchema,
         transaction_create_data: transaction_schemas.TransactionSchema,
     ):
@@ -96,3 +211,89 @@ class TestTransactionRouter(BaseTestRouter):
         assert data.signature == transaction_create_data.signature
         assert data.amount == transaction_create_data.amount
         assert str(data.user_id) == user_db.id
+
+        balance = await session.scalar(
+            select(AccountModel.balance).where(AccountModel.id == account_db.id)
+        )
+        assert balance == transaction_create_data.amount
+
+    async def test_create_transaction_hmac_signature(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        transaction_create_data: transaction_schemas.TransactionSchema,
+    ):
+        """Проверка создания транзакции с подписью HMAC-SHA256."""
+
+        transaction_create_data.signature = transaction_signature_verifier.sign(
+            transaction_create_data
+        )
+
+        response = await router_client.post(
+            url="/transactions",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+            json=transaction_create_data.model_dump(mode="json"),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == transaction_create_data.id
+
+    async def test_create_transaction_invalid_signature(
+        self,
+        router_client: httpx.AsyncClient,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        transaction_create_data: transaction_schemas.TransactionSchema,
+    ):
+        """Проверка отклонения транзакции с некорректной подписью."""
+
+        transaction_create_data.amount += 1
+
+        response = await router_client.post(
+            url="/transactions",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+            json=transaction_create_data.model_dump(mode="json"),
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_create_transactions_batch(
+        self,
+        router_client: httpx.AsyncClient,
+        session: AsyncSession,
+        account_db: AccountModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+        transaction_create_data: transaction_schemas.TransactionSchema,
+    ):
+        """Проверка пакетного создания транзакций администратором."""
+
+        invalid_data = transaction_create_data.model_copy(
+            update={"id": str(uuid.uuid4()), "signature": faker.password()}
+        )
+
+        response = await router_client.post(
+            url="/transactions/batch",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+            json=[
+                transaction_create_data.model_dump(mode="json"),
+                transaction_create_data.model_dump(mode="json"),
+                invalid_data.model_dump(mode="json"),
+            ],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        data = transaction_schemas.TransactionBatchResultSchema(**response.json())
+
+        assert data.created == 1
+        assert data.duplicates == 1
+        assert data.invalid_signatures == 1
+        assert [result.status for result in data.results] == [
+            "created",
+            "duplicate",
+            "invalid_signature",
+        ]
+
+        balance = await session.scalar(
+            select(AccountModel.balance).where(AccountModel.id == account_db.id)
+        )
+        assert balance == transaction_create_data.amount
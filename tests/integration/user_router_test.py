@@ -1,5 +1,7 @@
 """Модуль для тестирования роутера src.users.routes.user_routes"""
 
+import uuid
+
 import httpx
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import src.auth.schemas as auth_schemas
 import src.users.schemas as user_schemas
 from src import constants
+from src.settings import settings
 from src.users.models import UserModel
 from src.users.repositories import UserRepository
 from src.users.routers import user_router
@@ -96,6 +99,123 @@ class TestUserRouter(BaseTestRouter):
         assert users_data.users[0].email == first_user_db.email
         assert users_data.users[0].id == first_user_db.id
 
+    async def test_get_users_by_admin_search(
+        self,
+        router_client: httpx.AsyncClient,
+        user_db: UserModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """
+        Администратор может найти пользователей по части почты
+        без учета регистра, а короткие значения ищутся по началу почты.
+        Результаты поиска отсортированы по сходству.
+        """
+
+        email = user_db.email
+
+        response = await router_client.get(
+            url="/users",
+            params={"email": email.upper()},
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        users_data = user_schemas.UserListReadSchema(**response.json())
+
+        assert users_data.users[0].email == email
+        assert users_data.next_cursor is None
+
+        response = await router_client.get(
+            url="/users",
+            params={"email": email[:2]},
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        users_data = user_schemas.UserListReadSchema(**response.json())
+
+        assert email in [user.email for user in users_data.users]
+        assert all(
+            user.email.lower().startswith(email[:2].lower())
+            for user in users_data.users
+        )
+
+    async def test_get_users_by_admin_count_strategies(
+        self,
+        session: AsyncSession,
+        router_client: httpx.AsyncClient,
+        user_db: UserModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """
+        Администратор может выбрать стратегию подсчета пользователей.
+        Количество меньше ограничений стратегий считается точно.
+        """
+
+        users_count = await UserRepository.count(session=session)
+
+        for count_strategy in ("exact", "window", "estimated", "capped"):
+            response = await router_client.get(
+                url="/users",
+                params={"count_strategy": count_strategy, "limit": 1},
+                headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+            users_data = user_schemas.UserListReadSchema(**response.json())
+
+            assert users_data.count == users_count
+            assert users_data.count_accuracy == "exact"
+            assert len(users_data.users) == 1
+
+    async def test_get_users_by_admin_count_accuracy(
+        self,
+        mocker,
+        session: AsyncSession,
+        router_client: httpx.AsyncClient,
+        user_db: UserModel,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """
+        Количество больше `DB_COUNT_CAP` возвращается как нижняя граница,
+        а оценка не меньше `DB_COUNT_ESTIMATE_THRESHOLD` - как оценка.
+        """
+
+        mocker.patch.object(settings, "DB_COUNT_CAP", 1)
+        mocker.patch.object(settings, "DB_COUNT_ESTIMATE_THRESHOLD", 1)
+
+        async def get_users(count_strategy: str) -> user_schemas.UserListReadSchema:
+            response = await router_client.get(
+                url="/users",
+                # Фильтр, чтобы оценка бралась из плана запроса,
+                # а не из статистики таблицы
+                params={"count_strategy": count_strategy, "is_admin": False},
+                headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+            return user_schemas.UserListReadSchema(**response.json())
+
+        session.add(
+            UserModel(
+                id=str(uuid.uuid4()),
+                email=f"{uuid.uuid4().hex}@example.com",
+                hashed_password=user_db.hashed_password,
+                full_name=user_db.full_name,
+            )
+        )
+        await session.commit()
+
+        capped = await get_users("capped")
+
+        assert capped.count == 1
+        assert capped.count_accuracy == "at_least"
+
+        estimated = await get_users("estimated")
+
+        assert estimated.count >= 1
+        assert estimated.count_accuracy == "estimated"
+
     async def test_get_users_by_admin_query(
         self,
         router_client: httpx.AsyncClient,
@@ -231,3 +351,51 @@ class TestUserRouter(BaseTestRouter):
         )
 
         assert deleted_user is None
+
+    async def test_deleted_user_token_rejected(
+        self,
+        router_client: httpx.AsyncClient,
+        user_db: UserModel,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """Токен удаленного пользователя не принимается, даже если он кэширован."""
+
+        response = await router_client.get(
+            url="/users/me",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await router_client.delete(
+            url=f"/users/{user_db.id}",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = await router_client.get(
+            url="/users/me",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_revoke_user_tokens_by_admin(
+        self,
+        router_client: httpx.AsyncClient,
+        user_db: UserModel,
+        user_jwt_tokens: auth_schemas.JWTGetSchema,
+        admin_jwt_tokens: auth_schemas.JWTGetSchema,
+    ):
+        """Токены пользователя не принимаются после их отзыва администратором."""
+
+        response = await router_client.post(
+            url=f"/users/{user_db.id}/revoke_tokens",
+            headers={constants.AUTH_HEADER_NAME: admin_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = await router_client.get(
+            url="/users/me",
+            headers={constants.AUTH_HEADER_NAME: user_jwt_tokens.access_token},
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,156 @@
+"""Модуль для тестирования src.accounts.services.account_balance_sharding"""
+
+import uuid
+
+import pytest
+
+from src.accounts.repositories import AccountRepository
+from src.accounts.services import AccountBalanceSharding
+from tests.unit.conftest import fake_session_factory
+
+
+@pytest.fixture
+def sharding() -> AccountBalanceSharding:
+    """Распределение балансов с 4 частями."""
+
+    return AccountBalanceSharding(
+        session_factory=fake_session_factory,
+        shards=4,
+        promote_rate=10,
+        demote_rate=1,
+        compact_interval_seconds=3600,
+        is_enabled=True,
+    )
+
+
+@pytest.fixture
+def repository(mocker):
+    """
+    Репозиторий аккаунтов, хранящий признак `is_hot` в памяти.
+    `compacted` задает `id` аккаунтов с частями при следующем переносе.
+    """
+
+    hot_ids: set[uuid.UUID] = set()
+    compacted: set[uuid.UUID] = set()
+
+    async def set_hot(session, ids, is_hot):
+        if is_hot:
+            hot_ids.update(ids)
+        else:
+            hot_ids.difference_update(ids)
+
+    async def find_hot_ids(session):
+        return set(hot_ids)
+
+    async def compact_balance_shards(session):
+        return set(compacted)
+
+    mocker.patch.object(AccountRepository, "set_hot", side_effect=set_hot)
+    mocker.patch.object(AccountRepository, "find_hot_ids", side_effect=find_hot_ids)
+    mocker.patch.object(
+        AccountRepository,
+        "compact_balance_shards",
+        side_effect=compact_balance_shards,
+    )
+
+    return hot_ids, compacted
+
+
+@pytest.fixture
+def clock(mocker):
+    """Время `time.monotonic`, изменяемое тестом."""
+
+    now = [0.0]
+    mocker.patch(
+        "src.accounts.services.account_balance_sharding.time.monotonic",
+        side_effect=lambda: now[0],
+    )
+    return now
+
+
+class TestAccountBalanceSharding:
+    """Класс для тестирования AccountBalanceSharding."""
+
+    def test_route(self, sharding):
+        """Часть баланса выбирается только для аккаунтов с `is_hot`."""
+
+        cold_id, hot_id = uuid.uuid4(), uuid.uuid4()
+        sharding.hot_ids = {hot_id}
+
+        assert sharding.route(cold_id) is None
+        assert {sharding.route(hot_id) for _ in range(100)} <= set(range(4))
+
+        sharding.is_enabled = False
+
+        assert sharding.route(hot_id) is None
+
+    async def test_promote_and_demote(self, sharding, repository, clock):
+        """
+        Аккаунт с частыми изменениями помечается `is_hot`
+        и возвращается в обычный режим, когда изменения прекращаются.
+        """
+
+        hot_ids, _ = repository
+        account_id = uuid.uuid4()
+        sharding._window_started_at = clock[0]
+
+        sharding.route(account_id, writes=100)
+        clock[0] = 1
+        await sharding.compact()
+
+        assert hot_ids == {account_id}
+        assert sharding.hot_ids == {account_id}
+        assert sharding.promotions_total == 1
+
+        clock[0] = 2
+        await sharding.compact()
+
+        assert hot_ids == set()
+        assert sharding.hot_ids == set()
+        assert sharding.demotions_total == 1
+
+    async def test_demote_only_promoted_by_process(self, sharding, repository, clock):
+        """
+        Процесс не возвращает в обычный режим аккаунт,
+        помеченный `is_hot` другим процессом.
+        """
+
+        hot_ids, _ = repository
+        account_id = uuid.uuid4()
+        hot_ids.add(account_id)
+        sharding._window_started_at = clock[0]
+
+        clock[0] = 1
+        await sharding.compact()
+        clock[0] = 2
+        await sharding.compact()
+
+        assert hot_ids == {account_id}
+        assert sharding.demotions_total == 0
+
+    async def test_keep_hot_with_shard_activity(self, sharding, repository, clock):
+        """
+        Аккаунт не возвращается в обычный режим, пока при переносе
+        находятся его части, записанные другими процессами.
+        """
+
+        hot_ids, compacted = repository
+        account_id = uuid.uuid4()
+        sharding._window_started_at = clock[0]
+
+        sharding.route(account_id, writes=100)
+        clock[0] = 1
+        await sharding.compact()
+
+        compacted.add(account_id)
+        clock[0] = 2
+        await sharding.compact()
+
+        assert hot_ids == {account_id}
+
+        compacted.clear()
+        clock[0] = 3
+        await sharding.compact()
+
+        assert hot_ids == set()
+        assert sharding.get_stats()["compacted_accounts_total"] == 1
@@ -0,0 +1,37 @@
+"""Модуль для тестирования src.auth.services.auth_service"""
+
+import pytest
+
+import src.users.schemas as user_schemas
+from src import exceptions
+from src.auth.services import AuthService
+from src.users.repositories import UserRepository
+from src.users.services import PasswordService
+from tests.unit.conftest import FakeSession
+
+
+class TestAuthService:
+    """Класс для тестирования AuthService."""
+
+    async def test_login_unknown_email_verifies_password(self, mocker):
+        """
+        Для неизвестного email пароль проверяется по фиктивному хэшу,
+        чтобы время ответа не отличалось от неверного пароля.
+        """
+
+        mocker.patch.object(UserRepository, "find_one_or_none", return_value=None)
+        verify = mocker.spy(PasswordService, "verify")
+
+        with pytest.raises(exceptions.UserNotFoundException):
+            await AuthService.login(
+                FakeSession(),
+                user_schemas.UserLoginSchema(
+                    email="unknown@example.com",
+                    password="password",
+                ),
+            )
+
+        verify.assert_awaited_once()
+        hashed_password = verify.call_args.kwargs["hashed_password"]
+        assert hashed_password == await PasswordService.get_dummy_hash()
+        assert not PasswordService.needs_rehash(hashed_password)
@@ -0,0 +1,33 @@
+"""Модуль для тестирования src.utils.bloom"""
+
+import uuid
+
+from src.utils import BloomFilter
+
+
+class TestBloomFilter:
+    """Класс для тестирования BloomFilter."""
+
+    def test_contains_added(self):
+        """Добавленные элементы всегда находятся в фильтре."""
+
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [uuid.uuid4().hex for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert bloom.count == 1000
+        assert bloom.is_full
+
+    def test_false_positive_rate(self):
+        """Доля ложных срабатываний не превышает заданную с запасом."""
+
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for _ in range(1000):
+            bloom.add(uuid.uuid4().hex)
+
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+
+        assert false_positives < 10000 * 0.01 * 3
+        assert not BloomFilter(capacity=1000, error_rate=0.01).is_full
@@ -0,0 +1,140 @@
+"""Модуль для тестирования src.cache_invalidation"""
+
+import asyncio
+import logging
+
+import pytest
+
+from src.cache_invalidation import CacheInvalidationBus
+
+
+class RecordingSession:
+    """Сессия без БД, сохраняющая параметры запросов."""
+
+    def __init__(self):
+        self.params = []
+
+    async def execute(self, stmt, params) -> None:
+        self.params.extend(params)
+
+
+class FakeConnection:
+    """Соединение `asyncpg`, закрываемое тестом."""
+
+    def __init__(self):
+        self.listeners = []
+        self.termination_listeners = []
+        self.is_terminated = False
+
+    async def add_listener(self, channel, callback) -> None:
+        self.listeners.append(callback)
+
+    def add_termination_listener(self, callback) -> None:
+        self.termination_listeners.append(callback)
+
+    def close(self) -> None:
+        for callback in self.termination_listeners:
+            callback(self)
+
+    def terminate(self) -> None:
+        self.is_terminated = True
+
+    def is_closed(self) -> bool:
+        return self.is_terminated
+
+
+@pytest.fixture
+def bus(mocker) -> CacheInvalidationBus:
+    """Шина с включенным сбросом кэшей и без паузы переподключения."""
+
+    mocker.patch(
+        "src.cache_invalidation.settings.CACHE_INVALIDATION_ENABLED",
+        True,
+    )
+    mocker.patch("src.cache_invalidation.get_asyncpg_dsn", return_value="dsn")
+    return CacheInvalidationBus(channel="cache_invalidation", reconnect_seconds=0)
+
+
+async def wait_for(condition) -> None:
+    """Дождаться выполнения условия в фоновой задаче."""
+
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestCacheInvalidationBus:
+    """Класс для тестирования CacheInvalidationBus."""
+
+    async def test_publish(self, bus):
+        """Событие публикуется для каждого `id` с источником и версией."""
+
+        session = RecordingSession()
+
+        await bus.publish(session, "user", ["first", "second"], version=3)
+        await bus.publish(session, "user", [])
+
+        assert [params["payload"] for params in session.params] == [
+            f"{bus.origin}|user|3|first",
+            f"{bus.origin}|user|3|second",
+        ]
+        assert bus.get_stats()["published_total"] == 2
+
+    def test_on_notify(self, bus, mocker):
+        """
+        События других процессов передаются обработчикам сущности,
+        а события своего процесса пропускаются.
+        """
+
+        handler = mocker.Mock()
+        bus.subscribe("user", handler)
+
+        bus._on_notify(None, 1, bus.channel, f"{bus.origin}|user||own")
+        bus._on_notify(None, 1, bus.channel, "other|user|2|first")
+        bus._on_notify(None, 1, bus.channel, "other|user||second")
+        bus._on_notify(None, 1, bus.channel, "other|account||third")
+
+        assert handler.call_args_list == [
+            mocker.call("first", 2),
+            mocker.call("second", None),
+        ]
+        assert bus.get_stats()["received_total"] == 3
+
+    async def test_reconnect(self, bus, mocker, caplog):
+        """
+        Ошибка соединения логируется, а после подключения
+        и переподключения обработчики получают сброс всего кэша.
+        Закрытие прежнего соединения не закрывает новое.
+        """
+
+        handler = mocker.Mock()
+        bus.subscribe("user", handler)
+        connections = [FakeConnection(), FakeConnection()]
+        mocker.patch(
+            "src.cache_invalidation.asyncpg.connect",
+            side_effect=[OSError("connection refused"), *connections],
+        )
+
+        with caplog.at_level(logging.ERROR, logger="src.cache_invalidation"):
+            bus.start()
+            await wait_for(lambda: handler.call_count == 1)
+
+            assert bus.get_stats()["is_connected"]
+            assert bus.get_stats()["reconnects_total"] == 1
+            assert "reconnecting" in caplog.text
+
+            connections[0].close()
+            await wait_for(lambda: handler.call_count == 2)
+
+            # Поздний вызов слушателя прежнего соединения
+            connections[0].close()
+            await asyncio.sleep(0.05)
+
+            assert bus.get_stats()["is_connected"]
+            await bus.stop()
+
+        assert handler.call_args_list == [mocker.call(None, None)] * 2
+        assert connections[0].is_terminated
+        assert connections[1].is_terminated
+        assert bus.get_stats()["reconnects_total"] == 2
@@ -0,0 +1,25 @@
+"""Модуль для тестирования src.utils.cache"""
+
+from src.utils import LRUSet
+
+
+class TestLRUSet:
+    """Класс для тестирования LRUSet."""
+
+    def test_evicts_least_recently_used(self):
+        """
+        При переполнении вытесняется давно не использованный элемент,
+        а проверка наличия обновляет использование элемента.
+        """
+
+        lru = LRUSet(max_size=2)
+        lru.add("first")
+        lru.add("second")
+
+        assert "first" in lru
+
+        lru.add("third")
+
+        assert "second" not in lru
+        assert list(lru) == ["first", "third"]
+        assert len(lru) == 2
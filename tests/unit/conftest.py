@@ -0,0 +1,41 @@
+"""Модуль `conftest` с вспомогательными объектами для пакета `tests.unit`."""
+
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import src.transactions.schemas as transaction_schemas
+
+
+class FakeSession:
+    """Сессия без БД, считающая коммиты и откаты."""
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+        self.info = {}
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+@asynccontextmanager
+async def fake_session_factory() -> AsyncIterator[FakeSession]:
+    """Фабрика сессий без БД."""
+
+    yield FakeSession()
+
+
+def create_transaction(amount: int = 100) -> transaction_schemas.TransactionSchema:
+    """Создать транзакцию со случайными `id`."""
+
+    return transaction_schemas.TransactionSchema(
+        id=uuid.uuid4().hex,
+        account_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        amount=amount,
+        signature="signature",
+    )
@@ -0,0 +1,59 @@
+"""Модуль для тестирования src.utils.cursor"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.utils import decode_cursor, encode_cursor
+
+
+def create_cursor(values) -> str:
+    """Закодировать произвольные значения JSON в курсор."""
+
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+class TestCursor:
+    """Класс для тестирования курсоров пагинации."""
+
+    def test_encode_decode(self):
+        """Значения ключа сортировки восстанавливаются из курсора."""
+
+        values = [datetime(2020, 1, 1, 12), uuid.uuid4(), 5]
+
+        assert decode_cursor(encode_cursor(values), [datetime, uuid.UUID, int]) == (
+            values
+        )
+
+    @pytest.mark.parametrize(
+        ("values", "types"),
+        [
+            ([1], [uuid.UUID]),
+            ([{}], [uuid.UUID]),
+            ([[1]], [uuid.UUID]),
+            (["not-uuid"], [uuid.UUID]),
+            ([1], [datetime]),
+            (["2020-01-01", 1], [datetime, uuid.UUID]),
+            ([{}], [int]),
+            ([], [uuid.UUID]),
+            ([str(uuid.uuid4()), 1], [uuid.UUID]),
+            ({"id": 1}, [int]),
+        ],
+    )
+    def test_decode_invalid(self, values, types):
+        """
+        Курсор со значениями другого типа или другим количеством
+        значений считается некорректным.
+        """
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(create_cursor(values), types)
+
+    def test_decode_not_base64(self):
+        """Поврежденный курсор считается некорректным."""
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("%%%", [int])
@@ -0,0 +1,98 @@
+"""Модуль для тестирования src.auth.services.jwt_service"""
+
+import asyncio
+import time
+import uuid
+
+import jwt
+import pytest
+
+from src import constants, exceptions, utils
+from src.auth.services import JWTService
+from src.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def cache(mocker) -> utils.TTLCache:
+    """Пустой кэш декодированных токенов."""
+
+    mocker.patch.object(settings, "JWT_CACHE_ENABLED", True)
+    cache = utils.TTLCache(max_size=100, ttl_seconds=60)
+    mocker.patch.object(JWTService, "_cache", cache)
+    return cache
+
+
+def create_token(exp: float, secret: str | None = None) -> str:
+    """Создать access_token пользователя со временем истечения `exp`."""
+
+    return jwt.encode(
+        {"id": str(uuid.uuid4()), "exp": int(exp)},
+        secret or settings.JWT_ACCESS_SECRET,
+        algorithm=constants.ALGORITHM,
+    )
+
+
+class TestJWTService:
+    """Класс для тестирования кэша JWTService."""
+
+    def test_decode_from_cache(self, mocker):
+        """Повторный токен декодируется из кэша без проверки подписи."""
+
+        decode = mocker.spy(jwt, "decode")
+        token = create_token(time.time() + 60)
+
+        payload = JWTService.decode_token(token, "access_token")
+
+        assert JWTService.decode_token(token, "access_token") == payload
+        assert decode.call_count == 1
+        assert JWTService.get_stats()["hits"] == 1
+        assert JWTService.get_stats()["misses"] == 1
+
+    def test_token_type_in_key(self):
+        """Токен с другим типом не берется из кэша."""
+
+        token = create_token(time.time() + 60)
+        JWTService.decode_token(token, "access_token")
+
+        with pytest.raises(exceptions.InvalidTokenException):
+            JWTService.decode_token(token, "refresh_token")
+
+    def test_invalid_token_cached(self, mocker):
+        """Невалидный токен кэшируется и отклоняется повторно."""
+
+        decode = mocker.spy(jwt, "decode")
+        token = create_token(time.time() + 60, secret="wrong-secret")
+
+        for _ in range(2):
+            with pytest.raises(exceptions.InvalidTokenException):
+                JWTService.decode_token(token, "access_token")
+
+        assert decode.call_count == 1
+        assert JWTService.get_stats()["hits"] == 1
+
+    def test_expired_token_cached(self, mocker):
+        """Истекший токен кэшируется и отклоняется повторно."""
+
+        decode = mocker.spy(jwt, "decode")
+        token = create_token(time.time() - 60)
+
+        for _ in range(2):
+            with pytest.raises(exceptions.TokenExpiredException):
+                JWTService.decode_token(token, "access_token")
+
+        assert decode.call_count == 1
+
+    async def test_valid_entry_expires_with_token(self, mocker):
+        """Утверждения токена не возвращаются из кэша после его истечения."""
+
+        decode = mocker.spy(jwt, "decode")
+        exp = int(time.time()) + 1
+        token = create_token(exp)
+
+        JWTService.decode_token(token, "access_token")
+        await asyncio.sleep(exp - time.time() + 0.05)
+
+        with pytest.raises(exceptions.TokenExpiredException):
+            JWTService.decode_token(token, "access_token")
+
+        assert decode.call_count == 2
@@ -0,0 +1,52 @@
+"""Модуль для тестирования src.ledger.cli"""
+
+import json
+
+from src.ledger.cli import main
+
+
+class TestLedgerCli:
+    """Класс для тестирования консольной утилиты реестра."""
+
+    def test_restore_missing_directory(self, tmp_path, capsys):
+        """Отсутствующая выгрузка завершается кодом 1 без трассировки."""
+
+        path = tmp_path / "missing"
+
+        assert main(["restore", str(path)]) == 1
+
+        err = capsys.readouterr().err
+        assert "manifest.json" in err
+        assert "Traceback" not in err
+
+    def test_restore_invalid_json_manifest(self, tmp_path, capsys):
+        """Манифест с некорректным JSON завершается кодом 1."""
+
+        (tmp_path / "manifest.json").write_text("{")
+
+        assert main(["restore", str(tmp_path)]) == 1
+        assert "Некорректный манифест" in capsys.readouterr().err
+
+    def test_restore_invalid_manifest_schema(self, tmp_path, capsys):
+        """Манифест без обязательных полей завершается кодом 1."""
+
+        (tmp_path / "manifest.json").write_text(json.dumps({"version": 1}))
+
+        assert main(["restore", str(tmp_path)]) == 1
+        assert "Некорректный манифест" in capsys.readouterr().err
+
+    def test_restore_unsupported_version(self, tmp_path, capsys):
+        """Неподдерживаемая версия манифеста завершается кодом 1."""
+
+        manifest = {
+            "version": 999,
+            "name": "dump",
+            "created_at": "2026-10-16T12:00:00Z",
+            "format": "csv",
+            "compression": "gzip",
+            "tables": [],
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+        assert main(["restore", str(tmp_path)]) == 1
+        assert capsys.readouterr().err
@@ -0,0 +1,109 @@
+"""Модуль для тестирования src.utils.shared_cache"""
+
+import os
+import uuid
+
+import pytest
+
+from src.utils import MISSING, SharedMemoryCache
+
+
+@pytest.fixture
+def create_cache(tmp_path):
+    """Фабрика кэшей с общим путем во временной директории."""
+
+    def create(max_size: int = 64, value_format: str = "<q?") -> SharedMemoryCache:
+        return SharedMemoryCache(
+            path=str(tmp_path / "users.cache"),
+            max_size=max_size,
+            ttl_seconds=60,
+            value_format=value_format,
+        )
+
+    return create
+
+
+class TestSharedMemoryCache:
+    """Класс для тестирования SharedMemoryCache."""
+
+    def test_get_set_delete(self, create_cache):
+        """Значения и None записываются, читаются и удаляются по ключу."""
+
+        cache = create_cache()
+        key, none_key = uuid.uuid4(), uuid.uuid4()
+
+        assert cache.get(key) is MISSING
+
+        cache.set(key, (1, True))
+        cache.set(none_key, None)
+
+        assert cache.get(key) == (1, True)
+        assert cache.get(none_key) is None
+        assert len(cache) == 2
+
+        cache.delete(key)
+
+        assert cache.get(key, default="missing") == "missing"
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 2
+
+    def test_expired(self, create_cache):
+        """Устаревшее значение не возвращается."""
+
+        cache = create_cache()
+        key = uuid.uuid4()
+        cache.set(key, (1, False), ttl_seconds=-1)
+
+        assert cache.get(key) is MISSING
+        assert len(cache) == 0
+
+    def test_generation_guard(self, create_cache):
+        """Значение, прочитанное до удаления, не записывается."""
+
+        cache = create_cache()
+        key = uuid.uuid4()
+        generation = cache.generation
+
+        create_cache().delete(uuid.uuid4())
+        cache.set(key, (1, True), generation=generation)
+
+        assert cache.get(key) is MISSING
+
+        cache.set(key, (1, True), generation=cache.generation)
+
+        assert cache.get(key) == (1, True)
+
+    def test_other_layout(self, create_cache):
+        """Кэш с другими параметрами использует другой файл."""
+
+        cache = create_cache()
+        key = uuid.uuid4()
+        cache.set(key, (1, True))
+
+        other = create_cache(max_size=128, value_format="<qq")
+        other.set(key, (2, 3))
+
+        assert other.file_path != cache.file_path
+        assert cache.get(key) == (1, True)
+        assert other.get(key) == (2, 3)
+
+    def test_fork_shared(self, create_cache):
+        """Значения, записанные дочерним процессом, видны родительскому."""
+
+        cache = create_cache()
+        key = uuid.uuid4()
+        cache.set(key, (1, True))
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                cache.delete(key)
+                cache.set(uuid.UUID(int=key.int + 1), (2, False))
+            finally:
+                os._exit(0)
+
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert cache.get(key) is MISSING
+        assert cache.get(uuid.UUID(int=key.int + 1)) == (2, False)
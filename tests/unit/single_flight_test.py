@@ -0,0 +1,112 @@
+"""Модуль для тестирования src.utils.single_flight"""
+
+import asyncio
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Класс для тестирования SingleFlight."""
+
+    async def test_share_result(self):
+        """Параллельные вызовы с одним ключом выполняются один раз."""
+
+        single_flight = SingleFlight()
+        calls = []
+        release = asyncio.Event()
+
+        async def func():
+            calls.append(1)
+            await release.wait()
+            return "result"
+
+        tasks = [asyncio.create_task(single_flight.do("key", func)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [
+            ("result", False),
+            ("result", True),
+            ("result", True),
+        ]
+        assert calls == [1]
+        assert single_flight.get_stats() == {
+            "calls_total": 1,
+            "shared_total": 2,
+            "in_flight": 0,
+        }
+
+        assert await single_flight.do("key", func) == ("result", False)
+        assert len(calls) == 2
+
+    async def test_share_exception(self):
+        """Исключение вызова передается всем ожидающим вызовам."""
+
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def func():
+            await release.wait()
+            raise ValueError("failed")
+
+        tasks = [asyncio.create_task(single_flight.do("key", func)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.get_stats()["in_flight"] == 0
+
+    async def test_leader_cancelled(self):
+        """
+        Если ожидаемый вызов отменен, ожидающий вызов выполняется заново,
+        а сам не отменяется.
+        """
+
+        single_flight = SingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.01 if len(calls) > 1 else 3600)
+            return len(calls)
+
+        leader = asyncio.create_task(single_flight.do("key", func))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", func))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        assert await follower == (2, False)
+        assert single_flight.get_stats()["in_flight"] == 0
+
+    async def test_follower_cancelled(self):
+        """Отмена ожидающего вызова не отменяет ожидаемый вызов."""
+
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def func():
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(single_flight.do("key", func))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do("key", func))
+        await asyncio.sleep(0)
+
+        follower.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+
+        release.set()
+
+        assert await leader == ("result", False)
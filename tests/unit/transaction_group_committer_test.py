@@ -0,0 +1,146 @@
+"""Модуль для тестирования src.transactions.services.transaction_group_committer"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from src import exceptions
+from src.transactions.services import TransactionService
+from src.transactions.services.transaction_group_committer import (
+    TransactionGroupCommitter,
+)
+from tests.unit.conftest import FakeSession, create_transaction, fake_session_factory
+
+
+@pytest.fixture
+def groups() -> list[list[str]]:
+    """`id` транзакций каждой группы, переданной обработчику."""
+
+    return []
+
+
+@pytest_asyncio.fixture
+async def committer(groups):
+    """
+    Групповой коммит, обработчик которого отклоняет отрицательные суммы
+    ошибкой целостности, а суммы вне `integer` - ошибкой данных.
+    """
+
+    async def handler(session, batch):
+        groups.append([data.id for data in batch])
+        for data in batch:
+            if data.amount < 0:
+                raise IntegrityError("INSERT", {}, Exception("check violation"))
+            if data.amount >= 2**31:
+                raise DBAPIError("INSERT", {}, Exception("integer out of range"))
+        return {data.id for data in batch}
+
+    committer = TransactionGroupCommitter(
+        handler=handler,
+        session_factory=fake_session_factory,
+        window_seconds=0.05,
+        max_items=3,
+    )
+
+    yield committer
+
+    await committer.stop()
+
+
+async def submit(committer: TransactionGroupCommitter, *transactions) -> list:
+    """Передать транзакции параллельно и получить результаты или исключения."""
+
+    return await asyncio.gather(
+        *(committer.submit(data) for data in transactions),
+        return_exceptions=True,
+    )
+
+
+class TestTransactionGroupCommitter:
+    """Класс для тестирования TransactionGroupCommitter."""
+
+    async def test_group_within_window(self, committer, groups):
+        """
+        Транзакции, поступившие в пределах окна, записываются одной группой,
+        а группа ограничена `max_items` транзакциями.
+        """
+
+        transactions = [create_transaction() for _ in range(4)]
+
+        assert await submit(committer, *transactions) == [True] * 4
+        assert groups == [
+            [data.id for data in transactions[:3]],
+            [transactions[3].id],
+        ]
+        assert committer.groups_total == 2
+        assert committer.items_total == 4
+
+        await submit(committer, create_transaction())
+
+        assert len(groups) == 3
+
+    async def test_duplicate_in_group(self, mocker, committer, groups):
+        """
+        Повтор `id` внутри группы не записывается повторно,
+        а запрос с повтором получает конфликт с кодом 409.
+        """
+
+        mocker.patch.multiple(
+            "src.transactions.services.transaction_service.settings",
+            TRANSACTION_GROUP_COMMIT_ENABLED=True,
+            TRANSACTION_ID_FILTER_ENABLED=False,
+        )
+        mocker.patch(
+            "src.transactions.services.transaction_service.transaction_group_committer",
+            committer,
+        )
+        data = create_transaction()
+
+        results = await asyncio.gather(
+            TransactionService._create_verified(FakeSession(), data),
+            TransactionService._create_verified(FakeSession(), data),
+            return_exceptions=True,
+        )
+
+        assert results[0] == data
+        assert isinstance(results[1], exceptions.TransactionConflictException)
+        assert results[1].status_code == status.HTTP_409_CONFLICT
+        assert groups == [[data.id]]
+
+    async def test_fallback_after_integrity_error(self, committer, groups):
+        """
+        После ошибки целостности транзакции группы записываются по одной,
+        и конфликт получает только транзакция с ошибкой.
+        """
+
+        transactions = [
+            create_transaction(),
+            create_transaction(amount=-1),
+            create_transaction(),
+        ]
+
+        results = await submit(committer, *transactions)
+
+        assert results[0] is True
+        assert isinstance(results[1], exceptions.TransactionConflictException)
+        assert results[2] is True
+        assert groups == [
+            [data.id for data in transactions],
+            *([data.id] for data in transactions),
+        ]
+        assert committer.groups_total == 2
+
+    async def test_other_error(self, committer):
+        """Другие ошибки передаются всем транзакциям группы."""
+
+        results = await submit(
+            committer,
+            create_transaction(),
+            create_transaction(amount=2**40),
+        )
+
+        assert all(isinstance(result, DBAPIError) for result in results)
+        assert committer.groups_total == 0
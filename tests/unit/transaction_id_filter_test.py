@@ -0,0 +1,86 @@
+"""Модуль для тестирования src.transactions.services.transaction_id_filter"""
+
+from src.transactions.repositories import TransactionRepository
+from src.transactions.services.transaction_id_filter import TransactionIdFilter
+from tests.unit.conftest import FakeSession
+
+
+def create_filter(lru_size: int = 2, bloom_capacity: int = 100) -> TransactionIdFilter:
+    """Создать фильтр без загрузки `id` из БД."""
+
+    return TransactionIdFilter(
+        lru_size=lru_size,
+        bloom_capacity=bloom_capacity,
+        bloom_error_rate=0.01,
+        seed_size=0,
+    )
+
+
+class TestTransactionIdFilter:
+    """Класс для тестирования TransactionIdFilter."""
+
+    async def test_duplicate_from_lru(self, mocker):
+        """Повтор из LRU множества определяется без запроса в БД."""
+
+        exists = mocker.patch.object(TransactionRepository, "exists")
+        id_filter = create_filter()
+        id_filter.add("first")
+
+        assert await id_filter.is_duplicate(session=FakeSession(), id="first")
+        assert not await id_filter.is_duplicate(session=FakeSession(), id="second")
+        exists.assert_not_called()
+
+    async def test_bloom_hit_confirmed_in_database(self, mocker):
+        """
+        Срабатывание фильтра Блума проверяется запросом в БД,
+        а подтвержденный повтор запоминается в LRU множестве.
+        """
+
+        exists = mocker.patch.object(TransactionRepository, "exists", return_value=True)
+        id_filter = create_filter(lru_size=1)
+        id_filter.add("first")
+        id_filter.add("second")
+
+        assert id_filter.check("first") == "maybe"
+        assert await id_filter.is_duplicate(session=FakeSession(), id="first")
+        assert id_filter.check("first") == "duplicate"
+        exists.assert_awaited_once()
+        assert id_filter.get_stats()["bloom_hits_total"] == 1
+        assert id_filter.get_stats()["bloom_false_positives_total"] == 0
+
+    async def test_bloom_false_positive(self, mocker):
+        """Ложное срабатывание фильтра Блума не считается повтором."""
+
+        mocker.patch.object(TransactionRepository, "exists", return_value=False)
+        id_filter = create_filter(lru_size=1)
+        id_filter.add("first")
+        id_filter.add("second")
+
+        assert not await id_filter.is_duplicate(session=FakeSession(), id="first")
+        assert id_filter.check("first") == "maybe"
+        assert id_filter.get_stats()["bloom_false_positives_total"] == 1
+        assert id_filter.get_stats()["duplicates_total"] == 0
+
+    def test_bloom_generations(self):
+        """
+        Заполненный фильтр Блума остается предыдущим поколением,
+        поэтому покрытие не падает до размера LRU множества,
+        а поколение до предыдущего отбрасывается.
+        """
+
+        id_filter = create_filter(lru_size=1, bloom_capacity=2)
+        for id in ("first", "second", "third", "fourth"):
+            id_filter.add(id)
+
+        assert id_filter.get_stats()["bloom_count"] == 4
+        assert id_filter.check("first") == "maybe"
+        assert id_filter.check("third") == "maybe"
+        assert id_filter.check("fourth") == "duplicate"
+
+        id_filter.add("fifth")
+
+        assert id_filter.get_stats()["bloom_count"] == 3
+        assert id_filter.check("first") == "new"
+        assert id_filter.check("second") == "new"
+        assert id_filter.check("third") == "maybe"
+        assert id_filter.check("fifth") == "duplicate"
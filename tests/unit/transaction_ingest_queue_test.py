@@ -0,0 +1,115 @@
+"""Модуль для тестирования src.transactions.services.transaction_ingest_queue"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
+
+from src.transactions.services.transaction_ingest_queue import (
+    LocalTransactionBroker,
+    TransactionIngestQueue,
+)
+from tests.unit.conftest import FakeSession, create_transaction
+
+
+@pytest.fixture
+def remembered() -> list[tuple[set[str], int]]:
+    """
+    `id`, переданные в `on_created`, и количество коммитов сессии
+    на момент вызова.
+    """
+
+    return []
+
+
+@pytest_asyncio.fixture
+async def ingest_queue(remembered):
+    """
+    Очередь, обработчик которой отклоняет отрицательные суммы
+    ошибкой целостности, а суммы вне `integer` - ошибкой данных.
+    Первая запись пакета завершается ошибкой недоступности БД.
+    """
+
+    calls = []
+    sessions: list[FakeSession] = []
+
+    @asynccontextmanager
+    async def session_factory():
+        session = FakeSession()
+        sessions.append(session)
+        yield session
+
+    async def handler(session, batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise OperationalError("INSERT", {}, Exception("connection refused"))
+        for data in batch:
+            if data.amount < 0:
+                raise IntegrityError("INSERT", {}, Exception("check violation"))
+            if data.amount >= 2**31:
+                raise DBAPIError("INSERT", {}, Exception("integer out of range"))
+        return {data.id for data in batch}
+
+    queue = TransactionIngestQueue(
+        broker=LocalTransactionBroker(max_size=100),
+        handler=handler,
+        session_factory=session_factory,
+        workers=1,
+        batch_size=100,
+        status_max_size=100,
+        retry_seconds=0,
+        on_created=lambda ids: remembered.append((set(ids), sessions[-1].commits)),
+    )
+
+    yield queue
+
+    await queue.stop(timeout=1)
+
+
+async def wait_written(queue: TransactionIngestQueue) -> None:
+    """Дождаться записи всех транзакций очереди."""
+
+    for _ in range(100):
+        if not queue.broker.depth() and not queue.in_flight:
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestTransactionIngestQueue:
+    """Класс для тестирования TransactionIngestQueue."""
+
+    async def test_write_failed_transactions(self, ingest_queue, remembered):
+        """
+        Пакет повторяется при недоступности БД, а транзакции с ошибкой
+        целостности или данных получают статус `failed`, не задерживая
+        остальные транзакции пакета. В `on_created` передаются только
+        транзакции, созданные после коммита.
+        """
+
+        transactions = [
+            create_transaction(),
+            create_transaction(amount=-1),
+            create_transaction(amount=2**40),
+            create_transaction(),
+        ]
+        for data in transactions:
+            ingest_queue.publish(data)
+        ingest_queue.publish(transactions[0])
+
+        await wait_written(ingest_queue)
+
+        assert [ingest_queue.get_status(data.id) for data in transactions] == [
+            "created",
+            "failed",
+            "failed",
+            "created",
+        ]
+        assert ingest_queue.get_stats()["failed_total"] == 2
+        assert ingest_queue.get_stats()["duplicates_total"] == 1
+        assert ingest_queue.get_stats()["workers"] == 1
+        assert remembered == [
+            ({transactions[0].id}, 1),
+            ({transactions[3].id}, 1),
+        ]
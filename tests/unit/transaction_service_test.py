@@ -0,0 +1,41 @@
+"""Модуль для тестирования src.transactions.services.transaction_service"""
+
+import pytest
+
+from src import exceptions
+from src.transactions.services import TransactionService
+from tests.unit.conftest import FakeSession, create_transaction
+
+
+class TestTransactionService:
+    """Класс для тестирования TransactionService."""
+
+    @pytest.mark.parametrize("ingest_mode", ["sync", "async"])
+    async def test_accept_checks_signature_first(self, mocker, ingest_mode):
+        """
+        Транзакция с некорректной подписью отклоняется до проверки
+        повторной доставки и не попадает в журнал.
+        """
+
+        mocker.patch.multiple(
+            "src.transactions.services.transaction_service.settings",
+            TRANSACTION_INGEST_MODE=ingest_mode,
+            TRANSACTION_ID_FILTER_ENABLED=True,
+            TRANSACTION_SPOOL_ENABLED=True,
+        )
+        mocker.patch.object(
+            TransactionService,
+            "check_transaction_signature",
+            return_value=False,
+        )
+        check_duplicate_delivery = mocker.patch.object(
+            TransactionService,
+            "check_duplicate_delivery",
+        )
+        spool = mocker.patch.object(TransactionService, "spool")
+
+        with pytest.raises(exceptions.TransactionInvalidSignatureException):
+            await TransactionService.accept(FakeSession(), create_transaction())
+
+        check_duplicate_delivery.assert_not_called()
+        spool.assert_not_called()
@@ -0,0 +1,157 @@
+"""Модуль для тестирования src.transactions.services.transaction_spool"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
+
+from src.transactions.services.transaction_spool import TransactionSpool
+from tests.unit.conftest import create_transaction, fake_session_factory
+
+
+@pytest.fixture
+def written() -> list[str]:
+    """ID транзакций, записанных в БД."""
+
+    return []
+
+
+@pytest.fixture
+def remembered() -> list[str]:
+    """ID транзакций, переданные в `on_created` после коммита."""
+
+    return []
+
+
+@pytest_asyncio.fixture
+async def create_spool(tmp_path, written, remembered):
+    """Фабрика журналов в общей временной директории."""
+
+    async def handler(session, batch):
+        for data in batch:
+            if data.amount == -2:
+                raise OperationalError("INSERT", {}, Exception("connection refused"))
+            if data.amount < 0:
+                raise IntegrityError("INSERT", {}, Exception("check violation"))
+            if data.amount >= 2**31:
+                raise DBAPIError("INSERT", {}, Exception("integer out of range"))
+        written.extend(data.id for data in batch)
+        return {data.id for data in batch}
+
+    spools = []
+
+    def create() -> TransactionSpool:
+        spool = TransactionSpool(
+            directory=str(tmp_path),
+            handler=handler,
+            session_factory=fake_session_factory,
+            segment_max_bytes=1024 * 1024,
+            fsync_window_seconds=0,
+            replay_interval_seconds=3600,
+            batch_size=10,
+            on_created=remembered.extend,
+        )
+        spools.append(spool)
+        return spool
+
+    yield create
+
+    for spool in spools:
+        await spool.stop()
+
+
+class TestTransactionSpool:
+    """Класс для тестирования TransactionSpool."""
+
+    async def test_replay(self, create_spool, written):
+        """Повторная запись записывает транзакции журнала и удаляет сегменты."""
+
+        spool = create_spool()
+        transactions = [create_transaction() for _ in range(3)]
+        for data in transactions:
+            await spool.append(data)
+
+        assert await spool.replay() == 3
+        assert written == [data.id for data in transactions]
+        assert spool.get_stats()["segments"] == 0
+        assert not spool.contains(transactions[0].id)
+
+    async def test_replay_skips_open_segment_of_other_spool(
+        self,
+        create_spool,
+        written,
+    ):
+        """
+        Повторная запись не затрагивает сегмент, в который пишет
+        другой журнал в той же директории.
+        """
+
+        first, second = create_spool(), create_spool()
+        before = create_transaction()
+        await first.append(before)
+
+        assert await second.replay() == 0
+        assert written == []
+
+        after = create_transaction()
+        await first.append(after)
+
+        assert await first.replay() == 2
+        assert written == [before.id, after.id]
+
+    async def test_replay_sealed_segment_of_other_spool(
+        self,
+        create_spool,
+        written,
+    ):
+        """Закрытый сегмент другого журнала записывается любым журналом."""
+
+        first, second = create_spool(), create_spool()
+        data = create_transaction()
+        await first.append(data)
+        await first.stop()
+
+        assert await second.replay() == 1
+        assert written == [data.id]
+
+    async def test_replay_dead_letters(self, create_spool, written, remembered):
+        """
+        Транзакции, которые не удается записать из-за ошибки целостности
+        или данных, переносятся в отдельный файл, а остальные записываются
+        и передаются в `on_created`.
+        """
+
+        spool = create_spool()
+        transactions = [
+            create_transaction(),
+            create_transaction(amount=-1),
+            create_transaction(amount=2**40),
+            create_transaction(),
+        ]
+        for data in transactions:
+            await spool.append(data)
+
+        assert await spool.replay() == 2
+        assert written == [transactions[0].id, transactions[3].id]
+        assert remembered == written
+        assert spool.get_stats()["dead_letters_total"] == 2
+        assert spool.get_stats()["segments"] == 0
+
+    async def test_replay_keeps_segment_while_database_unavailable(
+        self,
+        create_spool,
+        written,
+        remembered,
+    ):
+        """Недоступность БД прерывает повторную запись, а сегмент остается."""
+
+        spool = create_spool()
+        data = create_transaction(amount=-2)
+        await spool.append(data)
+
+        with pytest.raises(OperationalError):
+            await spool.replay()
+
+        assert written == []
+        assert remembered == []
+        assert spool.get_stats()["segments"] == 1
+        assert spool.contains(data.id)